@@ -8,25 +8,33 @@ in the master template. It identifies files missing required sections or structu
 
 Usage:
     python check-template-compliance.py --docs-path PATH --template-path PATH --report-path PATH
+                                        [--shard i/N] [--json-output PATH]
 """
 
-import os
 import re
 import sys
+import time
 import argparse
 import logging
 from pathlib import Path
 
+# Shared documentation tooling lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from docs_shard import add_shard_argument, in_shard, write_shard_result
+from docs_walk import compile_globs, walk_files
+import markdown_tokens as mt
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Files to exclude from compliance checks
+# Files to exclude from compliance checks (globs relative to the docs root, see docs_walk.py)
 EXCLUDED_FILES = [
     "README.md",
     "NAVIGATION.md",
     "index.md",
 ]
+EXCLUDED_MATCHER = compile_globs(EXCLUDED_FILES)
 
 # Document types that should be strictly checked
 STRICT_CHECK_TYPES = [
@@ -54,11 +62,13 @@ def extract_document_type(frontmatter):
         return match.group(1)
     return None
 
+def extract_section_headings(content):
+    """Return the level 1-3 heading titles of a document (never lines inside code blocks)."""
+    return [title for level, title, _ in mt.iter_headings(mt.tokenize(content)) if level <= 3]
+
 def extract_template_sections(template_content):
     """Extract required section headers from the template."""
-    # Find all headers (# Header)
-    headers = re.findall(r'^#{1,3}\s+(.+?)$', template_content, re.MULTILINE)
-    return headers
+    return extract_section_headings(template_content)
 
 def check_file_compliance(file_path, template_sections):
     """Check if a file complies with the template structure."""
@@ -76,10 +86,11 @@ def check_file_compliance(file_path, template_sections):
         
         # Check for presence of required sections
         issues = []
+        headings = [heading.lower() for heading in extract_section_headings(content)]
         for section in template_sections:
             # Some flexibility in matching - normalized case and stripped punctuation
-            section_pattern = re.escape(section.lower().rstrip(':.?!'))
-            if not re.search(rf'^#{1,3}\s+{section_pattern}', content.lower(), re.MULTILINE):
+            section_prefix = section.lower().rstrip(':.?!')
+            if not any(heading.startswith(section_prefix) for heading in headings):
                 issues.append(f"Missing required section: {section}")
         
         # Return results
@@ -123,6 +134,8 @@ def main():
     parser.add_argument('--docs-path', required=True, help='Path to documentation directory')
     parser.add_argument('--template-path', required=True, help='Path to template file')
     parser.add_argument('--report-path', required=True, help='Path to save the report')
+    parser.add_argument('--json-output', help='Path to save raw results for merging shards')
+    add_shard_argument(parser)
     args = parser.parse_args()
     
     docs_path = Path(args.docs_path)
@@ -139,6 +152,7 @@ def main():
         return 1
     
     # Read template content
+    start = time.perf_counter()
     with open(template_path, 'r', encoding='utf-8') as f:
         template_content = f.read()
     
@@ -148,15 +162,17 @@ def main():
     
     # Check compliance for all Markdown files
     results = []
-    for root, _, files in os.walk(docs_path):
-        for file in files:
-            if file.endswith('.md') and file not in EXCLUDED_FILES:
-                file_path = os.path.join(root, file)
-                compliant, message = check_file_compliance(file_path, template_sections)
-                results.append((file_path, compliant, message))
+    for rel_path, entry in walk_files(docs_path, include=('*.md',), exclude=EXCLUDED_FILES):
+        if not in_shard(rel_path, args.shard):
+            continue
+        compliant, message = check_file_compliance(entry.path, template_sections)
+        results.append((entry.path, compliant, message))
     
     # Generate report
+    duration = time.perf_counter() - start
     generate_report(results, report_path)
+    if args.json_output:
+        write_shard_result(args.json_output, 'template', results, len(results), args.shard, duration)
     
     # Count non-compliant files
     non_compliant = sum(1 for _, compliant, _ in results if not compliant)
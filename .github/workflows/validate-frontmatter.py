@@ -7,17 +7,21 @@ It reports validation errors and generates a markdown report of the results.
 
 Usage:
     python validate-frontmatter.py [--docs-path PATH] [--schema-path PATH] [--report-path PATH]
+                                   [--shard i/N] [--json-output PATH]
 
 Arguments:
     --docs-path     Path to documentation directory (default: src/vv.Domain/Docs)
     --schema-path   Path to JSON schema file (default: .github/workflows/frontmatter-schema.json)
     --report-path   Path to save the validation report (default: frontmatter-validation-report.md)
+    --shard         Only validate files in shard i of N (see scripts/docs_shard.py)
+    --json-output   Save raw results for merging with other shards
 """
 
 import os
 import re
 import sys
 import json
+import time
 import yaml
 import argparse
 import logging
@@ -25,17 +29,29 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('frontmatter-validation.log')
-    ]
-)
+# Shared documentation tooling lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from docs_shard import add_shard_argument, in_shard, write_shard_result
+from docs_walk import walk_files
+
 logger = logging.getLogger(__name__)
 
+def configure_logging() -> None:
+    """
+    Configure console and file logging for command-line runs.
+
+    Kept out of module import so other tools can reuse the validator
+    without creating a log file as a side effect.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('frontmatter-validation.log')
+        ]
+    )
+
 # Regular expression to extract YAML frontmatter
 FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
 
@@ -173,7 +189,8 @@ class FrontmatterValidator:
         except IOError as e:
             return False, [f"Error reading file: {str(e)}"]
 
-def validate_docs(docs_path: str, schema_path: str, report_path: str) -> int:
+def validate_docs(docs_path: str, schema_path: str, report_path: str,
+                  shard: Optional[Tuple[int, int]] = None, json_output: Optional[str] = None) -> int:
     """
     Validate all markdown files in the documentation directory.
     
@@ -181,29 +198,26 @@ def validate_docs(docs_path: str, schema_path: str, report_path: str) -> int:
         docs_path: Path to the documentation directory
         schema_path: Path to the JSON schema file
         report_path: Path to save the validation report
+        shard: Optional (index, count) to validate only one shard of the files
+        json_output: Optional path to save raw results for merging shards
         
     Returns:
         Exit code (0 for success, 1 for validation errors)
     """
     # Initialize validator
+    start = time.perf_counter()
     try:
         validator = FrontmatterValidator(schema_path)
     except Exception as e:
         logger.error(f"Failed to initialize validator: {str(e)}")
         return 1
     
-    # Find all markdown files
-    md_files = []
-    for root, _, files in os.walk(docs_path):
-        for filename in files:
-            if filename.lower().endswith('.md'):
-                md_files.append(os.path.join(root, filename))
-    
-    logger.info(f"Found {len(md_files)} markdown files to validate")
-    
-    # Validate each file
+    # Validate each markdown file as the walk finds it
     results = []
-    for file_path in md_files:
+    for walk_path, entry in walk_files(docs_path, include=('*.[mM][dD]',)):
+        if not in_shard(walk_path, shard):
+            continue
+        file_path = entry.path
         rel_path = os.path.relpath(file_path, os.path.dirname(docs_path))
         is_valid, errors = validator.validate_file(file_path)
         
@@ -218,8 +232,13 @@ def validate_docs(docs_path: str, schema_path: str, report_path: str) -> int:
         if not is_valid:
             logger.warning(f"Validation failed for {rel_path}: {', '.join(errors)}")
     
+    logger.info(f"Validated {len(results)} markdown files")
+    
     # Generate report
+    duration = time.perf_counter() - start
     generate_report(results, report_path)
+    if json_output:
+        write_shard_result(json_output, 'frontmatter', results, len(results), shard, duration)
     
     # Return exit code
     invalid_count = sum(1 for r in results if not r['is_valid'])
@@ -294,11 +313,15 @@ def main():
     """
     Main entry point for the script.
     """
+    configure_logging()
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Validate YAML frontmatter in markdown files.')
     parser.add_argument('--docs-path', default='src/vv.Domain/Docs', help='Path to documentation directory')
     parser.add_argument('--schema-path', default='.github/workflows/frontmatter-schema.json', help='Path to JSON schema file')
     parser.add_argument('--report-path', default='frontmatter-validation-report.md', help='Path to save the validation report')
+    parser.add_argument('--json-output', help='Path to save raw results for merging shards')
+    add_shard_argument(parser)
     args = parser.parse_args()
     
     # Validate paths
@@ -314,7 +337,7 @@ def main():
         return 1
     
     # Run validation
-    return validate_docs(str(docs_path), str(schema_path), args.report_path)
+    return validate_docs(str(docs_path), str(schema_path), args.report_path, args.shard, args.json_output)
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,118 +1,244 @@
 #!/usr/bin/env python3
 
+"""
+Frontmatter Autofixer for VeritasVault Documentation
+
+Adds missing YAML frontmatter to Markdown files and repairs numeric date
+fields. Document type and domains are inferred from the file path using the
+declarative rule tables below, compiled once into a single matcher. Each file
+is read once and files are processed across a worker pool; the fixed content
+is written by the main process through the journaled writer (file_writer.py).
+Dates come from each file's last content change in git (see doc_history.py),
+falling back to today for files that are not committed yet.
+
+Usage:
+    python add_frontmatter.py [--docs-path PATH] [--dry-run] [--workers N] [--resume]
+
+Arguments:
+    --docs-path     Path to documentation directory (default: src/vv.Domain/Docs)
+    --dry-run       Print a unified diff of the changes instead of writing them
+    --workers       Number of worker processes (default: CPU count)
+    --resume        Continue the journal of an interrupted run
+"""
+
 import os
 import re
-import yaml
+import sys
+import difflib
+import argparse
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 
-def add_frontmatter_to_file(filepath):
-    # Read file content
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+import yaml
+
+from docs_walk import walk_files
+from file_writer import FileWriter, add_writer_arguments, writer_from_args
+
+# Path -> document_type rules, checked in order; the first rule whose terms all
+# appear in the lower-cased path wins.
+DOCUMENT_TYPE_RULES = [
+    (('architecture',), 'architecture'),
+    (('overview',), 'domain-overview'),
+    (('spec',), 'specification'),  # also covers 'specification'
+    (('runbook',), 'runbook'),
+    (('guide',), 'guide'),
+    (('policy',), 'policy'),
+    (('api', 'standard'), 'api-standards'),
+    (('settlement', 'protocol'), 'settlement-protocol'),
+    (('portfolio', 'optimization'), 'portfolio-optimization-guide'),
+    (('audit', 'system'), 'audit-system-design'),
+]
+DEFAULT_DOCUMENT_TYPE = 'guide'
+
+# Path components that map to an applies_to domain
+DOMAIN_NAMES = ('Asset', 'Risk', 'Security', 'Governance', 'AI', 'Crosscutting', 'ExternalInterface')
+DEFAULT_DOMAINS = ['Core']
+
+# Reviewers assigned to generated frontmatter (also used by the migrations and generated pages)
+DEFAULT_REVIEWERS = ['@tech-lead']
+
+DATE_FIELD_PATTERN = re.compile(r'^(last_updated|next_review):\s+\d+.*$', re.MULTILINE)
+
+def compile_rules(rules):
+    """
+    Compile an ordered rule table into one regex.
+
+    Each rule becomes a named alternative made of lookaheads (one per term), so a
+    single match call finds the first rule whose terms all occur in the path.
+    """
+    alternatives = []
+    for index, (terms, _) in enumerate(rules):
+        lookaheads = ''.join(f'(?=.*{re.escape(term)})' for term in terms)
+        alternatives.append(f'(?P<r{index}>{lookaheads})')
+    return re.compile('^(?:' + '|'.join(alternatives) + ')', re.DOTALL)
+
+DOCUMENT_TYPE_MATCHER = compile_rules(DOCUMENT_TYPE_RULES)
+
+def infer_document_type(filepath):
+    """Return the document_type for a path according to DOCUMENT_TYPE_RULES."""
+    match = DOCUMENT_TYPE_MATCHER.match(filepath.lower())
+    if match is None:
+        return DEFAULT_DOCUMENT_TYPE
+    return DOCUMENT_TYPE_RULES[int(match.lastgroup[1:])][1]
+
+def infer_domains(filepath):
+    """Return the applies_to domains named by the path components."""
+    parts = filepath.replace(os.sep, '/').split('/')
+    domains = [part for part in parts if part in DOMAIN_NAMES]
+    return domains or list(DEFAULT_DOMAINS)
+
+def build_frontmatter(filepath, today):
+    """Build default frontmatter for a file that has none."""
+    return {
+        'document_type': infer_document_type(filepath),
+        'classification': 'internal',
+        'status': 'draft',
+        'version': '0.1.0',
+        'last_updated': today.strftime('%Y-%m-%d'),
+        'applies_to': infer_domains(filepath),
+        'reviewers': list(DEFAULT_REVIEWERS),
+        'priority': 'p2',
+        'next_review': (today + timedelta(days=365)).strftime('%Y-%m-%d'),
+    }
+
+def fix_content(filepath, content, today):
+    """
+    Return (new_content, message) for a file, or (content, None) if nothing needs fixing.
+    """
     # Check if frontmatter exists
     if not content.startswith('---'):
-        # Generate filename-based title
-        base_filename = os.path.basename(filepath)
-        title = os.path.splitext(base_filename)[0].replace('-', ' ').replace('_', ' ').title()
-        
-        # Determine document type based on path
-        path = filepath.lower()
-        if 'architecture' in path:
-            doc_type = 'architecture'
-        elif 'overview' in path:
-            doc_type = 'domain-overview'
-        elif 'specification' in path or 'spec' in path:
-            doc_type = 'specification'
-        elif 'runbook' in path:
-            doc_type = 'runbook'
-        elif 'guide' in path:
-            doc_type = 'guide'
-        elif 'policy' in path:
-            doc_type = 'policy'
-        elif 'api' in path and 'standard' in path:
-            doc_type = 'api-standards'
-        elif 'settlement' in path and 'protocol' in path:
-            doc_type = 'settlement-protocol'
-        elif 'portfolio' in path and 'optimization' in path:
-            doc_type = 'portfolio-optimization-guide'
-        elif 'audit' in path and 'system' in path:
-            doc_type = 'audit-system-design'
-        else:
-            doc_type = 'guide'  # Default
-        
-        # Determine domain from path
-        path_parts = filepath.split('/')
-        domains = []
-        for part in path_parts:
-            if part in ['Asset', 'Risk', 'Security', 'Governance', 'AI', 'Crosscutting', 'ExternalInterface']:
-                domains.append(part)
-        
-        if not domains:
-            domains = ['Core']  # Default
-        
-        # Create frontmatter
-        today = datetime.now().strftime('%Y-%m-%d')
-        next_year = (datetime.now() + timedelta(days=365)).strftime('%Y-%m-%d')
-        
-        frontmatter = {
-            'document_type': doc_type,
-            'classification': 'internal',
-            'status': 'draft',
-            'version': '0.1.0',
-            'last_updated': today,
-            'applies_to': domains,
-            'reviewers': ['@tech-lead'],
-            'priority': 'p2',
-            'next_review': next_year
+        yaml_content = yaml.dump(build_frontmatter(filepath, today), default_flow_style=False, sort_keys=False)
+        return f"---\n{yaml_content}---\n\n{content}", f"Added frontmatter to {filepath}"
+
+    # Frontmatter with numeric dates (reported by the validator): quote proper dates instead
+    if "---" in content[:100] and re.search(r"last_updated: \d+", content[:500]):
+        replacements = {
+            'last_updated': today.strftime('%Y-%m-%d'),
+            'next_review': (today + timedelta(days=365)).strftime('%Y-%m-%d'),
         }
-        
-        # Convert to YAML and add to file
-        yaml_content = yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)
-        new_content = f"---\n{yaml_content}---\n\n{content}"
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
-        print(f"Added frontmatter to {filepath}")
-        return True
-    
-    # Check if the file has frontmatter but with errors (mentioned in the validation output)
-    elif "---" in content[:100] and re.search(r"last_updated: \d+", content[:500]):
-        # Fix date format issues
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        for i, line in enumerate(lines):
-            # Convert date fields from numbers to strings in quotes
-            if re.match(r'(last_updated|next_review):\s+\d+', line):
-                field = line.split(':')[0].strip()
-                if field == 'last_updated':
-                    lines[i] = f'{field}: "{datetime.now().strftime("%Y-%m-%d")}"\n'
-                elif field == 'next_review':
-                    next_year = (datetime.now() + timedelta(days=365)).strftime('%Y-%m-%d')
-                    lines[i] = f'{field}: "{next_year}"\n'
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        
-        print(f"Fixed date format in frontmatter for {filepath}")
-        return True
-    
-    return False
-
-def process_directory(directory):
+        # Only rewrite the header, never date-like lines in the document body
+        end = content.find('\n---', 3)
+        end = len(content) if end == -1 else end
+        header = DATE_FIELD_PATTERN.sub(
+            lambda m: f'{m.group(1)}: "{replacements[m.group(1)]}"', content[:end])
+        if header != content[:end]:
+            return header + content[end:], f"Fixed date format in frontmatter for {filepath}"
+
+    return content, None
+
+def fix_file(filepath, today, dry_run=False):
+    """
+    Fix one file in memory, reading it exactly once.
+
+    Returns a dict with 'path', 'changed', 'message', 'content' (the fixed text,
+    when changed) and, in dry-run mode, 'diff'.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    new_content, message = fix_content(filepath, content, today)
+    result = {'path': filepath, 'changed': new_content != content, 'message': message, 'diff': '', 'content': None}
+    if not result['changed']:
+        return result
+
+    if dry_run:
+        result['diff'] = ''.join(difflib.unified_diff(
+            content.splitlines(keepends=True), new_content.splitlines(keepends=True),
+            fromfile=f"a/{filepath}", tofile=f"b/{filepath}"))
+    else:
+        result['content'] = new_content
+    return result
+
+def add_frontmatter_to_file(filepath, today=None, dry_run=False, writer=None):
+    """
+    Fix one file and write it through writer (an unjournaled FileWriter if None).
+
+    Returns the result dict of fix_file.
+    """
+    result = fix_file(filepath, today or datetime.now(), dry_run)
+    if result['content'] is not None:
+        if writer is None:
+            with FileWriter('add_frontmatter', journal_dir=None) as writer:
+                writer.write(filepath, result['content'])
+        else:
+            writer.write(filepath, result['content'])
+    return result
+
+def _fix_file_task(args):
+    """Worker entry point (module-level so it can be pickled)."""
+    filepath, today, dry_run = args
+    try:
+        return fix_file(filepath, today, dry_run)
+    except (IOError, UnicodeDecodeError) as e:
+        return {'path': filepath, 'changed': False, 'message': f"Error processing {filepath}: {str(e)}",
+                'diff': '', 'content': None}
+
+def find_markdown_files(directory):
+    """Return all Markdown files under directory, sorted for stable output."""
+    return [entry.path for _, entry in walk_files(directory, include=('*.md',))]
+
+def process_directory(directory, dry_run=False, workers=None, writer=None):
+    """
+    Fix every Markdown file under directory in parallel; returns the number of files updated.
+
+    Workers only compute the fixed content; writes go through writer in the main
+    process, so they are batched and journaled in one place.
+    """
+    if writer is None and not dry_run:
+        with FileWriter('add_frontmatter', journal_dir=None) as writer:
+            return process_directory(directory, dry_run, workers, writer)
+
+    # Date headers by the file's last content change in git, not by when this runs
+    from doc_history import last_change_dates
+    history = last_change_dates(directory)
+    today = datetime.now()
+
+    files = find_markdown_files(directory)
+    if writer is not None:
+        # Files finished by the interrupted run being resumed need no second look
+        files = [filepath for filepath in files if not writer.is_done(filepath)]
+    tasks = []
+    for filepath in files:
+        changed = history.get(os.path.realpath(filepath))
+        tasks.append((filepath, datetime.strptime(changed, '%Y-%m-%d') if changed else today, dry_run))
+
     files_updated = 0
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.md'):
-                filepath = os.path.join(root, file)
-                if add_frontmatter_to_file(filepath):
-                    files_updated += 1
-    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() preserves input order, so output is deterministic across runs
+        for result in executor.map(_fix_file_task, tasks, chunksize=16):
+            if result['diff']:
+                sys.stdout.write(result['diff'])
+            if result['message']:
+                prefix = "[DRY RUN] " if dry_run and result['changed'] else ""
+                print(f"{prefix}{result['message']}")
+            if result['content'] is not None:
+                writer.write(result['path'], result['content'])
+            if result['changed']:
+                files_updated += 1
+
     return files_updated
 
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Add or repair YAML frontmatter in documentation files.')
+    parser.add_argument('--docs-path', default='src/vv.Domain/Docs', help='Path to documentation directory')
+    parser.add_argument('--dry-run', action='store_true', help='Show a diff of the changes without writing them')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes')
+    add_writer_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.docs_path):
+        print(f"Documentation directory not found: {args.docs_path}")
+        return 1
+
+    if args.dry_run:
+        count = process_directory(args.docs_path, True, args.workers)
+    else:
+        with writer_from_args('add_frontmatter', args) as writer:
+            count = process_directory(args.docs_path, False, args.workers, writer)
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"{verb} {count} files with missing or incorrect frontmatter")
+    return 0
+
 if __name__ == "__main__":
-    docs_dir = "src/vv.Domain/Docs"
-    count = process_directory(docs_dir)
-    print(f"Updated {count} files with missing or incorrect frontmatter")
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+
+"""
+API Route Check for VeritasVault Documentation
+
+The API docs and the .http request samples describe endpoints that have to
+match the OpenAPI document of the Functions app (src/vv.Functions/openapi.json).
+This check loads the OpenAPI document once into a trie of path segments, in
+which static segments are matched before {parameter} segments. Every route
+reference then resolves in one step per path segment.
+
+Route references are taken from:
+
+- "METHOD /path" request lines in the docs (prose, code spans and code blocks)
+  and in .http files (including "POST {{host}}/api/..."), and
+- backticked paths and URLs in the docs. Paths given as an example of a
+  convention ("e.g.", "for example") are left alone.
+
+Only paths under the spec's route prefix (/api, or --prefix) are checked;
+other paths belong to the designs of other services.
+
+Reported are:
+
+- routes, or methods of a route, that are not in the spec,
+- query parameters that the operation does not define (compared
+  case-insensitively, as the Functions host does), and path parameters named
+  differently from the spec,
+- operations that no doc or request sample mentions (undocumented), and
+  query parameters of referenced operations that none of the referencing
+  files mention (in the reference itself or a code span).
+
+Usage:
+    python api_routes.py [--docs-path PATH] [--spec PATH] [--http-path PATH] [--prefix /api] [--json-output PATH]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import logging
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl
+
+from docs_common import DEFAULT_DOCS_PATH, REPO_ROOT, iter_markdown_files
+from docs_walk import DEFAULT_EXCLUDED_DIRS, walk_files
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPEC_PATH = str(REPO_ROOT / 'src' / 'vv.Functions' / 'openapi.json')
+DEFAULT_HTTP_PATH = str(REPO_ROOT / 'src')
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+EXCLUDED_DIRS = DEFAULT_EXCLUDED_DIRS | {'bin', 'obj'}
+
+METHOD_ROUTE_PATTERN = re.compile(
+    r'\b(GET|PUT|POST|DELETE|OPTIONS|HEAD|PATCH|TRACE)\s+(?:https?://[^/\s`"\']+|\{\{\w+\}\})?(/[^\s`"\'<>|]*)')
+URL_PATTERN = re.compile(r'^(?:https?://[^/\s]+|\{\{\w+\}\})?(/[^\s]*)$')
+EXAMPLE_PATTERN = re.compile(r'\be\.g\.|\bfor example\b|\bsuch as\b', re.IGNORECASE)
+PARAMETER_SEGMENT = re.compile(r'^\{([^{}]+)\}$')
+
+# Finding kinds
+UNKNOWN_ROUTE = 'unknown-route'
+UNKNOWN_METHOD = 'unknown-method'
+UNKNOWN_PARAMETER = 'unknown-parameter'
+PARAMETER_NAME = 'parameter-name'
+UNDOCUMENTED_ROUTE = 'undocumented-route'
+UNDOCUMENTED_PARAMETER = 'undocumented-parameter'
+
+class RouteNode:
+    """One path segment of the route trie."""
+
+    __slots__ = ('children', 'parameter', 'parameter_name', 'template', 'operations')
+
+    def __init__(self):
+        self.children = {}          # case-folded static segment -> RouteNode
+        self.parameter = None       # RouteNode for a {parameter} segment
+        self.parameter_name = None
+        self.template = None        # spec path of the route ending here
+        self.operations = {}        # METHOD -> {case-folded query parameter: name}
+
+class RouteTrie:
+    """Path templates of an OpenAPI document, matched segment by segment."""
+
+    def __init__(self):
+        self.root = RouteNode()
+        self.prefix = ''
+
+    @classmethod
+    def from_spec(cls, spec):
+        trie = cls()
+        base_path = spec.get('basePath', '')  # Swagger 2.0
+        servers = spec.get('servers') or []
+        if servers:
+            base_path = urlsplit(servers[0].get('url', '')).path
+        base_path = base_path.rstrip('/')
+        components = spec.get('components', {}).get('parameters', {})
+        for path, item in spec.get('paths', {}).items():
+            shared = [resolve_parameter(parameter, components) for parameter in item.get('parameters', [])]
+            for method in HTTP_METHODS:
+                operation = item.get(method)
+                if operation is None:
+                    continue
+                parameters = shared + [resolve_parameter(parameter, components)
+                                       for parameter in operation.get('parameters', [])]
+                trie.insert(base_path + path, method.upper(), parameters)
+        templates = [segments(template) for template in trie.templates()]
+        common = templates[0] if templates else []
+        for other in templates[1:]:
+            length = 0
+            while length < min(len(common), len(other)) and common[length].casefold() == other[length].casefold():
+                length += 1
+            common = common[:length]
+        static = []
+        for segment in common:
+            if PARAMETER_SEGMENT.match(segment):
+                break
+            static.append(segment)
+        # A single route would make its whole path the prefix; keep only its first segment then
+        trie.prefix = '/' + '/'.join(static[:1] if len(templates) == 1 else static)
+        return trie
+
+    def insert(self, template, method, parameters):
+        node = self.root
+        for segment in segments(template):
+            match = PARAMETER_SEGMENT.match(segment)
+            if match:
+                if node.parameter is None:
+                    node.parameter = RouteNode()
+                    node.parameter_name = match.group(1)
+                node = node.parameter
+            else:
+                node = node.children.setdefault(segment.casefold(), RouteNode())
+        node.template = template
+        node.operations[method] = {parameter['name'].casefold(): parameter['name']
+                                   for parameter in parameters if parameter.get('in') == 'query'}
+
+    def match(self, path_segments, node=None, position=0, names=None):
+        """Return (node, [(doc segment, spec parameter name)]) for a path, or (None, None)."""
+        node = node or self.root
+        names = names if names is not None else []
+        if position == len(path_segments):
+            return (node, names) if node.template is not None else (None, None)
+        segment = path_segments[position]
+        child = node.children.get(segment.casefold())
+        if child is not None:
+            found = self.match(path_segments, child, position + 1, names)
+            if found[0] is not None:
+                return found
+        if node.parameter is not None:
+            found = self.match(path_segments, node.parameter, position + 1,
+                               names + [(segment, node.parameter_name)])
+            if found[0] is not None:
+                return found
+        return None, None
+
+    def templates(self):
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.template is not None:
+                yield node.template
+            stack.extend(node.children.values())
+            if node.parameter is not None:
+                stack.append(node.parameter)
+
+    def operations(self):
+        """Yield (template, METHOD, operation) for every operation in the spec."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for method, operation in node.operations.items():
+                yield node.template, method, operation
+            stack.extend(node.children.values())
+            if node.parameter is not None:
+                stack.append(node.parameter)
+
+def resolve_parameter(parameter, components):
+    """Follow a local '#/components/parameters/...' reference."""
+    reference = parameter.get('$ref', '')
+    if reference.startswith('#/components/parameters/'):
+        return components.get(reference.rsplit('/', 1)[-1], {})
+    return parameter
+
+def segments(path):
+    return [segment for segment in path.strip('/').split('/') if segment]
+
+def load_spec(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return RouteTrie.from_spec(json.load(f))
+
+def iter_route_references(lines, markdown=True):
+    """
+    Yield (line number, METHOD or None, url, code spans) for the route references in
+    a document; lines are (line number, text, is code) and code spans come per line.
+    """
+    for number, text, is_code, spans in lines:
+        found = set()
+        for match in METHOD_ROUTE_PATTERN.finditer(text):
+            found.add(match.group(2))
+            yield number, match.group(1), match.group(2), spans
+        if not markdown or is_code:
+            continue
+        if EXAMPLE_PATTERN.search(text):
+            continue
+        for span in spans:
+            match = URL_PATTERN.match(span.strip())
+            if match and not any(match.group(1) in url for url in found):
+                yield number, None, match.group(1), spans
+
+def markdown_lines(content):
+    """(line number, text, is code, code spans) for every line of a Markdown document."""
+    tokens = mt.tokenize(content)
+    spans = {}
+    for line, code in mt.iter_code_spans(tokens):
+        spans.setdefault(line, []).append(code)
+    for token in tokens:
+        if token.kind in (mt.FRONTMATTER, mt.BLANK):
+            continue
+        is_code = token.kind in (mt.CODE, mt.INDENTED_CODE)
+        yield token.line, token.text, is_code, spans.get(token.line, [])
+
+def http_lines(content):
+    """(line number, text, is code, code spans) for the request lines of a .http file."""
+    for number, _, text in mt.split_lines(content.lstrip('﻿')):
+        stripped = text.strip()
+        if stripped and not stripped.startswith(('#', '//', '@')):
+            yield number, stripped, True, []
+
+def iter_http_files(http_path):
+    for _, entry in walk_files(http_path, include=('*.http', '*.rest'), excluded_dirs=EXCLUDED_DIRS):
+        yield entry.path
+
+def check_reference(trie, method, url):
+    """Return (node, [issues]) for one route reference; node is None for unknown routes."""
+    parts = urlsplit(url)
+    path = parts.path
+    path_segments = segments(path)
+    node, names = trie.match(path_segments)
+    if node is None:
+        return None, [(UNKNOWN_ROUTE, f"{path} is not a route in the spec")]
+    issues = []
+    if method is not None and method not in node.operations:
+        methods = ', '.join(sorted(node.operations))
+        return node, [(UNKNOWN_METHOD, f"{method} is not defined for {node.template} (spec: {methods})")]
+    operations = [node.operations[method]] if method is not None else list(node.operations.values())
+    for doc_segment, spec_name in names:
+        match = PARAMETER_SEGMENT.match(doc_segment)
+        if match and match.group(1) != spec_name:
+            issues.append((PARAMETER_NAME, f"path parameter {{{match.group(1)}}} is {{{spec_name}}} in the spec"))
+    for name, _ in parse_qsl(parts.query, keep_blank_values=True):
+        if not any(name.casefold() in operation for operation in operations):
+            issues.append((UNKNOWN_PARAMETER, f"{name} is not a query parameter of {node.template}"))
+    return node, issues
+
+def check_routes(trie, docs_path, http_path=None, prefix=None):
+    """
+    Check the route references of the docs and .http files against the trie.
+
+    Returns [{'file', 'line', 'method', 'route', 'kind', 'message'}]; undocumented
+    operations and parameters carry the spec path in 'file' and line 0.
+    """
+    prefix = (prefix if prefix is not None else trie.prefix).rstrip('/')
+    folded_prefix = prefix.casefold()
+    sources = []
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        with open(full_path, 'r', encoding='utf-8') as f:
+            sources.append((rel_path, markdown_lines(f.read()), True))
+    if http_path:
+        for full_path in iter_http_files(http_path):
+            with open(full_path, 'r', encoding='utf-8') as f:
+                sources.append((os.path.relpath(full_path, REPO_ROOT).replace(os.sep, '/'),
+                                http_lines(f.read()), False))
+
+    findings = []
+    referenced = {}  # (template, METHOD) -> set of names mentioned by the referencing files
+    for rel_path, lines, markdown in sources:
+        lines = list(lines)
+        mentioned = set()
+        for _, text, _, spans in lines:
+            mentioned.update(span.strip().casefold() for span in spans)
+        file_operations = []
+        for number, method, url, _ in iter_route_references(lines, markdown):
+            path = urlsplit(url).path
+            if '...' in path or not (path.casefold() + '/').startswith(folded_prefix + '/'):
+                continue
+            if any('{' in segment and not PARAMETER_SEGMENT.match(segment) for segment in segments(path)):
+                continue  # a URI scheme pattern such as /api/v{MAJOR}
+            node, issues = check_reference(trie, method, url)
+            for kind, message in issues:
+                findings.append({'file': rel_path, 'line': number, 'method': method, 'route': url,
+                                 'kind': kind, 'message': message})
+            if node is None:
+                continue
+            methods = [method] if method in node.operations else list(node.operations)
+            for name, _ in parse_qsl(urlsplit(url).query, keep_blank_values=True):
+                mentioned.add(name.casefold())
+            file_operations.extend((node.template, name) for name in methods)
+        for operation in file_operations:
+            referenced.setdefault(operation, set()).update(mentioned)
+
+    for template, method, operation in sorted(trie.operations()):
+        names = referenced.get((template, method))
+        if names is None:
+            findings.append({'file': None, 'line': 0, 'method': method, 'route': template,
+                             'kind': UNDOCUMENTED_ROUTE, 'message': f"{method} {template} is not documented"})
+            continue
+        for folded, name in sorted(operation.items()):
+            if folded not in names:
+                findings.append({'file': None, 'line': 0, 'method': method, 'route': template,
+                                 'kind': UNDOCUMENTED_PARAMETER,
+                                 'message': f"parameter {name} of {method} {template} is not documented"})
+    return findings
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Check documented API routes against the OpenAPI spec.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--spec', default=DEFAULT_SPEC_PATH, help='OpenAPI document (JSON)')
+    parser.add_argument('--http-path', default=DEFAULT_HTTP_PATH,
+                        help='Directory searched for .http request samples ("" to skip them)')
+    parser.add_argument('--prefix', help='Only check paths under this prefix (default: common prefix of the spec)')
+    parser.add_argument('--json-output', help='Write the findings as JSON to this file')
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+    try:
+        trie = load_spec(args.spec)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Could not load OpenAPI document {args.spec}: {str(e)}")
+        return 1
+
+    findings = check_routes(trie, docs_path, args.http_path or None, args.prefix)
+    for finding in findings:
+        location = f"{finding['file']}:{finding['line']}: " if finding['file'] else f"{args.spec}: "
+        logger.warning(f"{location}{finding['message']}")
+
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump(findings, f, indent=2)
+
+    operations = sum(1 for _ in trie.operations())
+    logger.info(f"Checked documented routes against {operations} operations under "
+                f"{args.prefix or trie.prefix}: {len(findings)} issues")
+    return 1 if findings else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
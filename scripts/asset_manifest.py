@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+"""
+Asset Manifest for VeritasVault Documentation
+
+Images, diagrams and other non-Markdown files under the docs tree are indexed
+in a manifest with their size and content hash. The manifest
+(.docs-cache/assets.json) is updated incrementally: a file is only hashed
+again when its size or mtime changed. The files come from the same single
+walk that lists the Markdown documents (docs_common.list_docs_files).
+
+Against the manifest the tool reports:
+
+- links and images whose target asset does not exist (with the
+  .placeholder.txt note generate_placeholders.py left for it, if any),
+- byte-identical duplicates (same size and hash) that could share one file,
+- assets that no document references.
+
+The link checker (fix_broken_links.py) resolves links to assets from the same
+walk, and sharded runs take the asset list from the shared manifest
+(docs_shard.py).
+
+Usage:
+    python asset_manifest.py [--docs-path PATH] [--manifest PATH] [--cache-dir PATH] [--json-output PATH]
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+from collections import defaultdict
+from pathlib import Path
+
+from docs_common import DEFAULT_DOCS_PATH, atomic_write_json, list_docs_files, refresh_entries
+from doc_cache import ParsedDocumentCache, load_document
+from fix_broken_links import extract_links, resolve_relative_path
+from generate_placeholders import IMAGE_PLACEHOLDER_SUFFIX
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_PATH = '.docs-cache/assets.json'
+MANIFEST_VERSION = 1
+
+class AssetManifest:
+    """Size, mtime and content hash of every non-Markdown file under the docs tree."""
+
+    def __init__(self):
+        self.entries = {}  # relative path -> [size, mtime_ns, hash]
+
+    @classmethod
+    def load(cls, path):
+        manifest = cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return manifest
+        if payload.get('version') == MANIFEST_VERSION:
+            manifest.entries = payload['assets']
+        return manifest
+
+    def save(self, path):
+        atomic_write_json(path, {'version': MANIFEST_VERSION, 'assets': self.entries}, sort_keys=True)
+
+    def update(self, files):
+        """Bring the manifest up to date with [(relative path, os.DirEntry)]; returns (hashed, reused)."""
+        self.entries, hashed, reused = refresh_entries(files, self.entries, lambda data: [])
+        return hashed, reused
+
+    def duplicates(self):
+        """Groups of byte-identical assets, largest waste first."""
+        groups = defaultdict(list)
+        for rel_path, (size, _, key) in self.entries.items():
+            groups[(size, key)].append(rel_path)
+        duplicates = [sorted(paths) for paths in groups.values() if len(paths) > 1]
+        return sorted(duplicates, key=lambda paths: (-self.entries[paths[0]][0] * (len(paths) - 1), paths[0]))
+
+def check_assets(docs_path, manifest, markdown_files, cache=None):
+    """
+    Check the asset links of every document against the manifest.
+
+    Returns (broken links, {asset: number of references}); broken links are
+    {'source_file', 'line', 'link_text', 'link_url', 'target', 'placeholder'}.
+    """
+    broken = []
+    references = defaultdict(int)
+    markdown = {rel_path for rel_path, _ in markdown_files}
+    for rel_path, entry in markdown_files:
+        document = load_document(entry.path, cache)
+        for link in extract_links(rel_path, document):
+            if not link.base_url:
+                continue
+            target = resolve_relative_path(rel_path, link.base_url.split('?', 1)[0]).replace(os.sep, '/')
+            if target in markdown or target.endswith('.md'):
+                continue  # documents are the link checker's job
+            if target in manifest.entries:
+                references[target] += 1
+                continue
+            placeholder = target + IMAGE_PLACEHOLDER_SUFFIX
+            broken.append({'source_file': rel_path, 'line': link.line, 'link_text': link.text,
+                           'link_url': link.url, 'target': target,
+                           'placeholder': placeholder if placeholder in manifest.entries else None})
+            if placeholder in manifest.entries:
+                references[placeholder] += 1
+    return broken, dict(references)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Index docs assets and check asset links.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST_PATH, help='Asset manifest file')
+    parser.add_argument('--cache-dir', help='Use the parsed-document cache in this directory (see doc_cache.py)')
+    parser.add_argument('--json-output', help='Write broken links, duplicates and unreferenced assets as JSON')
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+
+    markdown_files, other_files = list_docs_files(docs_path)
+    manifest = AssetManifest.load(args.manifest)
+    hashed, reused = manifest.update(other_files)
+    manifest.save(args.manifest)
+    logger.info(f"Indexed {len(manifest.entries)} assets ({hashed} hashed, {reused} unchanged)")
+
+    cache = ParsedDocumentCache(args.cache_dir) if args.cache_dir else None
+    broken, references = check_assets(docs_path, manifest, markdown_files, cache)
+    if cache is not None:
+        cache.close()
+    duplicates = manifest.duplicates()
+    unreferenced = sorted(rel_path for rel_path in manifest.entries
+                          if rel_path not in references and not os.path.basename(rel_path).startswith('.'))
+
+    for link in broken:
+        note = f" (placeholder: {link['placeholder']})" if link['placeholder'] else ''
+        logger.warning(f"{link['source_file']}:{link['line']}: missing asset {link['target']}{note}")
+    for paths in duplicates:
+        logger.warning(f"Identical assets ({manifest.entries[paths[0]][0]} bytes each): {', '.join(paths)}")
+    for rel_path in unreferenced:
+        logger.info(f"Unreferenced asset: {rel_path}")
+
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump({'broken_links': broken, 'duplicates': duplicates, 'unreferenced': unreferenced,
+                       'references': references}, f, indent=2)
+
+    logger.info(f"Found {len(broken)} missing assets, {len(duplicates)} duplicate groups "
+                f"and {len(unreferenced)} unreferenced assets")
+    return 1 if broken else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+
+"""
+C# Symbol Index and Code Reference Check for VeritasVault Documentation
+
+Specifications and domain docs name types and members of the C# code base in
+backticks (`BaseRepository`, `FxSpotPriceRate.FromEntity()`,
+`vv.Domain.Models`). This tool indexes the namespaces, types (classes,
+records, structs, interfaces, enums) and public members of every .cs file
+under the source tree. It uses a small lexer (comments and string literals
+are blanked out) and a brace-level scan, not a compiler, and checks the
+docs' code references against that index.
+
+The index is cached in .docs-cache/code-symbols.json. A file is only lexed
+again when its size or mtime changed and its content hash differs, so runs
+after code changes only reindex the changed files. When a symbol disappears
+between two runs it is remembered as removed, so docs that still mention a
+renamed or deleted symbol are reported even though the name is no longer in
+the code.
+
+A backticked reference is reported as stale when:
+
+- it names a symbol that was removed from the code (with the closest current
+  name as a likely rename),
+- it names a member that does not exist on an indexed type (members inherited
+  from indexed base types count), or
+- it is qualified with a vv.* namespace that has no such namespace or type.
+
+Other names that are not in the code are treated as design vocabulary (many
+docs describe planned components) and are only listed with --strict.
+
+Usage:
+    python code_symbols.py [--docs-path PATH] [--src-path PATH] [--cache PATH] [--strict] [--json-output PATH]
+    python code_symbols.py --list-symbols
+"""
+
+import os
+import re
+import sys
+import json
+import bisect
+import difflib
+import argparse
+import logging
+from datetime import date
+from pathlib import Path
+
+from docs_common import DEFAULT_DOCS_PATH, REPO_ROOT, atomic_write_json, iter_markdown_files, refresh_entries
+from docs_walk import DEFAULT_EXCLUDED_DIRS, walk_files
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_SRC_PATH = str(REPO_ROOT / 'src')
+DEFAULT_CACHE_PATH = '.docs-cache/code-symbols.json'
+# Bump when the indexed representation changes so cached entries are rebuilt
+INDEX_VERSION = 2
+EXCLUDED_DIRS = DEFAULT_EXCLUDED_DIRS | {'bin', 'obj', 'Docs'}
+
+# Comments, string and character literals and preprocessor lines, blanked out before tokenizing
+LEXICAL_PATTERN = re.compile(r'''
+      //[^\n]*
+    | /\*.*?\*/
+    | \$?"""[\s\S]*?"""
+    | (?:@\$?|\$@)"(?:[^"]|"")*"
+    | \$?"(?:[^"\\\n]|\\.)*"
+    | '(?:[^'\\\n]|\\.)+'
+    | ^[ \t]*\#[^\n]*
+''', re.S | re.M | re.X)
+TOKEN_PATTERN = re.compile(r'@?[A-Za-z_]\w*|=>|\S')
+IDENTIFIER_PATTERN = re.compile(r'^@?[A-Za-z_]\w*$')
+
+TYPE_KEYWORDS = {'class', 'struct', 'interface', 'enum', 'record'}
+MODIFIERS = {'public', 'private', 'protected', 'internal', 'static', 'abstract', 'sealed', 'virtual',
+             'override', 'readonly', 'const', 'async', 'extern', 'new', 'partial', 'unsafe', 'volatile',
+             'required', 'file', 'event', 'implicit', 'explicit', 'ref'}
+VISIBLE_MODIFIERS = {'public', 'protected'}
+BOUNDARIES = {'(', '{', '=', ';', '=>'}
+# Members every type has
+OBJECT_MEMBERS = {'ToString', 'Equals', 'GetHashCode', 'GetType'}
+
+# Backticked text that looks like a code reference: dotted identifiers with optional
+# generic arguments and call parentheses
+REFERENCE_PATTERN = re.compile(r'^(?:global::)?[A-Za-z_]\w*(?:<[\w\s,.<>?\[\]]*>)?'
+                               r'(?:\.[A-Za-z_]\w*(?:<[\w\s,.<>?\[\]]*>)?)*(?:\([^()]*\))?$')
+GENERIC_PATTERN = re.compile(r'<[^<>]*>')
+PASCAL_CASE_PATTERN = re.compile(r'^_?[A-Z][A-Za-z0-9_]*[a-z][A-Za-z0-9_]*$')
+FILE_EXTENSIONS = {'md', 'json', 'yml', 'yaml', 'cs', 'csproj', 'sln', 'js', 'ts', 'py', 'sh', 'txt',
+                   'html', 'xml', 'http', 'png', 'svg', 'jpg', 'toml', 'lock', 'config', 'env'}
+
+# Reference states
+RESOLVED = 'resolved'
+STALE = 'stale'
+UNKNOWN = 'unknown'
+
+def blank_literals(source):
+    """Replace comments, strings and preprocessor lines by their newlines, keeping line numbers."""
+    return LEXICAL_PATTERN.sub(lambda match: '\n' * match.group(0).count('\n'), source)
+
+def tokenize_source(source):
+    """Return [(token, line)] for C# source with comments and literals removed."""
+    text = blank_literals(source)
+    line_starts = [0] + [match.end() for match in re.finditer(r'\n', text)]
+    return [(match.group(0), bisect.bisect_right(line_starts, match.start()))
+            for match in TOKEN_PATTERN.finditer(text)]
+
+class SourceParser:
+    """Brace-level declaration scan of one tokenized C# file."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+        self.namespaces = set()
+        self.types = []
+
+    def peek(self, ahead=0):
+        index = self.i + ahead
+        return self.tokens[index][0] if index < len(self.tokens) else None
+
+    def skip_balanced(self, opening, closing):
+        """Skip from an opening token at self.i past its matching closing token."""
+        depth = 0
+        while self.i < len(self.tokens):
+            text = self.tokens[self.i][0]
+            self.i += 1
+            if text == opening:
+                depth += 1
+            elif text == closing:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def skip_expression(self):
+        """Skip an initializer or expression body up to and including its ';'."""
+        pairs = {'(': ')', '{': '}', '[': ']'}
+        while self.i < len(self.tokens):
+            text = self.peek()
+            if text in pairs:
+                self.skip_balanced(text, pairs[text])
+            elif text in (';', '}'):
+                if text == ';':
+                    self.i += 1
+                return
+            else:
+                self.i += 1
+
+    def dotted_name(self):
+        parts = []
+        while self.i < len(self.tokens) and IDENTIFIER_PATTERN.match(self.peek()):
+            parts.append(self.peek().lstrip('@'))
+            self.i += 1
+            if self.peek() != '.':
+                break
+            self.i += 1
+        return '.'.join(parts)
+
+    def is_type_declaration(self):
+        following = self.peek(1)
+        if self.peek() == 'record' and following in ('class', 'struct'):
+            following = self.peek(2)
+        return (following is not None and IDENTIFIER_PATTERN.match(following) is not None
+                and following not in TYPE_KEYWORDS and following not in MODIFIERS and following != 'where')
+
+    def parse(self):
+        self.parse_block('', None)
+        return self
+
+    def parse_block(self, namespace, container):
+        """Scan a namespace body (container None) or a type body until its closing brace."""
+        statement = []
+        while self.i < len(self.tokens):
+            text, line = self.tokens[self.i]
+            if text == '}':
+                self.i += 1
+                return
+            if text == '[':
+                self.skip_balanced('[', ']')  # attributes, indexer parameters and array ranks
+                if statement:
+                    statement.append('[]')
+                continue
+            if text == 'namespace' and container is None:
+                self.i += 1
+                name = self.dotted_name()
+                full_name = f"{namespace}.{name}" if namespace else name
+                self.namespaces.add(full_name)
+                if self.peek() == '{':
+                    self.i += 1
+                    self.parse_block(full_name, None)
+                else:
+                    self.i += 1  # file-scoped namespace
+                    namespace = full_name
+                statement = []
+                continue
+            if text in TYPE_KEYWORDS and self.is_type_declaration():
+                self.parse_type(namespace, container, statement)
+                statement = []
+                continue
+            if container is None:
+                # Usings, top-level statements and delegates: nothing to index
+                if text in ('{', '('):
+                    self.skip_balanced(text, '}' if text == '{' else ')')
+                else:
+                    self.i += 1
+                    if text == ';':
+                        statement = []
+                    else:
+                        statement.append(text)
+                continue
+            if text not in BOUNDARIES:
+                statement.append(text)
+                self.i += 1
+                continue
+            names = self.declared_names(statement)
+            if text == '(' and (not names or statement.count('<') > statement.count('>')):
+                self.skip_balanced('(', ')')  # tuple type before the member name
+                statement.append('()')
+                continue
+            if names and names[-1] != 'this' and 'operator' not in statement:
+                visible = container['kind'] == 'interface' or VISIBLE_MODIFIERS.intersection(statement)
+                if text in ('=', ';'):
+                    # Fields may declare several names: 'int A, B;' and 'int A = 1, B = 2;'
+                    declared = self.declarator_names(statement)
+                    self.i += 1
+                    if text == '=':
+                        declared += self.skip_field_initializers()
+                    if visible:
+                        container['members'].update(declared)
+                    statement = []
+                    continue
+                if visible:
+                    container['members'].add(names[-1])
+            self.skip_member(text)
+            statement = []
+
+    @staticmethod
+    def declared_names(statement):
+        """Identifiers of a declaration outside generic argument lists, without modifiers."""
+        names = []
+        depth = 0
+        for text in statement:
+            if text == '<':
+                depth += 1
+            elif text == '>':
+                depth -= 1
+            elif depth == 0 and IDENTIFIER_PATTERN.match(text) and text not in MODIFIERS:
+                names.append(text.lstrip('@'))
+        return names
+
+    @classmethod
+    def declarator_names(cls, statement):
+        """Names declared by a field statement, one per ',' outside generic argument lists."""
+        names = []
+        segment = []
+        depth = 0
+        for text in statement + [',']:
+            if text == '<':
+                depth += 1
+            elif text == '>':
+                depth -= 1
+            if text == ',' and depth == 0:
+                declared = cls.declared_names(segment)
+                if declared:
+                    names.append(declared[-1])
+                segment = []
+            else:
+                segment.append(text)
+        return names
+
+    def skip_field_initializers(self):
+        """
+        Skip field initializers up to and including the ';', returning the names of
+        the further declarators ('B' in 'int A = 1, B = 2;').
+        """
+        pairs = {'(': ')', '{': '}', '[': ']'}
+        names = []
+        while self.i < len(self.tokens):
+            text = self.peek()
+            if text in pairs:
+                self.skip_balanced(text, pairs[text])
+                continue
+            if text in (';', '}'):
+                if text == ';':
+                    self.i += 1
+                return names
+            self.i += 1
+            # A comma inside generic arguments ('new Dictionary<int, string>()') is not followed by a declarator
+            following = self.peek()
+            if text == ',' and following is not None and IDENTIFIER_PATTERN.match(following) \
+                    and self.peek(1) in ('=', ',', ';'):
+                names.append(following.lstrip('@'))
+        return names
+
+    def skip_member(self, boundary):
+        """Skip the rest of a member declaration that stopped at boundary."""
+        if boundary == '(':
+            self.skip_balanced('(', ')')
+            while self.i < len(self.tokens):
+                text = self.peek()
+                if text == '{':
+                    self.skip_balanced('{', '}')
+                    return
+                if text == '=>':
+                    self.skip_expression()
+                    return
+                if text == ';':
+                    self.i += 1
+                    return
+                if text == '(':
+                    self.skip_balanced('(', ')')  # constructor initializer arguments
+                elif text == '}':
+                    return
+                else:
+                    self.i += 1  # ': base', 'where T : ...'
+        elif boundary == '{':
+            self.skip_balanced('{', '}')
+            if self.peek() == '=':
+                self.skip_expression()  # property initializer
+        elif boundary == ';':
+            self.i += 1
+        else:
+            self.skip_expression()
+
+    def parse_type(self, namespace, container, modifiers):
+        keyword = self.peek()
+        self.i += 1
+        if keyword == 'record' and self.peek() in ('class', 'struct'):
+            self.i += 1
+        name, line = self.tokens[self.i]
+        name = name.lstrip('@')
+        self.i += 1
+        full_name = f"{container['name']}.{name}" if container else (f"{namespace}.{name}" if namespace else name)
+        symbol = {'name': full_name, 'namespace': namespace, 'kind': keyword, 'line': line,
+                  'bases': [], 'members': set()}
+        if self.peek() == '<':
+            self.skip_balanced('<', '>')
+        if self.peek() == '(':
+            self.parse_parameters(symbol)  # positional record properties
+        expect_base = False
+        while self.i < len(self.tokens) and self.peek() not in ('{', ';'):
+            text = self.peek()
+            if text == 'where':
+                expect_base = None  # constraints follow: no more bases
+            elif text in (':', ',') and expect_base is not None:
+                expect_base = True
+            elif text == '<':
+                self.skip_balanced('<', '>')
+                continue
+            elif text == '(':
+                self.skip_balanced('(', ')')  # primary constructor arguments to the base
+                continue
+            elif expect_base and IDENTIFIER_PATTERN.match(text):
+                base = self.dotted_name()
+                symbol['bases'].append(base.rsplit('.', 1)[-1])
+                expect_base = False
+                continue
+            self.i += 1
+        if self.peek() == '{':
+            self.i += 1
+            if keyword == 'enum':
+                self.parse_enum_body(symbol)
+            else:
+                self.parse_block(namespace, symbol)
+        else:
+            self.i += 1
+        self.types.append(symbol)
+
+    def parse_parameters(self, symbol):
+        """Add the parameter names of a positional record's parameter list as members."""
+        depth = 0
+        last = None
+        in_default = False
+        while self.i < len(self.tokens):
+            text = self.peek()
+            self.i += 1
+            if text in ('(', '<', '['):
+                depth += 1
+            elif text in (')', '>', ']'):
+                depth -= 1
+                if depth == 0:
+                    break
+            if depth != 1:
+                continue
+            if text in (',', '='):
+                if last:
+                    symbol['members'].add(last)
+                last = None
+                in_default = text == '='
+            elif not in_default and IDENTIFIER_PATTERN.match(text):
+                last = text.lstrip('@')
+        if last:
+            symbol['members'].add(last)
+
+    def parse_enum_body(self, symbol):
+        expect_name = True
+        while self.i < len(self.tokens):
+            text = self.peek()
+            if text == '}':
+                self.i += 1
+                return
+            if text in ('[', '('):
+                self.skip_balanced(text, ']' if text == '[' else ')')
+                continue
+            if text == ',':
+                expect_name = True
+            elif expect_name and IDENTIFIER_PATTERN.match(text):
+                symbol['members'].add(text.lstrip('@'))
+                expect_name = False
+            self.i += 1
+
+def index_source(source):
+    """Return (namespaces, types) declared in C# source; types are JSON-ready dicts."""
+    parser = SourceParser(tokenize_source(source)).parse()
+    types = [dict(symbol, members=sorted(symbol['members'])) for symbol in parser.types]
+    return sorted(parser.namespaces), sorted(types, key=lambda symbol: symbol['name'])
+
+def iter_source_files(src_path):
+    """Yield (posix path relative to src_path, os.DirEntry) of the .cs files, sorted."""
+    return walk_files(src_path, include=('*.cs',), excluded_dirs=EXCLUDED_DIRS)
+
+class SymbolIndex:
+    """Symbols of a source tree, kept up to date incrementally in a JSON cache."""
+
+    def __init__(self):
+        self.files = {}    # relative path -> [size, mtime_ns, hash, namespaces, types]
+        self.removed = {}  # qualified symbol -> {'file', 'since'}
+        self.types = {}
+        self.by_local_name = {}
+        self.namespaces = set()
+        self.symbols = set()
+        self.symbol_files = {}  # qualified symbol -> file declaring it
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return index
+        if payload.get('version') == INDEX_VERSION:
+            index.files = payload['files']
+            index.removed = payload['removed']
+            index.build()
+        return index
+
+    def save(self, path):
+        atomic_write_json(path, {'version': INDEX_VERSION, 'files': self.files, 'removed': self.removed})
+
+    def refresh(self, src_path):
+        """Reindex changed files under src_path; returns (indexed, reused, removed symbols)."""
+        files, indexed, reused = refresh_entries(
+            iter_source_files(src_path), self.files,
+            lambda data: list(index_source(data.decode('utf-8', errors='replace'))))
+
+        previous = {symbol: self.symbol_files.get(symbol) for symbol in self.symbols}
+        self.files = files
+        self.build()
+        today = date.today().isoformat()
+        removed = sorted(symbol for symbol in previous if symbol not in self.symbols)
+        for symbol in removed:
+            self.removed[symbol] = {'file': previous[symbol], 'since': today}
+        for symbol in [symbol for symbol in self.removed if symbol in self.symbols]:
+            del self.removed[symbol]  # restored
+        return indexed, reused, removed
+
+    def build(self):
+        """Build the lookup tables from the per-file entries."""
+        self.types = {}
+        self.by_local_name = {}
+        self.namespaces = set()
+        self.symbols = set()
+        self.symbol_files = {}
+        for rel_path, (_, _, _, namespaces, types) in sorted(self.files.items()):
+            for namespace in namespaces:
+                parts = namespace.split('.')
+                self.namespaces.update('.'.join(parts[:end]) for end in range(1, len(parts) + 1))
+            for symbol in types:
+                merged = self.types.get(symbol['name'])
+                if merged is None:  # first part of a partial type
+                    merged = self.types[symbol['name']] = {'name': symbol['name'], 'kind': symbol['kind'],
+                                                           'file': rel_path, 'line': symbol['line'],
+                                                           'bases': [], 'members': set()}
+                    local = symbol['name'][len(symbol['namespace']) + 1:] if symbol['namespace'] else symbol['name']
+                    local_parts = local.split('.')
+                    for start in range(len(local_parts)):
+                        self.by_local_name.setdefault('.'.join(local_parts[start:]), []).append(symbol['name'])
+                merged['bases'].extend(base for base in symbol['bases'] if base not in merged['bases'])
+                merged['members'].update(symbol['members'])
+                self.symbol_files[symbol['name']] = rel_path
+                for member in symbol['members']:
+                    self.symbol_files[f"{symbol['name']}.{member}"] = rel_path
+        self.symbols = set(self.symbol_files)
+
+    def lookup(self, name):
+        """Full names of the types a (partially) qualified name can refer to."""
+        if name in self.types:
+            return [name]
+        return self.by_local_name.get(name, [])
+
+    def has_member(self, type_name, member, seen=None):
+        """True if the type or its indexed bases declare member, None if an unindexed base might."""
+        symbol = self.types[type_name]
+        if member in symbol['members'] or member in OBJECT_MEMBERS or member == type_name.rsplit('.', 1)[-1]:
+            return True
+        seen = seen or {type_name}
+        answer = False
+        for base in symbol['bases']:
+            candidates = [name for name in self.lookup(base) if name not in seen]
+            if not candidates:
+                if base not in [name.rsplit('.', 1)[-1] for name in seen]:
+                    answer = None  # external base such as Exception
+                continue
+            for candidate in candidates:
+                seen.add(candidate)
+                found = self.has_member(candidate, member, seen)
+                if found:
+                    return True
+                if found is None:
+                    answer = None
+        return answer
+
+    def removed_match(self, reference):
+        """The removed symbol a reference most likely means, or None."""
+        if reference in self.removed:
+            return reference
+        suffix = '.' + reference
+        matches = sorted(symbol for symbol in self.removed if symbol.endswith(suffix))
+        return matches[0] if matches else None
+
+    def suggest(self, name, candidates):
+        matches = difflib.get_close_matches(name, sorted(candidates), n=1, cutoff=0.6)
+        return matches[0] if matches else None
+
+    def resolve(self, reference):
+        """Return (state, reason, suggestion) for a normalized dotted reference."""
+        segments = reference.split('.')
+        for split in range(len(segments), 0, -1):
+            candidates = self.lookup('.'.join(segments[:split]))
+            if not candidates:
+                continue
+            if split == len(segments):
+                return RESOLVED, None, None
+            member = segments[split]
+            answers = [self.has_member(candidate, member) for candidate in candidates]
+            if any(answers):
+                return RESOLVED, None, None  # deeper segments are members of the member's type
+            if None in answers:
+                return UNKNOWN, None, None
+            type_name = candidates[0]
+            removed = self.removed_match(f"{type_name}.{member}")
+            if removed:
+                return STALE, f"{member} was removed from {type_name}", self.suggest(
+                    member, self.types[type_name]['members'])
+            return STALE, f"{type_name} has no member {member}", self.suggest(member, self.types[type_name]['members'])
+
+        if reference in self.namespaces:
+            return RESOLVED, None, None
+        removed = self.removed_match(reference) or self.removed_match(segments[0])
+        if removed:
+            name = removed.rsplit('.', 1)[-1]
+            return STALE, f"{removed} was removed from the code", self.suggest(
+                name, [symbol.rsplit('.', 1)[-1] for symbol in self.types])
+        if segments[0] == 'vv':
+            for split in range(len(segments) - 1, 0, -1):
+                namespace = '.'.join(segments[:split])
+                if namespace in self.namespaces:
+                    missing = segments[split]
+                    return STALE, f"no namespace or type {missing} in {namespace}", self.suggest(
+                        missing, [name.rsplit('.', 1)[-1] for name in self.types if name.startswith(namespace + '.')])
+            return STALE, "unknown vv namespace", None
+        return UNKNOWN, None, None
+
+def normalize_reference(code):
+    """Return the dotted name a code span refers to, or None if it is not a code reference."""
+    code = code.strip()
+    if not REFERENCE_PATTERN.match(code):
+        return None
+    if code.startswith('global::'):
+        code = code[len('global::'):]
+    code = code.split('(', 1)[0]
+    while '<' in code:
+        stripped = GENERIC_PATTERN.sub('', code)
+        if stripped == code:
+            return None
+        code = stripped
+    segments = code.split('.')
+    if len(segments) > 1 and segments[-1].lower() in FILE_EXTENSIONS:
+        return None  # a file name
+    if segments[0] == 'vv':
+        return code if len(segments) > 1 else None
+    if not PASCAL_CASE_PATTERN.match(segments[0]):
+        return None
+    return code
+
+def check_references(docs_path, index, strict=False):
+    """
+    Resolve the backticked code references of every document.
+
+    Returns [{'file', 'line', 'reference', 'state', 'reason', 'suggestion'}] for stale
+    references, plus unknown ones with strict.
+    """
+    findings = []
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        with open(full_path, 'r', encoding='utf-8') as f:
+            tokens = mt.tokenize(f.read())
+        for line, code in mt.iter_code_spans(tokens):
+            reference = normalize_reference(code)
+            if reference is None:
+                continue
+            state, reason, suggestion = index.resolve(reference)
+            if state == STALE or (strict and state == UNKNOWN):
+                findings.append({'file': rel_path, 'line': line, 'reference': code, 'state': state,
+                                 'reason': reason or 'not found in the code', 'suggestion': suggestion})
+    return findings
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Check code references in the docs against a C# symbol index.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--src-path', default=DEFAULT_SRC_PATH, help='Root of the C# sources to index')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help='Symbol index cache file')
+    parser.add_argument('--strict', action='store_true',
+                        help='Also report references to names that are not in the code at all')
+    parser.add_argument('--list-symbols', action='store_true', help='Print the indexed types and members and exit')
+    parser.add_argument('--json-output', help='Write the findings as JSON to this file')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.src_path):
+        logger.error(f"Source directory not found: {args.src_path}")
+        return 1
+
+    index = SymbolIndex.load(args.cache)
+    indexed, reused, removed = index.refresh(args.src_path)
+    index.save(args.cache)
+    logger.info(f"Indexed {len(index.types)} types in {len(index.files)} files "
+                f"({indexed} lexed, {reused} unchanged)")
+    for symbol in removed:
+        logger.info(f"Symbol removed since the last run: {symbol}")
+
+    if args.list_symbols:
+        for name, symbol in sorted(index.types.items()):
+            print(f"{symbol['kind']} {name} ({symbol['file']}:{symbol['line']})")
+            for member in sorted(symbol['members']):
+                print(f"    {member}")
+        return 0
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+
+    findings = check_references(docs_path, index, args.strict)
+    for finding in findings:
+        hint = f" (did you mean {finding['suggestion']}?)" if finding['suggestion'] else ''
+        logger.warning(f"{finding['file']}:{finding['line']}: `{finding['reference']}`: {finding['reason']}{hint}")
+
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump(findings, f, indent=2)
+
+    stale = sum(1 for finding in findings if finding['state'] == STALE)
+    logger.info(f"Found {stale} stale code references"
+                + (f" and {len(findings) - stale} references not in the code" if args.strict else ''))
+    return 1 if stale else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
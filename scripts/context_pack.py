@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+
+"""
+Token-Budgeted Context Packs for the AI Assistant (.aiguidance)
+
+Instead of scanning the whole repository at startup, the assistant loads a
+prebuilt index and asks for a context pack: the most relevant pieces of the
+documentation that fit a token budget.
+
+``build`` splits every Markdown file under the sources (.aiguidance and the
+docs tree by default) into chunks at heading boundaries. Sections longer than
+MAX_CHUNK_TOKENS are split further at blank lines outside code blocks. For
+each chunk the index stores its location, an estimated token count and its
+term counts (terms as in doc_search.py; heading terms weighted x3). BM25
+postings over the chunks are stored with them. The index
+(.docs-cache/context-pack.json) is updated incrementally: a file is only
+re-chunked when its size, mtime and content hash changed. The per-file
+chunks and stat data this needs are kept apart in context-pack.files.json,
+which only ``build`` reads.
+
+``pack`` ranks the chunks with BM25 for a query and/or the files open in the
+editor. Terms are taken from the open files themselves, with camelCase split
+and each term weighted by its tf-idf against the index; the open files' own
+chunks are left out, since the editor already sends them. The pack is filled
+greedily in rank order with every chunk that still fits the budget, within
+the folder caps of context-providers.json (at most maxFiles files and
+maxFileSize characters per file). Selected chunks are read back from their
+files and printed grouped by file, in document order, with a source comment
+each. Only the postings are consulted, so packing takes milliseconds once
+the index is loaded.
+
+Token counts are an estimate (about four characters per token, rounded up),
+which is close enough for budgeting without a model-specific tokenizer.
+
+Defaults come from .aiguidance/settings.json (``contextPack.maxTokens``,
+``contextPack.sources``, ``startup.contextIndex``) and
+.aiguidance/context-providers.json (``folder.maxFiles``,
+``folder.maxFileSize``).
+
+Usage:
+    python context_pack.py build [--source PATH ...] [--index PATH]
+    python context_pack.py pack ["QUERY"] [--open FILE ...] [--budget TOKENS] [--index PATH] [--json]
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+import logging
+from collections import Counter, defaultdict
+
+import yaml
+
+from docs_common import REPO_ROOT, atomic_write_json, content_hash, refresh_entries
+from docs_walk import walk_files
+from doc_cache import unique_anchors
+from doc_search import B, FRONTMATTER_WEIGHT, HEADING_WEIGHT, K1, frontmatter_text, statistics_path, tokenize_text
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+GUIDANCE_PATH = REPO_ROOT / '.aiguidance'
+DEFAULT_INDEX_PATH = '.docs-cache/context-pack.json'
+DEFAULT_SOURCES = ('.aiguidance', 'src/vv.Domain/Docs')
+DEFAULT_BUDGET = 12000
+DEFAULT_MAX_FILES = 30
+DEFAULT_MAX_FILE_SIZE = 80000
+
+# Sections longer than this are split at blank lines
+MAX_CHUNK_TOKENS = 800
+CHARS_PER_TOKEN = 4
+# Open-file terms used as the query, strongest first
+MAX_OPEN_FILE_TERMS = 40
+
+CAMEL_CASE_PATTERN = re.compile(r'([a-z0-9])([A-Z])')
+
+def estimate_tokens(text):
+    """Estimated token count of text (about four characters per token)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def load_settings(guidance_path=GUIDANCE_PATH):
+    """Context pack defaults from .aiguidance/settings.json and context-providers.json."""
+    settings = {'index': DEFAULT_INDEX_PATH, 'sources': list(DEFAULT_SOURCES), 'budget': DEFAULT_BUDGET,
+                'max_files': DEFAULT_MAX_FILES, 'max_file_size': DEFAULT_MAX_FILE_SIZE}
+    payloads = []
+    for name in ('settings.json', 'context-providers.json'):
+        try:
+            with open(os.path.join(guidance_path, name), 'r', encoding='utf-8') as f:
+                payloads.append(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            payloads.append({})
+    general, providers = payloads
+    pack = general.get('contextPack', {})
+    settings['index'] = general.get('startup', {}).get('contextIndex', settings['index'])
+    settings['sources'] = pack.get('sources', settings['sources'])
+    settings['budget'] = pack.get('maxTokens', settings['budget'])
+    folder = providers.get('folder', {})
+    settings['max_files'] = folder.get('maxFiles', settings['max_files'])
+    settings['max_file_size'] = folder.get('maxFileSize', settings['max_file_size'])
+    return settings
+
+def chunk_document(content):
+    """
+    Split a document into chunks at heading boundaries.
+
+    Returns [[anchor, breadcrumb, start line, end line, start offset, end
+    offset, tokens, length, {term: tf}]]. Offsets are character offsets into
+    content; the frontmatter is not part of any chunk, but its terms count
+    towards the first one.
+    """
+    tokens = mt.tokenize(content)
+    titles = [(token.level, token.info, token.line) for token in tokens if token.kind == mt.HEADING]
+    anchors = iter(unique_anchors(titles))
+
+    # Sections: [anchor, breadcrumb, heading terms, [paragraph (first token, last token)]]
+    sections = [['', '', Counter(), []]]
+    frontmatter_terms = Counter()
+    trail = []
+    paragraph = None
+    for token in tokens:
+        if token.kind == mt.FRONTMATTER:
+            try:
+                frontmatter = yaml.safe_load(token.info)
+            except yaml.YAMLError:
+                frontmatter = None
+            for term in tokenize_text(frontmatter_text(frontmatter)):
+                frontmatter_terms[term] += FRONTMATTER_WEIGHT
+            continue
+        if token.kind == mt.HEADING:
+            trail = [(level, title) for level, title in trail if level < token.level] + [(token.level, token.info)]
+            counts = Counter()
+            for term in tokenize_text(token.info):
+                counts[term] += HEADING_WEIGHT
+            sections.append([next(anchors), ' > '.join(title for _, title in trail), counts, []])
+            paragraph = [token, token]
+            sections[-1][3].append(paragraph)
+        elif token.kind == mt.BLANK:
+            paragraph = None
+        elif paragraph is None:
+            paragraph = [token, token]
+            sections[-1][3].append(paragraph)
+        else:
+            paragraph[1] = token
+
+    chunks = []
+    for anchor, breadcrumb, heading_terms, paragraphs in sections:
+        if not paragraphs:
+            continue
+        # Pack paragraphs into chunks of at most MAX_CHUNK_TOKENS (a longer paragraph stays whole)
+        groups = [[paragraphs[0]]]
+        for first, last in paragraphs[1:]:
+            start = groups[-1][0][0].offset
+            if estimate_tokens(content[start:last.offset + len(last.text)]) > MAX_CHUNK_TOKENS:
+                groups.append([])
+            groups[-1].append([first, last])
+        for group in groups:
+            first, last = group[0][0], group[-1][1]
+            start, end = first.offset, last.offset + len(last.text)
+            counts = Counter(heading_terms)
+            for paragraph_first, paragraph_last in group:
+                counts.update(tokenize_text(content[paragraph_first.offset:paragraph_last.offset + len(paragraph_last.text)]))
+            if not chunks:
+                counts.update(frontmatter_terms)
+            chunks.append([anchor, breadcrumb, first.line, last.line, start, end,
+                           estimate_tokens(content[start:end]), sum(counts.values()), dict(counts)])
+    return chunks
+
+def read_json(path):
+    """Load an index or statistics file; None if it is missing, unreadable or outdated."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return payload if payload.get('version') == INDEX_VERSION else None
+
+class ContextIndex:
+    """Chunks of the guidance and docs files with BM25 postings, updated incrementally."""
+
+    def __init__(self, files=None):
+        # path -> [size, mtime_ns, hash, chunks]
+        self.files = files or {}
+        self.hashes = {}     # path -> content hash of the file the chunks were taken from
+        self.chunks = []     # [[path, anchor, breadcrumb, start line, end line, start, end, tokens, length]]
+        self.postings = {}   # term -> [[chunk id, tf]]
+        self.average_length = 0.0
+
+    def update(self, sources):
+        """Re-chunk changed files under the source directories; returns (parsed, reused, changed)."""
+        files, parsed, reused = refresh_entries(
+            ((f"{source.replace(os.sep, '/').rstrip('/')}/{rel_path}", entry)
+             for source in sources for rel_path, entry in walk_files(source, include=('*.md',))),
+            self.files, lambda data: [chunk_document(data.decode('utf-8', errors='replace'))])
+        changed = files != self.files
+        if changed or not self.chunks:
+            self.files = files
+            self.build_postings()
+        return parsed, reused, changed
+
+    def build_postings(self):
+        """Regenerate the chunk table and postings from the stored per-file chunks."""
+        self.chunks = []
+        self.hashes = {path: entry[2] for path, entry in self.files.items()}
+        postings = defaultdict(list)
+        for path, (_, _, _, chunks) in self.files.items():
+            for *location, counts in chunks:
+                chunk_id = len(self.chunks)
+                self.chunks.append([path, *location])
+                for term, tf in counts.items():
+                    postings[term].append([chunk_id, tf])
+        self.postings = dict(postings)
+        total = sum(chunk[8] for chunk in self.chunks)
+        self.average_length = total / len(self.chunks) if self.chunks else 0.0
+
+    def idf(self, term):
+        postings = self.postings.get(term)
+        if not postings:
+            return 0.0
+        return math.log(1 + (len(self.chunks) - len(postings) + 0.5) / (len(postings) + 0.5))
+
+    def rank(self, weights, excluded_paths=()):
+        """Return [(score, chunk id)] for weighted query terms ({term: weight}), best first."""
+        scores = defaultdict(float)
+        for term, weight in weights.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for chunk_id, tf in postings:
+                length = self.chunks[chunk_id][8]
+                norm = K1 * (1 - B + B * length / self.average_length)
+                scores[chunk_id] += weight * idf * tf * (K1 + 1) / (tf + norm)
+        ranked = sorted(((score, chunk_id) for chunk_id, score in scores.items()
+                         if self.chunks[chunk_id][0] not in excluded_paths),
+                        key=lambda item: (-item[0], item[1]))
+        return ranked
+
+    def select(self, ranked, budget, max_files=DEFAULT_MAX_FILES, max_file_size=DEFAULT_MAX_FILE_SIZE):
+        """
+        Fill the budget greedily in rank order: every chunk that still fits is
+        taken, within the file count and per-file size caps. Returns the
+        selected chunk ids and the tokens they use.
+        """
+        selected = []
+        used = 0
+        file_sizes = {}
+        for _, chunk_id in ranked:
+            path, anchor, breadcrumb, _, _, start, end, tokens, _ = self.chunks[chunk_id]
+            cost = tokens + estimate_tokens(source_comment(path, anchor, breadcrumb))
+            if used + cost > budget:
+                continue
+            if path not in file_sizes and len(file_sizes) >= max_files:
+                continue
+            if file_sizes.get(path, 0) + (end - start) > max_file_size:
+                continue
+            file_sizes[path] = file_sizes.get(path, 0) + (end - start)
+            selected.append(chunk_id)
+            used += cost
+        return selected, used
+
+    def save(self, path):
+        atomic_write_json(statistics_path(path), {'version': INDEX_VERSION, 'files': self.files},
+                          ensure_ascii=False)
+        atomic_write_json(path, {
+            'version': INDEX_VERSION,
+            'average_length': self.average_length,
+            'hashes': self.hashes,
+            'chunks': self.chunks,
+            'postings': self.postings,
+        }, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path, statistics=False):
+        """
+        Load a saved index; returns an empty index if the file is missing or outdated.
+
+        The per-file chunks are only needed to update the index and are loaded
+        when statistics is true.
+        """
+        payload = read_json(path)
+        if payload is None:
+            return cls()
+        files = None
+        if statistics:
+            stats = read_json(statistics_path(path))
+            files = stats['files'] if stats is not None else None
+        index = cls(files)
+        index.hashes = payload['hashes']
+        index.chunks = payload['chunks']
+        index.postings = payload['postings']
+        index.average_length = payload['average_length']
+        return index
+
+def source_comment(path, anchor, breadcrumb):
+    location = f"{path}#{anchor}" if anchor else path
+    return f"<!-- {location}{' (' + breadcrumb + ')' if breadcrumb else ''} -->"
+
+def normalize_path(path):
+    """A path as the index stores it: relative to the working directory, with forward slashes."""
+    return os.path.relpath(os.path.abspath(path)).replace(os.sep, '/')
+
+def open_file_terms(paths, index, limit=MAX_OPEN_FILE_TERMS):
+    """Query weights from the files open in the editor: the top terms by tf-idf, scaled to at most 1."""
+    counts = Counter()
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning(f"Cannot read open file {path}: {str(e)}")
+            continue
+        name = os.path.splitext(os.path.basename(path))[0]
+        for text, weight in ((content, 1), (name, HEADING_WEIGHT)):
+            for term in tokenize_text(CAMEL_CASE_PATTERN.sub(r'\1 \2', text)):
+                counts[term] += weight
+    scored = sorted(((tf * index.idf(term), term) for term, tf in counts.items() if term in index.postings),
+                    reverse=True)[:limit]
+    if not scored:
+        return {}
+    top = scored[0][0]
+    return {term: score / top for score, term in scored}
+
+def render_pack(index, chunk_ids):
+    """
+    Read the selected chunks from their files and return them grouped by file
+    (files in rank order, chunks in document order) as (text, stale paths).
+    """
+    order = {}
+    for chunk_id in chunk_ids:
+        order.setdefault(index.chunks[chunk_id][0], []).append(chunk_id)
+    parts = []
+    stale = []
+    for path, ids in order.items():
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            stale.append(path)
+            continue
+        if content_hash(data) != index.hashes.get(path):
+            stale.append(path)
+            continue
+        content = data.decode('utf-8', errors='replace')
+        for chunk_id in sorted(ids, key=lambda chunk_id: index.chunks[chunk_id][3]):
+            _, anchor, breadcrumb, _, _, start, end, _, _ = index.chunks[chunk_id]
+            parts.append(f"{source_comment(path, anchor, breadcrumb)}\n{content[start:end]}\n")
+    return '\n'.join(parts), stale
+
+def main():
+    """Main function."""
+    settings = load_settings()
+    parser = argparse.ArgumentParser(description='Build the context pack index and assemble token-budgeted packs.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build or incrementally update the index')
+    build_parser.add_argument('--source', action='append', help='Directory of Markdown files to index (repeatable; '
+                              f"default: {', '.join(settings['sources'])})")
+    build_parser.add_argument('--index', default=settings['index'], help='Index file')
+
+    pack_parser = subparsers.add_parser('pack', help='Assemble a context pack for a query and/or open files')
+    pack_parser.add_argument('query', nargs='?', default='', help='What the context is for')
+    pack_parser.add_argument('--open', nargs='+', default=[], help='Files open in the editor')
+    pack_parser.add_argument('--budget', type=int, default=settings['budget'], help='Token budget for the pack')
+    pack_parser.add_argument('--index', default=settings['index'], help='Index file')
+    pack_parser.add_argument('--json', action='store_true', help='Print the selected chunks as JSON instead')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        sources = args.source or settings['sources']
+        missing = [source for source in sources if not os.path.isdir(source)]
+        if missing:
+            logger.error(f"Source directory not found: {', '.join(missing)}")
+            return 1
+        start = time.perf_counter()
+        index = ContextIndex.load(args.index, statistics=True)
+        parsed, reused, changed = index.update(sources)
+        if changed or not os.path.exists(args.index) or not os.path.exists(statistics_path(args.index)):
+            index.save(args.index)
+        logger.info(f"Indexed {len(index.chunks)} chunks from {len(index.files)} files "
+                    f"({parsed} parsed, {reused} unchanged) in {time.perf_counter() - start:.2f}s")
+        return 0
+
+    start = time.perf_counter()
+    index = ContextIndex.load(args.index)
+    if not index.chunks:
+        logger.error(f"No context index at {args.index}; run 'context_pack.py build' first")
+        return 1
+    loaded = time.perf_counter()
+
+    weights = open_file_terms(args.open, index)
+    for term in tokenize_text(args.query):
+        weights[term] = weights.get(term, 0.0) + 1.0
+    if not weights:
+        logger.error("Nothing to rank: give a query or open files with terms the index knows")
+        return 1
+    excluded = {normalize_path(path) for path in args.open}
+    ranked = index.rank(weights, excluded)
+    selected, used = index.select(ranked, args.budget, settings['max_files'], settings['max_file_size'])
+    packed = time.perf_counter()
+
+    if args.json:
+        print(json.dumps([{'file': chunk[0], 'anchor': chunk[1], 'breadcrumb': chunk[2], 'start_line': chunk[3],
+                           'end_line': chunk[4], 'tokens': chunk[7]}
+                          for chunk in (index.chunks[chunk_id] for chunk_id in selected)], indent=2))
+    else:
+        text, stale = render_pack(index, selected)
+        sys.stdout.write(text)
+        if stale:
+            logger.warning(f"Skipped {len(stale)} files changed since the index was built; "
+                           f"run 'context_pack.py build': {', '.join(stale)}")
+    logger.info(f"Packed {len(selected)} chunks ({used}/{args.budget} tokens) from {len(ranked)} candidates "
+                f"in {(packed - loaded) * 1000:.1f}ms (index loaded in {(loaded - start) * 1000:.0f}ms)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+
+"""
+Parsed-Document Cache for VeritasVault Documentation
+
+Parsing a Markdown document (frontmatter YAML, headings, anchors and links) is
+the common first step of every documentation tool. This module performs that
+parse once per distinct file content and stores the result on disk, keyed by
+a hash of the content, so repeated local runs and CI runs with a restored
+cache skip almost all parsing work.
+
+Entries are stored in a compact binary format (marshal + zlib) with one file
+per content hash. The cache is bounded by a byte budget and evicts the least
+recently used entries first. Writes go to a temporary file that is atomically
+renamed into place, so several tools can share the cache concurrently.
+
+Usage:
+    python doc_cache.py [--docs-path PATH] [--cache-dir PATH] [--max-bytes N] [--stats]
+"""
+
+import os
+import sys
+import time
+import zlib
+import marshal
+import argparse
+import logging
+import datetime as dt
+from pathlib import Path
+
+import yaml
+
+from docs_common import DEFAULT_DOCS_PATH, atomic_open, content_hash, iter_markdown_files
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = '.docs-cache/parsed'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the parsed representation changes so stale entries are never read
+PARSER_VERSION = 2
+MAGIC = b'VVDC'
+
+def unique_anchors(headings):
+    """Return heading anchors with GitHub's -1, -2 ... suffixes for repeated titles."""
+    anchors = []
+    seen = set()
+    for _, title, *_ in headings:
+        anchor = mt.heading_anchor(title)
+        unique, suffix = anchor, 1
+        while unique in seen:
+            unique = f"{anchor}-{suffix}"
+            suffix += 1
+        seen.add(unique)
+        anchors.append(unique)
+    return anchors
+
+def parse_document(content):
+    """
+    Parse Markdown content into a plain dict:
+
+        frontmatter        parsed YAML mapping (or None)
+        frontmatter_error  YAML error message (or None)
+        headings           [(level, title, line, start, end)]
+        anchors            [anchor] in heading order
+        links              [(text, url, line, start, end, kind)]
+
+    Offsets (start, end) are character offsets into the content. Links are
+    inline links, images and resolved reference links (see markdown_tokens.iter_links).
+    """
+    frontmatter = None
+    frontmatter_error = None
+    headings = []
+    tokens = mt.tokenize(content)
+
+    for token in tokens:
+        if token.kind == mt.FRONTMATTER:
+            try:
+                frontmatter = yaml.safe_load(token.info)
+            except yaml.YAMLError as e:
+                frontmatter_error = str(e)
+        elif token.kind == mt.HEADING:
+            headings.append((token.level, token.info, token.line, token.offset, token.offset + len(token.text)))
+    links = [(link.text, link.url, link.line, link.start, link.end, link.kind) for link in mt.iter_links(tokens)]
+
+    return {
+        'frontmatter': frontmatter,
+        'frontmatter_error': frontmatter_error,
+        'headings': headings,
+        'anchors': unique_anchors(headings),
+        'links': links,
+    }
+
+def _encode(value):
+    """Make YAML values marshal-safe (dates become tagged tuples; YAML never yields tuples)."""
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dt.datetime):
+        return ('datetime', value.isoformat())
+    if isinstance(value, dt.date):
+        return ('date', value.isoformat())
+    return value
+
+def _decode(value):
+    """Reverse _encode for the frontmatter mapping."""
+    if isinstance(value, dict):
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, tuple) and len(value) == 2 and value[0] in ('date', 'datetime'):
+        parse = dt.date.fromisoformat if value[0] == 'date' else dt.datetime.fromisoformat
+        return parse(value[1])
+    return value
+
+def serialize(document):
+    """Serialize a parsed document to the compact binary format."""
+    payload = dict(document, frontmatter=_encode(document['frontmatter']))
+    return MAGIC + bytes([PARSER_VERSION]) + zlib.compress(marshal.dumps(payload), 6)
+
+def deserialize(data):
+    """Deserialize an entry; returns None for foreign or outdated data."""
+    if data[:4] != MAGIC or data[4:5] != bytes([PARSER_VERSION]):
+        return None
+    document = marshal.loads(zlib.decompress(data[5:]))
+    document['frontmatter'] = _decode(document['frontmatter'])
+    return document
+
+class ParsedDocumentCache:
+    """
+    Content-addressed, size-bounded on-disk cache of parsed documents.
+
+    Safe for concurrent use: entries are immutable once written (same content,
+    same entry), writes are atomic renames, and readers treat entries that
+    vanish under them (evicted by another process) as misses.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_written = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def load(self, key):
+        """Return the cached document for key, or None."""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                document = deserialize(f.read())
+            os.utime(path)  # mark as recently used for LRU eviction
+        except (FileNotFoundError, ValueError, EOFError, zlib.error):
+            return None
+        return document
+
+    def store(self, key, document):
+        """Atomically write a document entry."""
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = serialize(document)
+        try:
+            with atomic_open(path, 'wb') as f:
+                f.write(data)
+            self.bytes_written += len(data)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {str(e)}")
+
+    def get(self, data):
+        """Return the parsed document for raw file bytes, parsing only on a cache miss."""
+        key = content_hash(data)
+        document = self.load(key)
+        if document is not None:
+            self.hits += 1
+            return document
+        self.misses += 1
+        document = parse_document(data.decode('utf-8', errors='replace'))
+        self.store(key, document)
+        return document
+
+    def get_file(self, path):
+        """Read a file and return its parsed document."""
+        with open(path, 'rb') as f:
+            return self.get(f.read())
+
+    def entries(self):
+        """Yield (path, size, last used) for every entry currently on disk."""
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.bin'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits its byte budget; returns bytes freed."""
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for path, size, _ in entries:
+            if total - freed <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                freed += size
+            except FileNotFoundError:
+                freed += size  # already evicted by a concurrent run
+        return freed
+
+    def close(self):
+        """Prune if this session wrote anything (only then can the budget have been exceeded)."""
+        if self.bytes_written:
+            self.prune()
+
+def load_document(path, cache=None):
+    """Parse a file, through the cache when one is given."""
+    if cache is not None:
+        return cache.get_file(path)
+    with open(path, 'rb') as f:
+        return parse_document(f.read().decode('utf-8', errors='replace'))
+
+def main():
+    """Warm the cache for a documentation tree and report statistics."""
+    parser = argparse.ArgumentParser(description='Build or inspect the parsed-document cache.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Cache directory')
+    parser.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES, help='Cache size budget in bytes')
+    parser.add_argument('--stats', action='store_true', help='Only print cache statistics')
+    args = parser.parse_args()
+
+    cache = ParsedDocumentCache(args.cache_dir, args.max_bytes)
+    if not args.stats:
+        start = time.perf_counter()
+        count = 0
+        for _, full_path in iter_markdown_files(args.docs_path):
+            cache.get_file(full_path)
+            count += 1
+        logger.info(f"Processed {count} documents in {time.perf_counter() - start:.2f}s "
+                    f"({cache.hits} cached, {cache.misses} parsed)")
+
+    freed = cache.prune()
+    if freed:
+        logger.info(f"Evicted {freed} bytes of least recently used entries")
+    entries = list(cache.entries())
+    logger.info(f"Cache holds {len(entries)} entries, {sum(size for _, size, _ in entries)} bytes "
+                f"(budget {cache.max_bytes})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+"""
+Frontmatter Dependency Graph for VeritasVault Documentation
+
+Builds an indexed graph from the ``dependencies`` array in document
+frontmatter, checks that every dependency resolves to an existing document,
+finds dependency cycles in linear time (Tarjan's strongly connected
+components), and answers "what is affected" queries: given changed
+documents, the reverse-dependency closure of documents whose review may be
+stale.
+
+Dependencies are either paths (resolved relative to the declaring document,
+as harmonize-file-names.py rewrites them) or symbolic IDs such as
+``core-infrastructure``. IDs resolve through an optional alias file
+(JSON mapping ID -> document path) and otherwise through unique file stems.
+
+Usage:
+    python doc_dependencies.py check [--docs-path PATH] [--aliases PATH] [--json-output PATH]
+    python doc_dependencies.py affected [--docs-path PATH] [--changed-from REF] [FILE ...]
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+import subprocess
+from collections import deque
+from pathlib import Path
+
+from docs_common import DEFAULT_DOCS_PATH, REPO_ROOT, iter_markdown_files
+from doc_cache import ParsedDocumentCache, load_document
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def is_path_dependency(dependency):
+    """Path dependencies contain a directory separator or name a Markdown file."""
+    return '/' in dependency or dependency.endswith('.md')
+
+class DependencyGraph:
+    """
+    Documents are numbered once; edges are stored as integer adjacency lists in
+    both directions so traversals never touch path strings.
+    """
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.index = {path: node for node, path in enumerate(self.paths)}
+        self.edges = [[] for _ in self.paths]     # node -> nodes it depends on
+        self.reverse = [[] for _ in self.paths]   # node -> nodes that depend on it
+        self.unresolved = []                      # (source path, dependency, reason)
+
+    def add_edge(self, source, target):
+        self.edges[source].append(target)
+        self.reverse[target].append(source)
+
+    def find_cycles(self):
+        """Return every dependency cycle as a list of paths (iterative Tarjan, O(V + E))."""
+        index_of = [-1] * len(self.paths)
+        lowlink = [0] * len(self.paths)
+        on_stack = [False] * len(self.paths)
+        stack = []
+        cycles = []
+        counter = 0
+
+        for root in range(len(self.paths)):
+            if index_of[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index_of[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                if child < len(self.edges[node]):
+                    work.append((node, child + 1))
+                    target = self.edges[node][child]
+                    if index_of[target] == -1:
+                        work.append((target, 0))
+                    elif on_stack[target]:
+                        lowlink[node] = min(lowlink[node], index_of[target])
+                    continue
+                # All children done: propagate lowlink to the parent and pop a component
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.edges[node]:
+                        cycles.append(sorted(self.paths[member] for member in component))
+        return sorted(cycles)
+
+    def affected(self, changed):
+        """Return the documents that (transitively) depend on any changed document."""
+        seen = set()
+        queue = deque(self.index[path] for path in changed if path in self.index)
+        while queue:
+            node = queue.popleft()
+            for dependent in self.reverse[node]:
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        changed_nodes = {self.index[path] for path in changed if path in self.index}
+        return sorted(self.paths[node] for node in seen - changed_nodes)
+
+def load_aliases(path):
+    """Load a JSON mapping of symbolic dependency IDs to document paths."""
+    if not path:
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def build_graph(docs_path, aliases=None, cache=None):
+    """Parse every document's frontmatter and build the dependency graph."""
+    declared = {}
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        try:
+            frontmatter = load_document(full_path, cache)['frontmatter']
+        except IOError as e:
+            logger.error(f"Error reading {rel_path}: {str(e)}")
+            frontmatter = None
+        dependencies = frontmatter.get('dependencies') if isinstance(frontmatter, dict) else None
+        declared[rel_path] = dependencies if isinstance(dependencies, list) else []
+
+    graph = DependencyGraph(declared)
+
+    # Unique file stems resolve symbolic IDs that have no explicit alias
+    stems = {}
+    for path in graph.paths:
+        stem = os.path.splitext(os.path.basename(path))[0].lower()
+        stems[stem] = None if stem in stems else path
+    aliases = aliases or {}
+
+    for source, dependencies in declared.items():
+        source_node = graph.index[source]
+        for dependency in dependencies:
+            dependency = str(dependency).strip()
+            if is_path_dependency(dependency):
+                target = os.path.normpath(os.path.join(os.path.dirname(source), dependency)).replace(os.sep, '/')
+                reason = 'File not found'
+            else:
+                target = aliases.get(dependency) or stems.get(dependency.lower())
+                reason = 'Ambiguous ID' if dependency.lower() in stems and target is None else 'Unknown ID'
+            if target in graph.index:
+                graph.add_edge(source_node, graph.index[target])
+            else:
+                graph.unresolved.append((source, dependency, reason))
+    return graph
+
+def changed_files_since(ref, docs_path):
+    """Docs-relative paths of Markdown files changed since a git ref."""
+    output = subprocess.run(['git', 'diff', '--name-only', ref, '--', str(docs_path)],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    docs_prefix = os.path.relpath(os.path.abspath(docs_path), REPO_ROOT).replace(os.sep, '/') + '/'
+    return [line[len(docs_prefix):] for line in output.splitlines()
+            if line.startswith(docs_prefix) and line.endswith('.md')]
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Resolve and analyse frontmatter document dependencies.')
+    parser.add_argument('command', choices=['check', 'affected'], help='Validate the graph or query impact')
+    parser.add_argument('files', nargs='*', help='Changed documents, relative to the docs path (affected)')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--aliases', help='JSON file mapping symbolic dependency IDs to document paths')
+    parser.add_argument('--changed-from', help='Use documents changed since this git ref (affected)')
+    parser.add_argument('--cache-dir', help='Parsed-document cache directory (see doc_cache.py)')
+    parser.add_argument('--json-output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+
+    cache = ParsedDocumentCache(args.cache_dir) if args.cache_dir else None
+    graph = build_graph(docs_path, load_aliases(args.aliases), cache)
+    if cache is not None:
+        cache.close()
+
+    if args.command == 'check':
+        cycles = graph.find_cycles()
+        for source, dependency, reason in graph.unresolved:
+            logger.warning(f"{source}: unresolved dependency '{dependency}' ({reason})")
+        for cycle in cycles:
+            logger.warning(f"Dependency cycle: {' -> '.join(cycle + cycle[:1])}")
+        logger.info(f"{len(graph.paths)} documents, {sum(map(len, graph.edges))} dependencies, "
+                    f"{len(graph.unresolved)} unresolved, {len(cycles)} cycles")
+        result = {
+            'unresolved': [{'file': source, 'dependency': dependency, 'issue': reason}
+                           for source, dependency, reason in graph.unresolved],
+            'cycles': cycles,
+        }
+        exit_code = 1 if graph.unresolved or cycles else 0
+    else:
+        changed = list(args.files)
+        if args.changed_from:
+            changed += changed_files_since(args.changed_from, docs_path)
+        affected = graph.affected(changed)
+        for path in affected:
+            print(path)
+        logger.info(f"{len(affected)} documents depend on the {len(changed)} changed documents")
+        result = {'changed': sorted(changed), 'affected': affected}
+        exit_code = 0
+
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    return exit_code
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+"""
+Near-Duplicate Detector for VeritasVault Documentation
+
+Finds documents whose bodies overlap heavily (copied guides, moved files left
+behind, ``BlackLitterman-*.md`` variants) without comparing every pair.
+
+Each body (frontmatter removed) is split into word shingles and summarised by a
+MinHash signature. Signatures use one-permutation hashing with densification:
+every shingle is hashed once and assigned to one of ``num_perm`` bins, so a
+signature costs O(shingles) rather than O(shingles x permutations). LSH banding
+then only compares documents that share at least one band of their signature,
+and candidate pairs are scored by the fraction of equal signature slots (an
+estimate of the Jaccard similarity of their shingle sets).
+
+Signatures are cached by content hash, so reruns only hash changed files.
+
+Usage:
+    python doc_duplicates.py [--docs-path PATH] [--threshold 0.7] [--cache PATH] [--json-output PATH]
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import logging
+from collections import defaultdict
+from pathlib import Path
+
+from docs_common import DEFAULT_DOCS_PATH, atomic_write_json, content_hash, iter_markdown_files
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = '.docs-cache/minhash.json'
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_THRESHOLD = 0.7
+
+# Bumped when the shingled text changes, so cached signatures are recomputed
+SIGNATURE_VERSION = 2
+
+HASH_BITS = 64
+WORD_PATTERN = re.compile(r'\w+')
+
+def document_body(content):
+    """Return the document text without its YAML frontmatter."""
+    return '\n'.join(token.text for token in mt.tokenize(content) if token.kind != mt.FRONTMATTER)
+
+def shingle_hashes(text, size=DEFAULT_SHINGLE_SIZE):
+    """Return the set of 64-bit hashes of the word shingles of text."""
+    words = WORD_PATTERN.findall(text.lower())
+    hashes = set()
+    for i in range(max(len(words) - size, 0) + (1 if words else 0)):
+        shingle = ' '.join(words[i:i + size]).encode('utf-8')
+        hashes.add(int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), 'big'))
+    return hashes
+
+def minhash_signature(hashes, num_perm=DEFAULT_NUM_PERM):
+    """
+    One-permutation MinHash: bin each hash by its low bits and keep the minimum of
+    the remaining bits per bin. Empty bins borrow from the next non-empty bin
+    (rotation densification) so sparse documents still get full signatures.
+    """
+    signature = [None] * num_perm
+    for value in hashes:
+        bin_index = value % num_perm
+        rest = value // num_perm
+        if signature[bin_index] is None or rest < signature[bin_index]:
+            signature[bin_index] = rest
+    if not hashes:
+        return signature
+    # Offsets keep borrowed values distinct from the bin's own range
+    span = (1 << HASH_BITS) // num_perm + 1
+    filled = list(signature)
+    for i in range(num_perm):
+        distance = 1
+        while filled[i] is None:
+            borrowed = signature[(i + distance) % num_perm]
+            if borrowed is not None:
+                filled[i] = borrowed + distance * span
+            distance += 1
+    return filled
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+class SignatureCache:
+    """JSON cache of signatures keyed by file content hash; discarded if parameters change."""
+
+    def __init__(self, path, params):
+        self.path = path
+        self.params = params
+        self.signatures = {}
+        self.used = set()
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('params') == params:
+                    self.signatures = data['signatures']
+            except (json.JSONDecodeError, KeyError, OSError) as e:
+                logger.warning(f"Ignoring unreadable signature cache {path}: {str(e)}")
+
+    def get(self, key):
+        self.used.add(key)
+        return self.signatures.get(key)
+
+    def put(self, key, signature):
+        self.used.add(key)
+        self.signatures[key] = signature
+
+    def save(self):
+        """Write only the signatures used in this run, so deleted files drop out."""
+        if not self.path:
+            return
+        signatures = {key: self.signatures[key] for key in sorted(self.used)}
+        atomic_write_json(self.path, {'params': self.params, 'signatures': signatures})
+
+def compute_signatures(docs_path, cache, shingle_size=DEFAULT_SHINGLE_SIZE, num_perm=DEFAULT_NUM_PERM):
+    """Return {relative path: signature} for every document with at least one shingle."""
+    signatures = {}
+    computed = 0
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        key = content_hash(data)
+        signature = cache.get(key)
+        if signature is None:
+            body = document_body(data.decode('utf-8', errors='replace'))
+            signature = minhash_signature(shingle_hashes(body, shingle_size), num_perm)
+            cache.put(key, signature)
+            computed += 1
+        if signature[0] is not None:  # empty bodies have nothing to compare
+            signatures[rel_path] = signature
+    logger.info(f"Computed {computed} signatures, reused {len(cache.used) - computed} from cache")
+    return signatures
+
+def candidate_pairs(signatures, bands=DEFAULT_BANDS):
+    """Return pairs of paths that share at least one identical LSH band."""
+    paths = list(signatures)
+    num_perm = len(next(iter(signatures.values()))) if signatures else 0
+    rows = max(num_perm // bands, 1)
+    pairs = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for index, path in enumerate(paths):
+            buckets[tuple(signatures[path][band * rows:(band + 1) * rows])].append(index)
+        for members in buckets.values():
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    pairs.add((a, b))
+    return [(paths[a], paths[b]) for a, b in sorted(pairs)]
+
+def find_duplicate_clusters(signatures, threshold=DEFAULT_THRESHOLD, bands=DEFAULT_BANDS):
+    """
+    Group near-duplicates into clusters (union-find over verified candidate pairs).
+
+    Returns [{'files': [...], 'pairs': [(a, b, score)]}] sorted by best score.
+    """
+    parent = {}
+
+    def find(path):
+        parent.setdefault(path, path)
+        while parent[path] != path:
+            parent[path] = parent[parent[path]]
+            path = parent[path]
+        return path
+
+    scored = []
+    for a, b in candidate_pairs(signatures, bands):
+        score = similarity(signatures[a], signatures[b])
+        if score >= threshold:
+            scored.append((a, b, round(score, 3)))
+            parent[find(a)] = find(b)
+
+    clusters = defaultdict(lambda: {'files': set(), 'pairs': []})
+    for a, b, score in scored:
+        cluster = clusters[find(a)]
+        cluster['files'].update((a, b))
+        cluster['pairs'].append((a, b, score))
+
+    result = [{'files': sorted(cluster['files']),
+               'pairs': sorted(cluster['pairs'], key=lambda pair: (-pair[2], pair[0], pair[1]))}
+              for cluster in clusters.values()]
+    return sorted(result, key=lambda cluster: (-cluster['pairs'][0][2], cluster['files']))
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Find near-duplicate documentation files.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Minimum estimated similarity to report (0-1)')
+    parser.add_argument('--shingle-size', type=int, default=DEFAULT_SHINGLE_SIZE, help='Words per shingle')
+    parser.add_argument('--num-perm', type=int, default=DEFAULT_NUM_PERM, help='MinHash signature length')
+    parser.add_argument('--bands', type=int, default=DEFAULT_BANDS, help='Number of LSH bands')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help='Signature cache file ("" to disable)')
+    parser.add_argument('--json-output', help='Write clusters as JSON to this file')
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+    if args.num_perm % args.bands:
+        logger.error(f"--num-perm ({args.num_perm}) must be a multiple of --bands ({args.bands})")
+        return 1
+
+    cache = SignatureCache(args.cache, {'version': SIGNATURE_VERSION, 'shingle_size': args.shingle_size,
+                                        'num_perm': args.num_perm})
+    signatures = compute_signatures(docs_path, cache, args.shingle_size, args.num_perm)
+    cache.save()
+
+    clusters = find_duplicate_clusters(signatures, args.threshold, args.bands)
+    for cluster in clusters:
+        print(f"Cluster of {len(cluster['files'])} files:")
+        for a, b, score in cluster['pairs']:
+            print(f"  {score:.3f}  {a}  <->  {b}")
+    logger.info(f"Found {len(clusters)} near-duplicate clusters among {len(signatures)} documents")
+
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump(clusters, f, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
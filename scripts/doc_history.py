@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+
+"""
+Git History Index for VeritasVault Documentation
+
+Checks ``last_updated`` against the actual git history of every document. The
+whole index comes from a single streamed ``git log --name-status`` pass over the
+docs tree (newest commit first) instead of one ``git log`` per file:
+
+- Each document is followed back through renames (a pure rename, R100, is not
+  a content change) to find its last content change: the newest commit that
+  changed its body. Header-only edits, such as migrations or reviewer
+  changes, are skipped by comparing each version's body with the one before
+  it, batched into one ``git cat-file --batch`` call per step back.
+- The walk for a document stops as soon as it reaches a commit on or before its
+  ``last_updated`` date, and the whole log stops once every document is
+  resolved. Long histories are only read as far back as the oldest
+  ``last_updated`` date requires.
+
+A document whose body changed after its ``last_updated`` date is only flagged
+if its current body also differs from the version as of that date (or the
+oldest version in history), so a change that was later reverted does not
+count.
+
+With --backfill, missing or stale ``last_updated`` values are set to the date
+of the last content change. Only that header line is rewritten, through the
+journaled writer (file_writer.py).
+
+Usage:
+    python doc_history.py [--docs-path PATH] [--backfill] [--json-output PATH]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import logging
+import subprocess
+from datetime import date, datetime
+from pathlib import Path
+
+import yaml
+
+from docs_common import DEFAULT_DOCS_PATH, iter_markdown_files
+from frontmatter_migrations import Header
+from file_writer import add_writer_arguments, writer_from_args
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+COMMIT_MARKER = '\x00'  # printed by %x00 at the start of each commit line
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Document states
+OK = 'ok'
+STALE = 'stale'            # body changed after last_updated
+MISSING = 'missing'        # no valid last_updated
+UNTRACKED = 'untracked'    # not in git history yet
+
+class FileHistory:
+    """History of one current document, filled in while walking the log."""
+
+    __slots__ = ('path', 'last_updated', 'last_commit', 'last_date', 'baseline_commit', 'baseline_path',
+                 'versions')
+
+    def __init__(self, path, last_updated):
+        self.path = path                  # path relative to the repository root
+        self.last_updated = last_updated  # 'YYYY-MM-DD' or None
+        self.last_commit = None           # newest commit that changed the content
+        self.last_date = None
+        self.baseline_commit = None       # version to compare the current body against
+        self.baseline_path = None         # path of the file in that commit
+        self.versions = []                # [(commit, date, path)] that changed the file, newest first
+
+def git(args, cwd):
+    """Run a git command and return its stdout, or None if git fails."""
+    try:
+        result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+def iter_log(repo_root, pathspec):
+    """
+    Stream (commit, date, [(status, old path, new path)]) newest first.
+
+    The caller may stop iterating early; the git process is then terminated.
+    """
+    process = subprocess.Popen(
+        ['git', '-c', 'core.quotePath=off', 'log', '--name-status', '-M', '--no-merges',
+         '--format=%x00%H %cs', '--', pathspec],
+        cwd=repo_root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8')
+    commit = None
+    try:
+        for line in process.stdout:
+            line = line.rstrip('\n')
+            if line.startswith(COMMIT_MARKER):
+                if commit is not None:
+                    yield commit
+                sha, commit_date = line[1:].split(' ')
+                commit = (sha, commit_date, [])
+            elif line and commit is not None:
+                fields = line.split('\t')
+                if len(fields) == 3:
+                    commit[2].append((fields[0], fields[1], fields[2]))
+                else:
+                    commit[2].append((fields[0], fields[1], fields[1]))
+        if commit is not None:
+            yield commit
+    finally:
+        process.stdout.close()
+        process.terminate()
+        process.wait()
+
+def walk_history(histories, repo_root, pathspec):
+    """
+    Fill in last change and baseline for each FileHistory (keyed by repository path)
+    in one pass over the log; the last change is then narrowed to body changes.
+    """
+    pending = dict(histories)  # path at the commit being visited -> FileHistory
+    for sha, commit_date, changes in iter_log(repo_root, pathspec):
+        for status, old_path, new_path in changes:
+            history = pending.get(new_path)
+            if history is None or status.startswith('D'):
+                continue
+            kind = status[0]
+            content_changed = kind in 'AMT' or (kind in 'RC' and status[1:] != '100')
+            del pending[new_path]
+            if content_changed:
+                history.versions.append((sha, commit_date, new_path))
+                history.baseline_commit, history.baseline_path = sha, new_path
+                if history.last_updated and commit_date <= history.last_updated:
+                    continue  # this version is what last_updated describes
+            if kind == 'R':
+                pending[old_path] = history  # older commits know the file by its old name
+            elif kind not in 'AC':
+                pending[new_path] = history  # added or copied: nothing older to visit
+        if not pending:
+            break
+    resolve_body_changes(histories.values(), repo_root)
+
+def resolve_body_changes(histories, repo_root):
+    """
+    Set last_commit/last_date to the newest version whose body differs from the
+    version before it. Each round compares one more pair of versions for every
+    unresolved document, with one cat-file call per round. When every walked
+    version has the same body, the oldest walked version is used (the body last
+    changed on or before it).
+    """
+    blobs = {}
+    steps = {}
+    for history in histories:
+        if len(history.versions) == 1:
+            history.last_commit, history.last_date = history.versions[0][:2]
+        elif history.versions:
+            steps[history] = 0
+    while steps:
+        specs = {f"{sha}:{path}" for history, step in steps.items()
+                 for sha, _, path in history.versions[step:step + 2]}
+        blobs.update(read_blobs(repo_root, sorted(specs - set(blobs))))
+        remaining = {}
+        for history, step in steps.items():
+            (newer_sha, _, newer_path), (older_sha, _, older_path) = history.versions[step:step + 2]
+            newer = blobs.get(f"{newer_sha}:{newer_path}")
+            older = blobs.get(f"{older_sha}:{older_path}")
+            if newer is None or older is None or blob_body(newer) != blob_body(older):
+                history.last_commit, history.last_date = history.versions[step][:2]
+            elif step + 2 == len(history.versions):
+                history.last_commit, history.last_date = history.versions[-1][:2]
+            else:
+                remaining[history] = step + 1
+        steps = remaining
+
+def blob_body(blob):
+    return split_document(blob.decode('utf-8', errors='replace'))[1]
+
+def read_blobs(repo_root, specs):
+    """Read many ``commit:path`` objects with one git cat-file process; returns {spec: bytes or None}."""
+    if not specs:
+        return {}
+    request = ''.join(f"{spec}\n" for spec in specs).encode('utf-8')
+    output = subprocess.run(['git', 'cat-file', '--batch'], cwd=repo_root, input=request,
+                            capture_output=True, check=True).stdout
+    blobs = {}
+    position = 0
+    for spec in specs:
+        end = output.index(b'\n', position)
+        header = output[position:end].split(b' ')
+        position = end + 1
+        if len(header) < 3 or header[1] != b'blob':
+            blobs[spec] = None
+            continue
+        size = int(header[2])
+        blobs[spec] = output[position:position + size]
+        position += size + 1
+    return blobs
+
+def split_document(content):
+    """Return (Header or None, body) of a document."""
+    header, body_offset = Header.parse(content)
+    return header, content[body_offset:] if header is not None else content
+
+def normalize_date(value):
+    """Return a frontmatter date as 'YYYY-MM-DD', or None if it is not a valid date."""
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y-%m-%d')
+    if isinstance(value, str) and DATE_PATTERN.match(value.strip()):
+        try:
+            datetime.strptime(value.strip(), '%Y-%m-%d')
+        except ValueError:
+            return None
+        return value.strip()
+    return None
+
+def find_repo_root(docs_path):
+    output = git(['rev-parse', '--show-toplevel'], docs_path)
+    return output.strip() if output else None
+
+def last_change_dates(docs_path):
+    """
+    Return {real path: 'YYYY-MM-DD'} of the last content change of every
+    tracked document (one log pass, following renames); {} outside a git repository.
+    """
+    repo_root = find_repo_root(docs_path)
+    if repo_root is None:
+        return {}
+    histories = {}
+    for _, full_path in iter_markdown_files(docs_path):
+        repo_path = os.path.relpath(os.path.abspath(full_path), repo_root).replace(os.sep, '/')
+        histories[repo_path] = FileHistory(repo_path, None)
+    walk_history(histories, repo_root, os.path.relpath(os.path.abspath(docs_path), repo_root))
+    return {os.path.realpath(os.path.join(repo_root, path)): history.last_date
+            for path, history in histories.items() if history.last_date is not None}
+
+def check_history(docs_path):
+    """
+    Compare every document's last_updated with its git history.
+
+    Returns [{'file', 'state', 'last_updated', 'last_change', 'commit'}] sorted by path,
+    where state is one of OK, STALE, MISSING or UNTRACKED.
+    """
+    repo_root = find_repo_root(docs_path)
+    if repo_root is None:
+        raise RuntimeError(f"{docs_path} is not inside a git repository")
+    if (git(['rev-parse', '--is-shallow-repository'], repo_root) or '').strip() == 'true':
+        logger.warning("Shallow clone: documents older than the fetched history are compared "
+                       "against their oldest fetched version")
+
+    histories = {}
+    documents = {}
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        with open(full_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        header, body = split_document(content)
+        try:
+            last_updated = normalize_date(header.data.get('last_updated')) if header is not None else None
+        except yaml.YAMLError:
+            last_updated = None
+        repo_path = os.path.relpath(os.path.abspath(full_path), repo_root).replace(os.sep, '/')
+        histories[repo_path] = FileHistory(repo_path, last_updated)
+        documents[repo_path] = (rel_path, body)
+
+    walk_history(histories, repo_root, os.path.relpath(os.path.abspath(docs_path), repo_root))
+
+    # Only documents whose file changed after last_updated need their old body
+    candidates = [history for history in histories.values()
+                  if history.last_updated and history.last_date and history.last_date > history.last_updated]
+    blobs = read_blobs(repo_root, [f"{history.baseline_commit}:{history.baseline_path}" for history in candidates])
+
+    results = []
+    for repo_path, history in histories.items():
+        rel_path, body = documents[repo_path]
+        if history.last_commit is None:
+            state = UNTRACKED
+        elif history.last_updated is None:
+            state = MISSING
+        elif history.last_date <= history.last_updated:
+            state = OK
+        else:
+            old = blobs.get(f"{history.baseline_commit}:{history.baseline_path}")
+            old_body = blob_body(old) if old is not None else None
+            state = OK if old_body == body else STALE
+        results.append({'file': rel_path, 'state': state, 'last_updated': history.last_updated,
+                        'last_change': history.last_date, 'commit': history.last_commit})
+    return sorted(results, key=lambda result: result['file'])
+
+def backfill_content(content, new_date):
+    """Set last_updated in a document's header, keeping its quoting; None without a header."""
+    header, body_offset = Header.parse(content)
+    if header is None:
+        return None
+    span = header.entry('last_updated')
+    if span is None:
+        header.insert('last_updated', new_date, after='version')
+    else:
+        value = header.lines[span[0]].split(':', 1)[1].strip()
+        quote = value[0] if value[:1] in ('"', "'") else "'"
+        header.replace(span[0], span[1], [f"last_updated: {quote}{new_date}{quote}"])
+    return header.render() + content[body_offset:]
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Validate or backfill last_updated from git history.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--backfill', action='store_true',
+                        help='Set missing or stale last_updated values to the last content change')
+    parser.add_argument('--json-output', help='Write per-document results as JSON to this file')
+    add_writer_arguments(parser)
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+
+    try:
+        results = check_history(docs_path)
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+
+    problems = [result for result in results if result['state'] in (STALE, MISSING)]
+    for result in problems:
+        if result['state'] == STALE:
+            logger.warning(f"{result['file']}: body changed on {result['last_change']} "
+                           f"({result['commit'][:8]}) but last_updated is {result['last_updated']}")
+        else:
+            logger.warning(f"{result['file']}: no valid last_updated (last change {result['last_change']})")
+
+    if args.backfill and problems:
+        with writer_from_args('doc_history', args) as writer:
+            for result in problems:
+                full_path = os.path.join(docs_path, result['file'])
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                updated = backfill_content(content, result['last_change'])
+                if updated is not None:
+                    writer.write(full_path, updated)
+        logger.info(f"Backfilled last_updated in {writer.written} files")
+
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    counts = {state: sum(1 for result in results if result['state'] == state)
+              for state in (OK, STALE, MISSING, UNTRACKED)}
+    logger.info(f"Checked {len(results)} documents: " + ', '.join(f"{count} {state}" for state, count in counts.items()))
+    return 1 if problems and not args.backfill else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+
+"""
+Full-Text Search Index for VeritasVault Documentation
+
+Builds an inverted index over the documentation corpus with BM25 ranking.
+Every heading section is a searchable unit, so results point straight at a
+heading anchor (``path#anchor``). Terms come from the section body, the
+heading (weighted x3) and, for a document's first section, its frontmatter
+values (weighted x2).
+
+The index is stored as two compact JSON files. The index file holds the
+section table and postings; the statistics file next to it
+(``search-index.files.json``) holds the per-file term counts, keyed by content
+hash, so a rebuild only re-parses changed files and regenerates the postings
+from the stored statistics. Queries only load the index file and do no
+Markdown parsing; the reported latency includes that load.
+
+``export`` writes a static shard set for the docs site: ``meta.json`` (sections,
+BM25 parameters, shard list) plus ``terms-<prefix>.json`` postings shards
+bucketed by the first characters of each term, so a browser client only fetches
+the shards for the query terms.
+
+Usage:
+    python doc_search.py build [--docs-path PATH] [--index PATH]
+    python doc_search.py query "settlement finality" [--index PATH] [--limit N]
+    python doc_search.py export [--index PATH] [--output-dir src/vv.Functions/wwwroot/search]
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+import logging
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import yaml
+
+from docs_common import DEFAULT_DOCS_PATH, atomic_write_json, content_hash, iter_markdown_files
+from doc_cache import unique_anchors
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+DEFAULT_INDEX_PATH = '.docs-cache/search-index.json'
+DEFAULT_EXPORT_DIR = 'src/vv.Functions/wwwroot/search'
+EXPORT_PREFIX_LENGTH = 2
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+HEADING_WEIGHT = 3
+FRONTMATTER_WEIGHT = 2
+
+TERM_PATTERN = re.compile(r'[a-z0-9]+(?:[-_.][a-z0-9]+)*')
+STOP_WORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the this
+    to was were will with which can should must may not no all any each into
+""".split())
+
+# Lines that carry no searchable prose
+SKIPPED_KINDS = (mt.BLANK, mt.FENCE_OPEN, mt.FENCE_CLOSE, mt.HR, mt.SETEXT_UNDERLINE)
+
+def tokenize_text(text):
+    """Lower-case search terms of text; hyphenated identifiers are kept whole and split."""
+    terms = []
+    for term in TERM_PATTERN.findall(text.lower()):
+        if term in STOP_WORDS or len(term) < 2:
+            continue
+        terms.append(term)
+        if '-' in term or '_' in term or '.' in term:
+            terms.extend(part for part in re.split(r'[-_.]', term) if len(part) > 1 and part not in STOP_WORDS)
+    return terms
+
+def frontmatter_text(frontmatter):
+    """Flatten frontmatter values into searchable text."""
+    if isinstance(frontmatter, dict):
+        return ' '.join(frontmatter_text(value) for value in frontmatter.values())
+    if isinstance(frontmatter, list):
+        return ' '.join(frontmatter_text(value) for value in frontmatter)
+    return '' if frontmatter is None else str(frontmatter)
+
+def index_document(content):
+    """
+    Split a document into heading sections and count their weighted terms.
+
+    Returns [[anchor, title, line, length, {term: tf}]]; the first section is the
+    text before the first heading (anchor '') and carries the frontmatter terms.
+    """
+    sections = [['', '', 1, Counter()]]
+    titles = []
+    for token in mt.tokenize(content):
+        if token.kind == mt.FRONTMATTER:
+            try:
+                frontmatter = yaml.safe_load(token.info)
+            except yaml.YAMLError:
+                frontmatter = None
+            for term in tokenize_text(frontmatter_text(frontmatter)):
+                sections[0][3][term] += FRONTMATTER_WEIGHT
+        elif token.kind == mt.HEADING:
+            titles.append((token.level, token.info, token.line))
+            counts = Counter()
+            for term in tokenize_text(token.info):
+                counts[term] += HEADING_WEIGHT
+            sections.append([None, token.info, token.line, counts])
+        elif token.kind not in SKIPPED_KINDS:
+            sections[-1][3].update(tokenize_text(token.text))
+
+    for section, anchor in zip(sections[1:], unique_anchors(titles)):
+        section[0] = anchor
+
+    return [[anchor, title, line, sum(counts.values()), dict(counts)]
+            for anchor, title, line, counts in sections if counts]
+
+def statistics_path(index_path):
+    """Path of the per-file statistics stored next to an index file."""
+    root, ext = os.path.splitext(index_path)
+    return f"{root}.files{ext or '.json'}"
+
+def read_json(path):
+    """Load an index or statistics file; None if it is missing, unreadable or outdated."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return payload if payload.get('version') == INDEX_VERSION else None
+
+class SearchIndex:
+    """BM25 inverted index over heading sections with per-file incremental updates."""
+
+    def __init__(self, files=None):
+        # path -> {'hash': ..., 'sections': [[anchor, title, line, length, {term: tf}]]}
+        self.files = files or {}
+        self.sections = []   # [[path, anchor, title, line, length]]
+        self.postings = {}   # term -> [[section id, tf]]
+        self.average_length = 0.0
+
+    def update(self, docs_path):
+        """Re-index changed files, drop deleted ones; returns (parsed, reused, changed)."""
+        files = {}
+        parsed = reused = 0
+        for rel_path, full_path in iter_markdown_files(docs_path):
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            key = content_hash(data)
+            previous = self.files.get(rel_path)
+            if previous is not None and previous['hash'] == key:
+                files[rel_path] = previous
+                reused += 1
+                continue
+            files[rel_path] = {'hash': key, 'sections': index_document(data.decode('utf-8', errors='replace'))}
+            parsed += 1
+        changed = bool(parsed) or len(files) != len(self.files)
+        if changed or not self.sections:
+            self.files = files
+            self.build_postings()
+        return parsed, reused, changed
+
+    def build_postings(self):
+        """Regenerate section table and postings from the stored per-file term counts."""
+        self.sections = []
+        postings = defaultdict(list)
+        for path, entry in self.files.items():
+            for anchor, title, line, length, counts in entry['sections']:
+                section_id = len(self.sections)
+                self.sections.append([path, anchor, title, line, length])
+                for term, tf in counts.items():
+                    postings[term].append([section_id, tf])
+        self.postings = dict(postings)
+        total = sum(section[4] for section in self.sections)
+        self.average_length = total / len(self.sections) if self.sections else 0.0
+
+    def search(self, query, limit=10):
+        """Return [(score, path, anchor, title, line)] ranked by BM25."""
+        count = len(self.sections)
+        scores = defaultdict(float)
+        for term in set(tokenize_text(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for section_id, tf in postings:
+                length = self.sections[section_id][4]
+                norm = K1 * (1 - B + B * length / self.average_length)
+                scores[section_id] += idf * tf * (K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(score, *self.sections[section_id][:4]) for section_id, score in ranked]
+
+    def save(self, path):
+        """Write the index file and, next to it, the per-file statistics used by rebuilds."""
+        atomic_write_json(statistics_path(path), {'version': INDEX_VERSION, 'files': self.files},
+                          ensure_ascii=False)
+        atomic_write_json(path, {
+            'version': INDEX_VERSION,
+            'average_length': self.average_length,
+            'sections': self.sections,
+            'postings': self.postings,
+        }, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path, statistics=False):
+        """
+        Load a saved index; returns an empty index if the file is missing or outdated.
+
+        The per-file statistics are only needed to update the index and are
+        loaded when statistics is true.
+        """
+        payload = read_json(path)
+        if payload is None:
+            return cls()
+        files = None
+        if statistics:
+            stats = read_json(statistics_path(path))
+            files = stats['files'] if stats is not None else None
+        index = cls(files)
+        index.sections = payload['sections']
+        index.postings = payload['postings']
+        index.average_length = payload['average_length']
+        return index
+
+    def export(self, output_dir, prefix_length=EXPORT_PREFIX_LENGTH):
+        """Write the static shard set for browser-side search; returns the number of shards."""
+        shards = defaultdict(dict)
+        for term, postings in self.postings.items():
+            shards[term[:prefix_length]][term] = postings
+        os.makedirs(output_dir, exist_ok=True)
+        for stale in Path(output_dir).glob('terms-*.json'):
+            stale.unlink()
+        for prefix, terms in shards.items():
+            with open(os.path.join(output_dir, f"terms-{prefix}.json"), 'w', encoding='utf-8') as f:
+                json.dump(terms, f, separators=(',', ':'), sort_keys=True)
+        meta = {
+            'version': INDEX_VERSION,
+            'k1': K1,
+            'b': B,
+            'prefix_length': prefix_length,
+            'average_length': self.average_length,
+            'sections': self.sections,
+            'shards': sorted(shards),
+        }
+        with open(os.path.join(output_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, separators=(',', ':'), ensure_ascii=False)
+        return len(shards)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Build, query and export the documentation search index.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build or incrementally update the index')
+    build_parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    build_parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='Index file')
+
+    query_parser = subparsers.add_parser('query', help='Search the index')
+    query_parser.add_argument('query', help='Search terms')
+    query_parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='Index file')
+    query_parser.add_argument('--limit', type=int, default=10, help='Maximum number of results')
+    query_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+
+    export_parser = subparsers.add_parser('export', help='Export static JSON shards for the docs site')
+    export_parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='Index file')
+    export_parser.add_argument('--output-dir', default=DEFAULT_EXPORT_DIR, help='Directory for the shard set')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        if not os.path.isdir(args.docs_path):
+            logger.error(f"Documentation directory not found: {args.docs_path}")
+            return 1
+        start = time.perf_counter()
+        index = SearchIndex.load(args.index, statistics=True)
+        parsed, reused, changed = index.update(args.docs_path)
+        if changed or not os.path.exists(args.index) or not os.path.exists(statistics_path(args.index)):
+            index.save(args.index)
+        logger.info(f"Indexed {len(index.sections)} sections from {len(index.files)} files "
+                    f"({parsed} parsed, {reused} unchanged) in {time.perf_counter() - start:.2f}s")
+        return 0
+
+    start = time.perf_counter()
+    index = SearchIndex.load(args.index)
+    if not index.sections:
+        logger.error(f"No search index at {args.index}; run 'doc_search.py build' first")
+        return 1
+
+    if args.command == 'export':
+        shards = index.export(args.output_dir)
+        logger.info(f"Exported {len(index.postings)} terms in {shards} shards to {args.output_dir}")
+        return 0
+
+    loaded = time.perf_counter()
+    results = index.search(args.query, args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    search_time = (time.perf_counter() - loaded) * 1000
+    if args.json:
+        print(json.dumps([{'score': round(score, 4), 'file': path, 'anchor': anchor, 'title': title, 'line': line}
+                          for score, path, anchor, title, line in results], indent=2))
+    else:
+        for score, path, anchor, title, line in results:
+            location = f"{path}#{anchor}" if anchor else path
+            print(f"{score:7.3f}  {location}:{line}  {title}")
+        logger.info(f"{len(results)} results in {elapsed:.1f}ms ({search_time:.1f}ms search, "
+                    f"{elapsed - search_time:.1f}ms loading the index)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
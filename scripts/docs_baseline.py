@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+
+"""
+Baseline Snapshots for the VeritasVault Documentation Checks
+
+A large documentation tree carries legacy findings, and absolute totals hide
+the one new broken link a pull request adds. This tool keeps a baseline:
+a snapshot of the accepted findings, sorted and fingerprinted. A new run is
+compared against it, and only new and resolved findings are reported.
+
+Findings come from the checkers' --json-output files (sharded or not,
+merged as in docs_shard.py). Each finding is keyed by file, check, rule
+and a location normalised so that it survives unrelated edits:
+
+    lint         the text of the offending line (whitespace collapsed), not its number
+    links        the link URL
+    frontmatter  the validation error
+    template     the missing section
+
+The rest of the key is hashed into a fingerprint. If the same finding occurs
+several times in a file, each occurrence gets its own fingerprint, so a
+second copy counts as new. Snapshot entries are sorted by (file,
+fingerprint), and the comparison is a single merge pass over the two
+sorted lists.
+
+The comparison only covers what the run checked: the checks present in
+the results, the shards they came from and, with --files, the listed
+files. Baseline entries outside that scope are carried over unchanged. An
+update can therefore be incremental: a partial or sharded run only
+rewrites its own part of the baseline. With --resolved-only, an update
+only drops fixed findings and never accepts new ones.
+
+Usage:
+    python docs_baseline.py diff RESULT_JSON [RESULT_JSON ...] [--baseline PATH] [--files PATH ...]
+                            [--report PATH] [--json-output PATH]
+    python docs_baseline.py update RESULT_JSON [RESULT_JSON ...] [--baseline PATH] [--files PATH ...]
+                              [--resolved-only]
+
+Example:
+    python scripts/fix_broken_links.py --json-output links.json
+    python .github/workflows/validate-frontmatter.py --json-output frontmatter.json
+    python scripts/docs_baseline.py diff links.json frontmatter.json --report baseline-diff.md
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import logging
+from collections import Counter, defaultdict
+
+from docs_common import DEFAULT_DOCS_PATH, WORKFLOWS_PATH, atomic_open, content_hash, docs_relative
+from docs_shard import merge_shard_results, parse_shard, shard_of
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_PATH = str(WORKFLOWS_PATH / 'docs-baseline.json')
+BASELINE_VERSION = 1
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class Finding:
+    """One baseline entry; sorts by (file, fingerprint)."""
+
+    __slots__ = ('file', 'fingerprint', 'check', 'rule', 'summary')
+
+    def __init__(self, file, fingerprint, check, rule, summary):
+        self.file = file
+        self.fingerprint = fingerprint
+        self.check = check
+        self.rule = rule
+        self.summary = summary
+
+    @property
+    def key(self):
+        return (self.file, self.fingerprint)
+
+    def to_list(self):
+        return [self.file, self.fingerprint, self.check, self.rule, self.summary]
+
+    def to_dict(self):
+        return {'file': self.file, 'check': self.check, 'rule': self.rule, 'summary': self.summary,
+                'fingerprint': self.fingerprint}
+
+def normalize_text(text):
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+def first_line(text):
+    return text.strip().split('\n', 1)[0]
+
+class LineReader:
+    """Lines of the documents lint findings point at, read once per file."""
+
+    def __init__(self, docs_path):
+        self.docs_path = docs_path
+        self.lines = {}
+
+    def line(self, rel_path, number):
+        lines = self.lines.get(rel_path)
+        if lines is None:
+            try:
+                with open(os.path.join(self.docs_path, rel_path), 'r', encoding='utf-8', errors='replace') as f:
+                    lines = f.read().splitlines()
+            except OSError:
+                lines = []
+            self.lines[rel_path] = lines
+        if 1 <= number <= len(lines):
+            return normalize_text(lines[number - 1])
+        return None
+
+def iter_raw_findings(check, results, docs_path, reader):
+    """Yield (file, rule, normalized location, summary) for the results of one check."""
+    if check == 'lint':
+        for issue in results:
+            file = docs_relative(issue['file'], docs_path)
+            text = reader.line(file, issue['line'])
+            location = f"{text}\n{issue['message']}" if text is not None else f"line {issue['line']}\n{issue['message']}"
+            yield file, issue['rule'], location, f"line {issue['line']}: {first_line(issue['message'])}"
+    elif check == 'links':
+        for link in results:
+            file = docs_relative(link['source_file'], docs_path)
+            yield file, link['issue'], link['link_url'].strip(), f"{link['issue']}: {link['link_url']}"
+    elif check == 'frontmatter':
+        for result in results:
+            if result['is_valid']:
+                continue
+            file = docs_relative(result['file'], docs_path)
+            for error in result['errors'] or ['invalid frontmatter']:
+                yield file, 'frontmatter', normalize_text(error), first_line(error)
+    elif check == 'template':
+        for file, compliant, message in results:
+            if compliant:
+                continue
+            file = docs_relative(file, docs_path)
+            for line in message.splitlines() or ['not compliant']:
+                yield file, 'template', normalize_text(line), line
+
+def collect_findings(merged, docs_path=DEFAULT_DOCS_PATH):
+    """Fingerprint the findings of merged check results; returns them sorted by (file, fingerprint)."""
+    findings = []
+    reader = LineReader(docs_path)
+    for check, entry in merged.items():
+        occurrences = Counter()
+        for file, rule, location, summary in iter_raw_findings(check, entry['results'], docs_path, reader):
+            key = (file, rule, location)
+            occurrences[key] += 1
+            fingerprint = content_hash('\x1f'.join((check, rule, location, str(occurrences[key]))))
+            findings.append(Finding(file, fingerprint, check, rule, summary))
+    findings.sort(key=lambda finding: finding.key)
+    return findings
+
+def run_scope(merged, files=None):
+    """
+    Return a predicate telling whether a finding's (check, file) was covered
+    by the run: its check ran, in a shard that includes the file, and the
+    file is one of files (if given).
+    """
+    shards = {}
+    for check, entry in merged.items():
+        if None in entry['shards']:
+            shards[check] = None
+        else:
+            specs = [parse_shard(spec) for spec in entry['shards']]
+            shards[check] = ({index for index, _ in specs}, specs[0][1])
+
+    def in_scope(check, file):
+        if check not in shards or (files is not None and file not in files):
+            return False
+        shard = shards[check]
+        return shard is None or shard_of(file, shard[1]) in shard[0]
+
+    return in_scope
+
+def merge_findings(baseline, current, in_scope):
+    """
+    Compare two finding lists sorted by (file, fingerprint) in one merge pass.
+
+    Returns (merged, new, resolved, unchanged): merged is the updated baseline
+    (entries outside the scope kept, resolved ones dropped, new ones added),
+    new and resolved are the differences inside the scope.
+    """
+    merged, new, resolved = [], [], []
+    unchanged = 0
+    i = j = 0
+    while i < len(baseline) or j < len(current):
+        old = baseline[i] if i < len(baseline) else None
+        finding = current[j] if j < len(current) else None
+        if finding is not None and not in_scope(finding.check, finding.file):
+            j += 1
+            continue
+        if old is not None and (finding is None or old.key < finding.key):
+            if in_scope(old.check, old.file):
+                resolved.append(old)
+            else:
+                merged.append(old)
+            i += 1
+        elif old is None or finding.key < old.key:
+            new.append(finding)
+            merged.append(finding)
+            j += 1
+        else:
+            merged.append(old)
+            unchanged += 1
+            i += 1
+            j += 1
+    return merged, new, resolved, unchanged
+
+def load_baseline(path):
+    """Load a baseline written by save_baseline; a missing file is an empty baseline."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return []
+    if payload.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}: {payload.get('version')}")
+    findings = [Finding(*entry) for entry in payload['findings']]
+    findings.sort(key=lambda finding: finding.key)
+    return findings
+
+def save_baseline(findings, path):
+    """Write the baseline with one finding per line, so updates review as small diffs."""
+    entries = ',\n'.join('    ' + json.dumps(finding.to_list(), ensure_ascii=False) for finding in findings)
+    with atomic_open(path) as f:
+        f.write(f'{{\n  "version": {BASELINE_VERSION},\n  "findings": [\n{entries}\n  ]\n}}\n')
+
+def format_report(new, resolved, unchanged, limit=200):
+    """Markdown report of a baseline comparison (new findings first)."""
+    lines = ["## Baseline Comparison", ""]
+    counts = defaultdict(lambda: [0, 0])
+    for finding in new:
+        counts[finding.check][0] += 1
+    for finding in resolved:
+        counts[finding.check][1] += 1
+    lines.append(f"{len(new)} new, {len(resolved)} resolved, {unchanged} unchanged (already in the baseline).")
+    if counts:
+        lines += ["", "| Check | New | Resolved |", "|-------|-----|----------|"]
+        lines += [f"| {check} | {added} | {fixed} |" for check, (added, fixed) in sorted(counts.items())]
+    for title, findings in (("New findings", new), ("Resolved findings", resolved)):
+        if not findings:
+            continue
+        lines += ["", f"### {title}", ""]
+        lines += [f"- `{finding.file}` ({finding.check}/{finding.rule}): {finding.summary}"
+                  for finding in findings[:limit]]
+        if len(findings) > limit:
+            lines.append(f"- ... and {len(findings) - limit} more")
+    return '\n'.join(lines) + '\n'
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Compare docs check results with a baseline snapshot.')
+    parser.add_argument('command', choices=('diff', 'update'),
+                        help='diff: report new and resolved findings; update: write the new baseline')
+    parser.add_argument('inputs', nargs='+', help='Check result JSON files (--json-output of the checkers)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help='Baseline snapshot file')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Docs path the checks were run on')
+    parser.add_argument('--files', nargs='+', help='Only compare (or update) findings in these docs-relative files')
+    parser.add_argument('--resolved-only', action='store_true',
+                        help='update: only drop resolved findings, do not accept new ones')
+    parser.add_argument('--report', help='diff: write a Markdown report to this file')
+    parser.add_argument('--json-output', help='diff: write new and resolved findings as JSON')
+    args = parser.parse_args()
+
+    try:
+        merged = merge_shard_results(args.inputs)
+        baseline = load_baseline(args.baseline)
+    except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+        logger.error(f"Could not read check results or baseline: {str(e)}")
+        return 1
+
+    files = {docs_relative(path, args.docs_path) for path in args.files} if args.files else None
+    current = collect_findings(merged, args.docs_path)
+    updated, new, resolved, unchanged = merge_findings(baseline, current, run_scope(merged, files))
+    logger.info(f"{len(new)} new, {len(resolved)} resolved and {unchanged} unchanged findings "
+                f"({', '.join(sorted(merged))} against {len(baseline)} baseline entries)")
+
+    if args.command == 'update':
+        if args.resolved_only:
+            added = {finding.key for finding in new}
+            updated = [finding for finding in updated if finding.key not in added]
+        save_baseline(updated, args.baseline)
+        logger.info(f"Wrote baseline with {len(updated)} findings to {args.baseline}")
+        return 0
+
+    for finding in new:
+        logger.warning(f"New: {finding.file} ({finding.check}/{finding.rule}): {finding.summary}")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write(format_report(new, resolved, unchanged))
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump({'new': [finding.to_dict() for finding in new],
+                       'resolved': [finding.to_dict() for finding in resolved],
+                       'unchanged': unchanged}, f, indent=2, ensure_ascii=False)
+    return 1 if new else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
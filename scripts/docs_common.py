@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+Shared helpers for the VeritasVault documentation tooling.
+
+The documentation scripts live in two places: ``scripts/`` (importable modules)
+and ``.github/workflows/`` (workflow entry points with hyphenated file names).
+This module keeps the few pieces of plumbing they share in one place.
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import importlib.util
+from contextlib import contextmanager
+from pathlib import Path
+
+from docs_walk import walk_files
+
+# Repository layout
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_PATH = REPO_ROOT / 'scripts'
+WORKFLOWS_PATH = REPO_ROOT / '.github' / 'workflows'
+DEFAULT_DOCS_PATH = 'src/vv.Domain/Docs'
+DEFAULT_SCHEMA_PATH = WORKFLOWS_PATH / 'frontmatter-schema.json'
+DEFAULT_TEMPLATE_PATH = REPO_ROOT / DEFAULT_DOCS_PATH / 'templates' / 'master-template.md'
+
+def load_script_module(path):
+    """Import a script by file path (works for hyphenated names such as validate-frontmatter.py)."""
+    path = Path(path)
+    module_name = path.stem.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def content_hash(data):
+    """Return a short, stable hash of file content (bytes or str)."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@contextmanager
+def atomic_open(path, mode='w'):
+    """
+    Open a temp file next to path for writing. When the block completes, the
+    temp file replaces path in one os.replace; if it fails, the temp file is
+    removed and path is left as it was.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def atomic_write_json(path, payload, **options):
+    """Write payload as JSON (options as for json.dump, compact by default) atomically."""
+    options.setdefault('separators', (',', ':'))
+    with atomic_open(path) as f:
+        json.dump(payload, f, **options)
+
+def refresh_entries(files, previous, build):
+    """
+    Bring per-file cache entries [size, mtime_ns, content hash, *values] up to date.
+
+    files is [(key, os.DirEntry)] and previous {key: entry}. An entry whose size
+    and mtime match is reused as is; otherwise the file is read and hashed, and
+    its old values are kept if the hash matches. Only new content is passed to
+    build(data), which returns the values. Returns ({key: entry}, built, reused).
+    """
+    entries = {}
+    built = reused = 0
+    for key, entry in files:
+        stat = entry.stat()
+        old = previous.get(key)
+        if old is not None and old[0] == stat.st_size and old[1] == stat.st_mtime_ns:
+            entries[key] = old
+            reused += 1
+            continue
+        with open(entry.path, 'rb') as f:
+            data = f.read()
+        digest = content_hash(data)
+        if old is not None and old[2] == digest:
+            values = list(old[3:])
+            reused += 1
+        else:
+            values = build(data)
+            built += 1
+        entries[key] = [stat.st_size, stat.st_mtime_ns, digest, *values]
+    return entries, built, reused
+
+def iter_markdown_files(docs_path):
+    """Yield (relative path, absolute path) for every Markdown file under docs_path, lazily and sorted."""
+    for rel_path, entry in walk_files(docs_path, include=('*.md',)):
+        yield rel_path, entry.path
+
+def list_docs_files(docs_path):
+    """
+    Return (Markdown files, other files) under docs_path from a single walk, as
+    sorted lists of (relative posix path, os.DirEntry with a cached stat()).
+    """
+    markdown, other = [], []
+    for rel_path, entry in walk_files(docs_path):
+        (markdown if entry.name.endswith('.md') else other).append((rel_path, entry))
+    return markdown, other
+
+def docs_relative(path, docs_path):
+    """
+    Normalise a result path to the docs root. Checkers report paths relative to
+    the docs root (lint, links), to its parent (frontmatter) or as given on the
+    command line (template).
+    """
+    path = path.replace(os.sep, '/')
+    docs_posix = os.path.normpath(docs_path).replace(os.sep, '/')
+    for prefix in (docs_posix + '/', os.path.basename(docs_posix) + '/'):
+        if path.startswith(prefix):
+            return path[len(prefix):]
+    return path
+
+def walk_order_key(rel_path):
+    """
+    Sort key that reproduces a sorted os.walk traversal for relative paths:
+    files of a directory come before its subdirectories, each group sorted by name.
+    """
+    parts = rel_path.replace(os.sep, '/').split('/')
+    return [(1, part) for part in parts[:-1]] + [(0, parts[-1])]
+
+# File naming convention (harmonize-file-names.py renames what needs_rename reports)
+CAMEL_CASE_PATTERN = re.compile(r'([a-z0-9])([A-Z])')
+KEBAB_CASE_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*\.md$')
+
+def camel_to_kebab(name):
+    """Convert CamelCase to kebab-case."""
+    # First handle the filename without extension
+    name_part, ext = os.path.splitext(name)
+    # Replace CamelCase with kebab-case
+    s1 = CAMEL_CASE_PATTERN.sub(r'\1-\2', name_part)
+    # Convert to lowercase
+    return s1.lower() + ext.lower()
+
+def is_kebab_case(filename):
+    """Check if a filename is already in kebab-case."""
+    return bool(KEBAB_CASE_PATTERN.match(filename.lower()))
+
+def needs_conversion(filename):
+    """Determine if a filename needs conversion to kebab-case."""
+    # Skip files that are already kebab-case
+    if is_kebab_case(filename):
+        return False
+
+    # Check for uppercase letters or mixed case
+    name_part, _ = os.path.splitext(filename)
+    return any(c.isupper() for c in name_part) or '_' in name_part
+
+def needs_rename(filename):
+    """True if the naming check reports filename as a file to rename."""
+    return needs_conversion(filename) and camel_to_kebab(filename) != filename
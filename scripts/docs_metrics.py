@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+"""
+Docs-Health Metrics Exporter for VeritasVault Documentation
+
+Turns the results of a docs-quality run into metrics that can be tracked over
+time. It writes Prometheus text exposition (for a textfile collector or
+Pushgateway), JSON (for dashboards or a metrics artifact), or both.
+
+Nothing is re-scanned. Check results come from the checkers' --json-output
+files (sharded or not, merged as in docs_shard.py). Document-level facts
+come from the saved frontmatter store (frontmatter_store.py), which holds
+domains, status and placeholder flags:
+
+    docs_check_issues{check}                 issues found by each check
+    docs_check_files_checked{check}          files each check looked at
+    docs_check_duration_seconds{check}       check time (summed over shards)
+    docs_check_files_per_second{check}       files checked per second
+    docs_documents                           documents in the store
+    docs_documents_by_status{status}         documents per frontmatter status
+    docs_placeholder_documents               generated placeholder documents
+    docs_non_kebab_filenames                 file names the naming check would rename
+    docs_domain_documents{domain}            documents per domain
+    docs_domain_issue_documents{domain,check}  documents with issues per domain and check
+    docs_domain_placeholder_documents{domain}  placeholders per domain
+    docs_domain_coverage_ratio{domain}       share of a domain's documents that are
+                                             real (not placeholders) and pass the
+                                             coverage checks (--coverage-checks)
+    docs_metrics_exports_total               exports so far (counter, kept in --state)
+    docs_check_files_scanned_total{check}    files checked over all exports (counter)
+
+A document's domain is the directory under Domains/ it lives in, or its top
+directory (or "root") outside Domains/.
+
+Usage:
+    python docs_metrics.py RESULT_JSON [RESULT_JSON ...] [--store PATH] [--prometheus PATH] [--json PATH]
+
+Example:
+    python scripts/fix_broken_links.py --json-output results/links.json
+    python scripts/frontmatter_store.py build
+    python scripts/docs_metrics.py results/*.json --prometheus docs-health.prom --json docs-health.json
+
+The store build is the one extra pass over the tree. It re-parses only
+changed documents; in the docs-quality workflow the store is kept in
+.docs-cache, which is restored with the lint cache, and the metrics are
+uploaded as the docs-health-metrics artifact.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+from collections import Counter, defaultdict
+
+from docs_common import DEFAULT_DOCS_PATH, docs_relative, needs_rename
+from docs_shard import CHECKS, issue_count, issue_files, merge_shard_results
+from frontmatter_store import DEFAULT_STORE_PATH, FrontmatterStore
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = '.docs-cache/metrics-state.json'
+
+# Style-only lint findings are too common to say whether a document is usable
+DEFAULT_COVERAGE_CHECKS = ('links', 'frontmatter', 'template')
+
+class MetricSet:
+    """Metric families in insertion order: name -> (type, help, [(labels, value)])."""
+
+    def __init__(self):
+        self.families = {}
+
+    def add(self, name, metric_type, help_text, value, **labels):
+        family = self.families.setdefault(name, (metric_type, help_text, []))
+        family[2].append((labels, value))
+
+    def to_prometheus(self):
+        lines = []
+        for name, (metric_type, help_text, samples) in self.families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{escape_label(str(item))}"' for key, item in labels.items())
+                lines.append(f"{name}{{{label_text}}} {format_value(value)}" if label_text
+                             else f"{name} {format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+    def to_json(self):
+        return {
+            'generated': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'metrics': [{'name': name, 'type': metric_type, 'help': help_text,
+                         'samples': [{'labels': labels, 'value': value} for labels, value in samples]}
+                        for name, (metric_type, help_text, samples) in self.families.items()],
+        }
+
+def escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_value(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+def domain_of(rel_path):
+    parts = rel_path.split('/')
+    if len(parts) > 2 and parts[0] == 'Domains':
+        return parts[1]
+    return parts[0] if len(parts) > 1 else 'root'
+
+def load_state(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'exports': 0, 'files_scanned': {}}
+
+def save_state(state, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+
+def collect_metrics(merged, store, docs_path, state=None, coverage_checks=DEFAULT_COVERAGE_CHECKS):
+    """Build the MetricSet from merged check results and a loaded frontmatter store."""
+    metrics = MetricSet()
+
+    problem_files = {}
+    for check in CHECKS:
+        entry = merged.get(check)
+        if entry is None:
+            continue
+        metrics.add('docs_check_issues', 'gauge', 'Issues found by each docs check',
+                    issue_count(check, entry['results']), check=check)
+        metrics.add('docs_check_files_checked', 'gauge', 'Files each docs check looked at',
+                    entry['files_checked'], check=check)
+        duration = entry.get('duration')
+        if duration is not None:
+            metrics.add('docs_check_duration_seconds', 'gauge', 'Check time in seconds (summed over shards)',
+                        float(duration), check=check)
+            if duration > 0:
+                metrics.add('docs_check_files_per_second', 'gauge', 'Files checked per second',
+                            entry['files_checked'] / duration, check=check)
+        problem_files[check] = {docs_relative(path, docs_path) for path in issue_files(check, entry['results'])}
+
+    paths = store.paths
+    placeholders = {path for row, path in enumerate(paths) if store.value('placeholder', row) == 'true'}
+    metrics.add('docs_documents', 'gauge', 'Markdown documents in the docs tree', len(paths))
+    for status, count in sorted(Counter(store.value('status', row) or 'missing'
+                                        for row in range(len(paths))).items()):
+        metrics.add('docs_documents_by_status', 'gauge', 'Documents per frontmatter status', count, status=status)
+    metrics.add('docs_placeholder_documents', 'gauge', 'Generated placeholder documents', len(placeholders))
+    # The same rule as the workflow's File Naming check (harmonize-file-names.py)
+    non_kebab = sum(1 for path in paths if needs_rename(path.rsplit('/', 1)[-1]))
+    metrics.add('docs_non_kebab_filenames', 'gauge', 'Document file names the naming check would rename', non_kebab)
+
+    domains = defaultdict(list)
+    for path in paths:
+        domains[domain_of(path)].append(path)
+    for domain in sorted(domains):
+        documents = domains[domain]
+        metrics.add('docs_domain_documents', 'gauge', 'Documents per domain', len(documents), domain=domain)
+    for domain in sorted(domains):
+        for check, files in problem_files.items():
+            count = sum(1 for path in domains[domain] if path in files)
+            metrics.add('docs_domain_issue_documents', 'gauge', 'Documents with issues per domain and check',
+                        count, domain=domain, check=check)
+    for domain in sorted(domains):
+        count = sum(1 for path in domains[domain] if path in placeholders)
+        metrics.add('docs_domain_placeholder_documents', 'gauge', 'Placeholder documents per domain',
+                    count, domain=domain)
+    coverage_files = [files for check, files in problem_files.items() if check in coverage_checks]
+    for domain in sorted(domains):
+        documents = domains[domain]
+        covered = sum(1 for path in documents
+                      if path not in placeholders and not any(path in files for files in coverage_files))
+        metrics.add('docs_domain_coverage_ratio', 'gauge',
+                    'Share of documents that are not placeholders and pass the coverage checks',
+                    covered / len(documents), domain=domain)
+
+    if state is not None:
+        state['exports'] += 1
+        metrics.add('docs_metrics_exports_total', 'counter', 'Metric exports so far', state['exports'])
+        for check, entry in merged.items():
+            state['files_scanned'][check] = state['files_scanned'].get(check, 0) + entry['files_checked']
+        for check in CHECKS:
+            if check in state['files_scanned']:
+                metrics.add('docs_check_files_scanned_total', 'counter', 'Files checked over all exports',
+                            state['files_scanned'][check], check=check)
+    return metrics
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Export docs-health metrics from docs check results.')
+    parser.add_argument('inputs', nargs='+', help='Check result JSON files (--json-output of the checkers)')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Docs path the checks were run on')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help='Frontmatter store (see frontmatter_store.py)')
+    parser.add_argument('--state', default=DEFAULT_STATE_PATH, help='Counter state file ("" to disable counters)')
+    parser.add_argument('--coverage-checks', default=','.join(DEFAULT_COVERAGE_CHECKS),
+                        help='Comma-separated checks a document must pass to count towards domain coverage')
+    parser.add_argument('--prometheus', help='Write Prometheus text exposition to this file ("-" for stdout)')
+    parser.add_argument('--json', help='Write metrics as JSON to this file ("-" for stdout)')
+    args = parser.parse_args()
+
+    store = FrontmatterStore.load(args.store)
+    if not store.paths:
+        logger.error(f"No frontmatter store at {args.store}; run 'frontmatter_store.py build' first")
+        return 1
+    try:
+        merged = merge_shard_results(args.inputs)
+    except (OSError, json.JSONDecodeError, KeyError) as e:
+        logger.error(f"Could not read check results: {str(e)}")
+        return 1
+
+    state = load_state(args.state) if args.state else None
+    coverage_checks = [check.strip() for check in args.coverage_checks.split(',') if check.strip()]
+    unknown = [check for check in coverage_checks if check not in CHECKS]
+    if unknown:
+        logger.error(f"Unknown coverage checks: {', '.join(unknown)} (expected {', '.join(CHECKS)})")
+        return 1
+    metrics = collect_metrics(merged, store, args.docs_path, state, coverage_checks)
+
+    outputs = [(args.prometheus, metrics.to_prometheus),
+               (args.json, lambda: json.dumps(metrics.to_json(), indent=2) + '\n')]
+    if not args.prometheus and not args.json:
+        outputs = [('-', metrics.to_prometheus)]
+    for path, render in outputs:
+        if not path:
+            continue
+        if path == '-':
+            sys.stdout.write(render())
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(render())
+    if state is not None:
+        save_state(state, args.state)
+
+    logger.info(f"Exported {sum(len(family[2]) for family in metrics.families.values())} samples "
+                f"from {len(merged)} checks and {len(store.paths)} documents")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+
+"""
+Deterministic Sharding for the VeritasVault Documentation Checks
+
+The docs checkers accept ``--shard i/N`` so a large documentation tree can be
+spread across a CI job matrix. Files are assigned to shards by a stable hash of
+their path relative to the docs root, so every runner agrees on the split
+without coordination. Link checks resolve targets against a shared manifest
+of all files, anchors and non-Markdown assets, built once before the matrix
+fans out.
+
+The same manifest, built with ``--repository OWNER/NAME``, is the docs export
+other repositories resolve cross-repo links against: it records the
+repository and where its docs live (``docs_root``), and fix_broken_links.py
+loads it with ``--external-manifest`` to check links into this repository
+offline.
+
+Each sharded checker writes its raw results as JSON (``--json-output``). The
+merge command combines the per-shard files into the same reports and summary an
+unsharded run produces.
+
+Usage:
+    python docs_shard.py manifest [--docs-path PATH] [--repository OWNER/NAME] --output PATH
+    python docs_shard.py merge --output-dir DIR SHARD_JSON [SHARD_JSON ...]
+
+Example matrix job:
+    python scripts/docs_shard.py manifest --output manifest.json
+    python scripts/fix_broken_links.py --shard 2/4 --manifest manifest.json --json-output links-2.json
+    python scripts/markdown_lint.py --shard 2/4 --json-output lint-2.json
+    python .github/workflows/validate-frontmatter.py --shard 2/4 --json-output frontmatter-2.json
+    python .github/workflows/check-template-compliance.py ... --shard 2/4 --json-output template-2.json
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import logging
+from pathlib import Path
+
+from docs_common import (
+    DEFAULT_DOCS_PATH, REPO_ROOT, WORKFLOWS_PATH, list_docs_files, load_script_module, walk_order_key,
+)
+from docs_walk import find_repo_root
+from doc_cache import ParsedDocumentCache, load_document
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 3
+
+# Check names used in shard result files, in consolidated report order
+CHECKS = ('lint', 'links', 'frontmatter', 'template')
+
+def parse_shard(value):
+    """Parse an 'i/N' shard spec (1-based) into (index, count); raises argparse.ArgumentTypeError."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shard must look like i/N, got: {value}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Shard index must be between 1 and N, got: {value}")
+    return index, count
+
+def shard_of(rel_path, count):
+    """Return the 1-based shard a relative path belongs to (stable across machines and runs)."""
+    key = rel_path.replace(os.sep, '/').encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big') % count + 1
+
+def in_shard(rel_path, shard):
+    """True if rel_path belongs to shard (index, count); every path is in shard None."""
+    return shard is None or shard_of(rel_path, shard[1]) == shard[0]
+
+def add_shard_argument(parser):
+    """Add the standard --shard option to a checker's argument parser."""
+    parser.add_argument('--shard', type=parse_shard, default=None,
+                        help='Only check files in shard i of N (e.g. 2/4), assigned by stable path hash')
+
+def build_manifest(docs_path, cache=None, repository=None):
+    """
+    Build the shared manifest: every Markdown file with its heading anchors,
+    redirect stubs and asset paths, plus the repository (OWNER/NAME, if given)
+    and the docs root relative to the repository root for cross-repo links.
+    """
+    from fix_broken_links import redirect_target
+    files = {}
+    redirects = {}
+    markdown_files, other_files = list_docs_files(docs_path)
+    for rel_path, entry in markdown_files:
+        document = load_document(entry.path, cache)
+        files[rel_path] = document['anchors']
+        target = redirect_target(rel_path, document)
+        if target is not None:
+            redirects[rel_path] = target
+    repo_root = find_repo_root(docs_path) or REPO_ROOT
+    docs_root = os.path.relpath(os.path.abspath(docs_path), repo_root).replace(os.sep, '/')
+    return {'version': MANIFEST_VERSION, 'repository': repository, 'docs_root': '' if docs_root == '.' else docs_root,
+            'files': files, 'redirects': redirects, 'assets': [rel_path for rel_path, _ in other_files]}
+
+def save_manifest(manifest, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(',', ':'), sort_keys=True)
+
+def load_manifest(path):
+    """Load a manifest written by save_manifest."""
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version in {path}: {manifest.get('version')}")
+    return manifest
+
+def write_shard_result(path, check, results, files_checked, shard=None, duration=None):
+    """Write a checker's raw results (and how long the check took, in seconds) for later merging."""
+    payload = {
+        'check': check,
+        'shard': f"{shard[0]}/{shard[1]}" if shard else None,
+        'files_checked': files_checked,
+        'duration': None if duration is None else round(duration, 3),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+def merge_shard_results(paths):
+    """
+    Combine shard result files into {check: {'results': [...], 'files_checked': n}}.
+
+    Results are put back in sorted walk order by file; records of one file come
+    from a single shard, so their relative order is preserved by the stable sort.
+    """
+    merged = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        entry = merged.setdefault(payload['check'], {'results': [], 'files_checked': 0, 'shards': [],
+                                                     'duration': None})
+        entry['results'].extend(payload['results'])
+        entry['files_checked'] += payload['files_checked']
+        entry['shards'].append(payload['shard'])
+        if payload.get('duration') is not None:
+            # Summed over shards: the total check time, not the wall time of the matrix
+            entry['duration'] = (entry['duration'] or 0) + payload['duration']
+
+    for check, entry in merged.items():
+        entry['results'].sort(key=lambda result: walk_order_key(_result_file(check, result)))
+    return merged
+
+def _result_file(check, result):
+    """Relative file path of one result record, per check format."""
+    if check == 'links':
+        return result['source_file']
+    if check == 'template':
+        return result[0]
+    return result['file']
+
+def issue_files(check, results):
+    """Return the set of files with at least one issue, per check format."""
+    if check == 'frontmatter':
+        return {result['file'] for result in results if not result['is_valid']}
+    if check == 'template':
+        return {result[0] for result in results if not result[1]}
+    return {_result_file(check, result) for result in results}
+
+def issue_count(check, results):
+    """Count issues the way the consolidated report summary does."""
+    if check == 'frontmatter':
+        return sum(1 for result in results if not result['is_valid'])
+    if check == 'template':
+        return sum(1 for _, compliant, _ in results if not compliant)
+    return len(results)
+
+def write_reports(merged, output_dir):
+    """Write the per-check reports and the summary for merged results."""
+    os.makedirs(output_dir, exist_ok=True)
+    summary = {}
+
+    if 'lint' in merged:
+        from markdown_lint import format_issue
+        with open(os.path.join(output_dir, 'markdown-lint.txt'), 'w', encoding='utf-8') as f:
+            f.write(''.join(format_issue(issue) + '\n' for issue in merged['lint']['results']))
+    if 'links' in merged:
+        from fix_broken_links import write_jsonl
+        write_jsonl(merged['links']['results'], os.path.join(output_dir, 'broken-links.jsonl'))
+    if 'frontmatter' in merged:
+        validator = load_script_module(WORKFLOWS_PATH / 'validate-frontmatter.py')
+        validator.generate_report(merged['frontmatter']['results'], os.path.join(output_dir, 'yaml-validation.md'))
+    if 'template' in merged:
+        compliance = load_script_module(WORKFLOWS_PATH / 'check-template-compliance.py')
+        results = [tuple(result) for result in merged['template']['results']]
+        compliance.generate_report(results, os.path.join(output_dir, 'template-compliance.md'))
+
+    for check in CHECKS:
+        if check in merged:
+            summary[check] = {
+                'issues': issue_count(check, merged[check]['results']),
+                'files_checked': merged[check]['files_checked'],
+            }
+            if merged[check].get('duration') is not None:
+                summary[check]['duration_seconds'] = round(merged[check]['duration'], 3)
+
+    with open(os.path.join(output_dir, 'summary.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+    labels = {'lint': 'Markdown Linting', 'links': 'Broken Links', 'frontmatter': 'YAML Frontmatter',
+              'template': 'Template Compliance'}
+    lines = ["| Check | Issues Found |", "|------|--------------|"]
+    lines += [f"| {labels[check]} | {entry['issues']} |" for check, entry in summary.items()]
+    with open(os.path.join(output_dir, 'summary.md'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return summary
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Build shard manifests and merge sharded docs check results.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    manifest_parser = subparsers.add_parser('manifest', help='Build the shared file/anchor manifest')
+    manifest_parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    manifest_parser.add_argument('--cache-dir', help='Parsed-document cache directory (see doc_cache.py)')
+    manifest_parser.add_argument('--repository', help='OWNER/NAME to record, so other repositories can resolve '
+                                                      'links into these docs (fix_broken_links.py --external-manifest)')
+    manifest_parser.add_argument('--output', required=True, help='Path to write the manifest JSON')
+
+    merge_parser = subparsers.add_parser('merge', help='Merge per-shard JSON results into reports')
+    merge_parser.add_argument('inputs', nargs='+', help='Shard result JSON files')
+    merge_parser.add_argument('--output-dir', required=True, help='Directory for the merged reports and summary')
+
+    args = parser.parse_args()
+
+    if args.command == 'manifest':
+        cache = ParsedDocumentCache(args.cache_dir) if args.cache_dir else None
+        manifest = build_manifest(Path(args.docs_path), cache, args.repository)
+        if cache is not None:
+            cache.close()
+        save_manifest(manifest, args.output)
+        logger.info(f"Wrote manifest with {len(manifest['files'])} files to {args.output}")
+        return 0
+
+    merged = merge_shard_results(args.inputs)
+    summary = write_reports(merged, args.output_dir)
+    for check, entry in summary.items():
+        shards = sorted(shard for shard in merged[check]['shards'] if shard)
+        logger.info(f"{check}: {entry['issues']} issues in {entry['files_checked']} files "
+                    f"from shards {', '.join(shards) or '-'}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
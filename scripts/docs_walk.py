@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+"""
+Streaming file walker shared by the documentation tools
+
+walk_files() is an os.scandir based replacement for os.walk. It yields files
+lazily, so a checker starts on the first file at once, and it keeps the order
+tools have always used (sorted by name, a directory's files before its
+subdirectories). Along the way:
+
+- excluded directories (.git, node_modules and any directory matching an
+  exclude pattern or .gitignore rule) are pruned before they are entered, so
+  their subtrees are never read,
+- include and exclude globs are compiled into one regular expression each,
+  and the .gitignore rules (from the repository root down, nested files
+  included) into one more, so every path is matched once per rule set,
+- each file comes with its os.DirEntry, whose stat() result is cached, so
+  callers do not stat the file again.
+
+Globs follow .gitignore syntax: a pattern without a slash matches a name at
+any depth (``README.md``), one with a slash is anchored to the walk root
+(``templates/*.md``), ``**`` spans directories and a trailing slash only
+matches directories.
+
+Usage:
+    from docs_walk import walk_files
+    for rel_path, entry in walk_files(docs_path, include=('*.md',), exclude=('templates/',)):
+        size = entry.stat().st_size
+        ...
+"""
+
+import os
+import re
+
+DEFAULT_EXCLUDED_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+def glob_to_regex(pattern):
+    """
+    Translate one .gitignore-style glob (without '!' or trailing '/') into a
+    regular expression source matching a relative posix path.
+    """
+    anchored = '/' in pattern.rstrip('/')
+    pattern = pattern.lstrip('/')
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            parts.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif char == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif char == '?':
+            parts.append('[^/]')
+            i += 1
+        elif char == '[':
+            close = pattern.find(']', i + 2)
+            if close == -1:
+                parts.append(re.escape(char))
+                i += 1
+                continue
+            body = pattern[i + 1:close]
+            if body[:1] in ('!', '^'):
+                body = '^' + body[1:]
+            parts.append('[' + body.replace('\\', '\\\\') + ']')
+            i = close + 1
+        elif char == '\\' and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    body = ''.join(parts)
+    return body if anchored else '(?:.*/)?' + body
+
+class PathMatcher:
+    """
+    Ordered glob rules compiled into a single regular expression.
+
+    Rules are (pattern, negated, directory only). As in .gitignore the last
+    matching rule decides; the alternatives are compiled in reverse order with
+    one group per rule, so the first alternative that matches is that rule.
+    """
+
+    def __init__(self, rules=()):
+        self.rules = []
+        self.regex = None
+        self.extend(rules)
+
+    def extend(self, rules, base=''):
+        """Add rules whose patterns are relative to the directory base ('' for the walk root)."""
+        prefix = re.escape(base.rstrip('/') + '/') if base else ''
+        for pattern, negated, directory_only in rules:
+            self.rules.append((prefix + glob_to_regex(pattern), negated, directory_only))
+        if self.rules:
+            alternatives = '|'.join(f"({source})" for source, _, _ in reversed(self.rules))
+            self.regex = re.compile(f"^(?:{alternatives})$", re.DOTALL)
+
+    def match(self, rel_path, is_dir=False):
+        """True if the last rule matching the path excludes (or includes) it; None if no rule matches."""
+        if self.regex is None:
+            return None
+        match = self.regex.match(rel_path)
+        if match is None:
+            return None
+        index = len(self.rules) - match.lastindex
+        while index >= 0:
+            _, negated, directory_only = self.rules[index]
+            if is_dir or not directory_only:
+                return not negated
+            # A directory-only rule does not apply to files: the earlier rules decide
+            index = next((earlier for earlier in range(index - 1, -1, -1)
+                          if re.match(f"^(?:{self.rules[earlier][0]})$", rel_path, re.DOTALL)), -1)
+        return None
+
+def parse_rules(patterns):
+    """Turn glob or .gitignore lines into (pattern, negated, directory only) rules."""
+    rules = []
+    for line in patterns:
+        line = line.rstrip('\n').rstrip('\r')
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated or line.startswith('\\!') or line.startswith('\\#'):
+            line = line[1:]
+        directory_only = line.endswith('/')
+        rules.append((line.rstrip('/'), negated, directory_only))
+    return rules
+
+def compile_globs(patterns):
+    """Compile include or exclude globs into a PathMatcher (None for no patterns)."""
+    return PathMatcher(parse_rules(patterns)) if patterns else None
+
+def find_repo_root(path):
+    """The nearest directory at or above path that contains .git, or None."""
+    current = os.path.abspath(path)
+    while True:
+        if os.path.exists(os.path.join(current, '.git')):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+def _read_ignore_file(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return parse_rules(f)
+    except OSError:
+        return []
+
+def gitignore_matcher(root):
+    """
+    Return (matcher, base) for the .gitignore rules that apply to root: those of
+    the repository's info/exclude and of every .gitignore from the repository
+    root down to root. Paths are matched relative to base (the repository root).
+    """
+    root = os.path.abspath(root)
+    repo_root = find_repo_root(root) or root
+    matcher = PathMatcher()
+    matcher.extend(_read_ignore_file(os.path.join(repo_root, '.git', 'info', 'exclude')))
+    relative = os.path.relpath(root, repo_root)
+    parts = [] if relative == '.' else relative.split(os.sep)
+    for depth in range(len(parts) + 1):
+        directory = os.path.join(repo_root, *parts[:depth])
+        matcher.extend(_read_ignore_file(os.path.join(directory, '.gitignore')), '/'.join(parts[:depth]))
+    return matcher, '/'.join(parts)
+
+def walk_files(root, include=None, exclude=None, excluded_dirs=DEFAULT_EXCLUDED_DIRS, gitignore=True):
+    """
+    Yield (relative posix path, os.DirEntry) for the files under root, lazily and
+    in sorted walk order.
+
+    include and exclude are globs relative to root; a file must match an include
+    pattern (if any) and no exclude pattern. Directories named in excluded_dirs,
+    matching an exclude pattern or ignored by .gitignore are not entered.
+    Symbolic links to directories are not followed, as with os.walk.
+    """
+    include_matcher = compile_globs(include)
+    exclude_matcher = compile_globs(exclude)
+    ignore_matcher, base = gitignore_matcher(root) if gitignore else (None, '')
+
+    def ignored(rel_path, is_dir):
+        if exclude_matcher is not None and exclude_matcher.match(rel_path, is_dir):
+            return True
+        if ignore_matcher is not None:
+            return bool(ignore_matcher.match(f"{base}/{rel_path}" if base else rel_path, is_dir))
+        return False
+
+    stack = [(os.fspath(root), '')]
+    while stack:
+        directory, rel_dir = stack.pop()
+        if gitignore and rel_dir:
+            nested = _read_ignore_file(os.path.join(directory, '.gitignore'))
+            if nested:
+                ignore_matcher.extend(nested, f"{base}/{rel_dir}" if base else rel_dir)
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name not in excluded_dirs and not entry.is_symlink() and not ignored(rel_path, True):
+                    subdirectories.append((entry.path, rel_path))
+                continue
+            if include_matcher is not None and not include_matcher.match(rel_path):
+                continue
+            if ignored(rel_path, False):
+                continue
+            yield rel_path, entry
+        stack.extend(reversed(subdirectories))
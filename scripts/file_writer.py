@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+
+"""
+Safe File Writer for the VeritasVault Documentation Fixers
+
+Shared write layer for the scripts that rewrite documentation in bulk
+(add_frontmatter.py, frontmatter_migrations.py, harmonize-file-names.py,
+fix_broken_links.py --fix):
+
+- A file whose bytes would not change is not written at all, so reruns cause
+  no mtime or git churn.
+- Every write goes to a temp file next to the target and is moved into place
+  with os.replace, so a file is always either old or new, never half-written.
+- Writes are staged and committed in batches: the temp files of a batch are
+  fsynced, journaled, renamed, and their directories fsynced once per batch
+  instead of once per file.
+- Each run keeps a change journal under .docs-cache/journal/ with a backup of
+  every file it replaced. An interrupted run can be resumed (the same journal
+  is continued and finished files are reported as done) or rolled back.
+
+Usage:
+    python file_writer.py list [--journal-dir DIR]
+    python file_writer.py rollback [RUN] [--journal-dir DIR] [--force]
+
+Arguments:
+    RUN       Journal to roll back (default: the most recent one)
+    --force   Restore files even if they were edited after the run
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import logging
+from datetime import datetime
+
+from docs_common import REPO_ROOT, atomic_open, content_hash
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Anchored at the repository root, so runs from any directory share one journal
+DEFAULT_JOURNAL_DIR = str(REPO_ROOT / '.docs-cache' / 'journal')
+DEFAULT_BATCH_SIZE = 64
+JOURNAL_FILE = 'journal.jsonl'
+BACKUP_DIR = 'backups'
+KEEP_JOURNALS = 20
+
+def _fsync_directory(path):
+    """Flush a directory entry (renames) to disk; a no-op where directories cannot be opened."""
+    try:
+        fd = os.open(path or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _read_bytes(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def read_journal(run_dir):
+    """Return the entries of a journal, ignoring a torn last line."""
+    entries = []
+    try:
+        with open(os.path.join(run_dir, JOURNAL_FILE), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+    except FileNotFoundError:
+        pass
+    return entries
+
+def list_runs(journal_dir=DEFAULT_JOURNAL_DIR):
+    """Return [(run name, entries)] for every journal, oldest first."""
+    if not os.path.isdir(journal_dir):
+        return []
+    return [(name, read_journal(os.path.join(journal_dir, name)))
+            for name in sorted(os.listdir(journal_dir))
+            if os.path.isfile(os.path.join(journal_dir, name, JOURNAL_FILE))]
+
+def run_state(entries):
+    """'committed', 'rolled-back' or 'interrupted', from the last marker in a journal."""
+    for entry in reversed(entries):
+        if entry['op'] == 'commit':
+            return 'committed'
+        if entry['op'] == 'rollback':
+            return 'rolled-back'
+    return 'interrupted'
+
+class FileWriter:
+    """
+    Atomic, write-if-changed file writer with batched fsync and an optional journal.
+
+    Use as a context manager; leaving the block flushes the last batch and marks
+    the journal committed. Without a journal directory the writer still skips
+    unchanged files and writes atomically, it just cannot roll back.
+    """
+
+    def __init__(self, tool, journal_dir=DEFAULT_JOURNAL_DIR, resume=False, batch_size=DEFAULT_BATCH_SIZE):
+        self.tool = tool
+        self.batch_size = batch_size
+        self.pending = []        # [(op entry, temp path or None)]
+        self.pending_paths = set()
+        self.done = {}           # path -> content hash written by this run (and the run it resumes)
+        self.renamed = {}        # old path -> new path
+        self.written = 0
+        self.skipped = 0
+        self.run_dir = None
+        self.journal = None
+        self.backups = 0
+        if journal_dir:
+            self._open_journal(journal_dir, resume)
+
+    def _open_journal(self, journal_dir, resume):
+        if resume:
+            for name, entries in reversed(list_runs(journal_dir)):
+                if entries and entries[0].get('tool') == self.tool and run_state(entries) == 'interrupted':
+                    self.run_dir = os.path.join(journal_dir, name)
+                    for entry in entries:
+                        if entry['op'] == 'write':
+                            self.done[entry['path']] = entry['after']
+                        elif entry['op'] == 'rename':
+                            self.renamed[entry['src']] = entry['dst']
+                    self.backups = sum(1 for entry in entries if entry.get('backup'))
+                    remove_staged(entries)
+                    logger.info(f"Resuming interrupted run {name} "
+                                f"({len(self.done)} files and {len(self.renamed)} renames already done)")
+                    break
+            else:
+                logger.info(f"No interrupted {self.tool} run to resume; starting a new one")
+        if self.run_dir is None:
+            name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{self.tool}-{os.getpid()}"
+            self.run_dir = os.path.join(journal_dir, name)
+        os.makedirs(os.path.join(self.run_dir, BACKUP_DIR), exist_ok=True)
+        self.journal = open(os.path.join(self.run_dir, JOURNAL_FILE), 'a', encoding='utf-8')
+        self._append({'op': 'resume' if resume and self.done else 'begin', 'tool': self.tool,
+                      'cwd': os.getcwd(), 'time': datetime.now().isoformat(timespec='seconds')})
+        self._sync_journal()
+
+    def _append(self, entry):
+        self.journal.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def _sync_journal(self):
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+
+    def is_done(self, path):
+        """True if a resumed run already wrote path and the file still has that content."""
+        path = os.path.abspath(path)
+        expected = self.done.get(path)
+        if expected is None:
+            return False
+        data = _read_bytes(path)
+        return data is not None and content_hash(data) == expected
+
+    def write(self, path, content):
+        """
+        Stage content for path; returns False (and writes nothing) if the file
+        already has exactly these bytes.
+        """
+        path = os.path.abspath(path)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        if path in self.pending_paths:
+            # A second write to the same file in one batch must see the first
+            self.flush()
+        before = _read_bytes(path)
+        if before == data:
+            self.skipped += 1
+            return False
+
+        entry = {'op': 'write', 'path': path, 'before': None, 'after': content_hash(data), 'backup': None}
+        if before is not None:
+            entry['before'] = content_hash(before)
+            if self.journal is not None:
+                self.backups += 1
+                entry['backup'] = f"{self.backups:06d}"
+                with open(os.path.join(self.run_dir, BACKUP_DIR, entry['backup']), 'wb') as f:
+                    f.write(before)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if self.journal is not None:
+            # Recorded (unsynced) before the temp file exists, so a crash never leaves an untracked one
+            self._append({'op': 'stage', 'tmp': tmp_path})
+            self.journal.flush()
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        self.pending.append((entry, tmp_path))
+        self.pending_paths.add(path)
+        self.written += 1
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        return True
+
+    def rename(self, src, dst):
+        """Stage a rename; it is applied in order with the staged writes."""
+        src, dst = os.path.abspath(src), os.path.abspath(dst)
+        self.flush()
+        self.pending.append(({'op': 'rename', 'src': src, 'dst': dst}, None))
+        self.renamed[src] = dst
+        self.flush()
+
+    def flush(self):
+        """Commit the staged batch: fsync temp files, journal them, then move them into place."""
+        if not self.pending:
+            return
+        for entry, tmp_path in self.pending:
+            if tmp_path is not None:
+                fd = os.open(tmp_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        if self.journal is not None:
+            if self.backups:
+                _fsync_directory(os.path.join(self.run_dir, BACKUP_DIR))
+            for entry, _ in self.pending:
+                self._append(entry)
+            self._sync_journal()
+
+        directories = set()
+        for entry, tmp_path in self.pending:
+            if entry['op'] == 'write':
+                os.replace(tmp_path, entry['path'])
+                self.done[entry['path']] = entry['after']
+                directories.add(os.path.dirname(entry['path']))
+            else:
+                os.replace(entry['src'], entry['dst'])
+                directories.update((os.path.dirname(entry['src']), os.path.dirname(entry['dst'])))
+        for directory in directories:
+            _fsync_directory(directory)
+        self.pending = []
+        self.pending_paths = set()
+
+    def close(self, commit=True):
+        """Flush the last batch and mark the journal committed."""
+        if commit:
+            self.flush()
+        else:
+            for _, tmp_path in self.pending:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self.pending = []
+            self.pending_paths = set()
+        if self.journal is not None:
+            if commit:
+                self._append({'op': 'commit', 'written': self.written, 'skipped': self.skipped,
+                              'time': datetime.now().isoformat(timespec='seconds')})
+                self._sync_journal()
+            self.journal.close()
+            self.journal = None
+            if commit and not any(entry['op'] in ('write', 'rename') for entry in read_journal(self.run_dir)):
+                # Nothing to roll back; do not keep an empty journal
+                shutil.rmtree(self.run_dir, ignore_errors=True)
+            elif commit:
+                prune_journals(os.path.dirname(self.run_dir))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # On an exception the staged batch is dropped and the journal stays open for --resume
+        self.close(commit=exc_type is None)
+        return False
+
+def prune_journals(journal_dir, keep=KEEP_JOURNALS):
+    """Delete the oldest committed or rolled-back journals beyond keep."""
+    finished = [name for name, entries in list_runs(journal_dir) if run_state(entries) != 'interrupted']
+    for name in finished[:-keep] if keep else finished:
+        shutil.rmtree(os.path.join(journal_dir, name), ignore_errors=True)
+
+def remove_staged(entries):
+    """Delete temp files an interrupted run staged but never moved into place."""
+    for entry in entries:
+        if entry['op'] == 'stage' and os.path.exists(entry['tmp']):
+            os.remove(entry['tmp'])
+
+def rollback(run_dir, force=False):
+    """
+    Undo a run's writes and renames, newest first.
+
+    A file that was edited after the run is left alone (and reported) unless
+    force is set. Returns (restored, conflicts).
+    """
+    entries = read_journal(run_dir)
+    remove_staged(entries)
+    restored, conflicts = 0, []
+    for entry in reversed(entries):
+        if entry['op'] == 'write':
+            data = _read_bytes(entry['path'])
+            current = None if data is None else content_hash(data)
+            if current == entry['before']:
+                continue  # never applied, or already restored
+            if current != entry['after'] and not force:
+                conflicts.append(entry['path'])
+                continue
+            if entry['backup'] is None:
+                if data is not None:
+                    os.remove(entry['path'])
+            else:
+                with open(os.path.join(run_dir, BACKUP_DIR, entry['backup']), 'rb') as f:
+                    before = f.read()
+                with atomic_open(entry['path'], 'wb') as f:
+                    f.write(before)
+            restored += 1
+        elif entry['op'] == 'rename':
+            if os.path.exists(entry['dst']) and not os.path.exists(entry['src']):
+                os.replace(entry['dst'], entry['src'])
+                restored += 1
+            elif os.path.exists(entry['dst']):
+                conflicts.append(entry['src'])
+    with open(os.path.join(run_dir, JOURNAL_FILE), 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'rollback', 'restored': restored, 'conflicts': conflicts,
+                            'time': datetime.now().isoformat(timespec='seconds')}) + '\n')
+    return restored, conflicts
+
+def add_writer_arguments(parser):
+    """Add the standard --resume and --journal-dir options to a fixer's argument parser."""
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue the journal of an interrupted run instead of starting a new one')
+    parser.add_argument('--journal-dir', default=DEFAULT_JOURNAL_DIR,
+                        help='Change journal directory ("" to disable; see file_writer.py)')
+
+def writer_from_args(tool, args):
+    return FileWriter(tool, args.journal_dir, args.resume)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Inspect or roll back documentation fixer runs.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    list_parser = subparsers.add_parser('list', help='List recorded runs')
+    list_parser.add_argument('--journal-dir', default=DEFAULT_JOURNAL_DIR, help='Change journal directory')
+    rollback_parser = subparsers.add_parser('rollback', help='Undo the changes of a run')
+    rollback_parser.add_argument('run', nargs='?', help='Run name (default: most recent)')
+    rollback_parser.add_argument('--journal-dir', default=DEFAULT_JOURNAL_DIR, help='Change journal directory')
+    rollback_parser.add_argument('--force', action='store_true', help='Overwrite files edited after the run')
+    args = parser.parse_args()
+
+    runs = list_runs(args.journal_dir)
+    if args.command == 'list':
+        for name, entries in runs:
+            writes = sum(1 for entry in entries if entry['op'] == 'write')
+            renames = sum(1 for entry in entries if entry['op'] == 'rename')
+            print(f"{name}  {run_state(entries):<12} {writes} writes, {renames} renames")
+        return 0
+
+    if not runs:
+        logger.error(f"No journals in {args.journal_dir}")
+        return 1
+    names = [name for name, _ in runs]
+    name = args.run or names[-1]
+    if name not in names:
+        logger.error(f"Unknown run: {name}")
+        return 1
+    if run_state(dict(runs)[name]) == 'rolled-back':
+        logger.info(f"{name} has already been rolled back")
+        return 0
+    restored, conflicts = rollback(os.path.join(args.journal_dir, name), args.force)
+    for path in conflicts:
+        logger.warning(f"Changed since the run, not restored (use --force): {path}")
+    logger.info(f"Rolled back {name}: {restored} changes restored, {len(conflicts)} conflicts")
+    return 1 if conflicts else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
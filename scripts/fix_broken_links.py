@@ -7,16 +7,54 @@ This script scans Markdown files for internal links and verifies if they are val
 It can detect and report broken links, and optionally suggest fixes.
 
 Usage:
-    python fix_broken_links.py --docs-path PATH [--fix]
+    python fix_broken_links.py --docs-path PATH [--fix] [--rewrite-redirects] [--resume] [--jsonl PATH] [--cache-dir PATH | --mmap]
+                               [--external-manifest PATH ...]
+
+With --mmap, files are memory-mapped and scanned with byte-level patterns;
+only the matched link and heading slices are decoded, which keeps allocation
+low on very large files and corpora.
+
+Redirect stubs (``document_type: redirect``, as left behind by
+harmonize-file-names.py) are followed to their final target through a
+path-compressed redirect table. Links that pass through a stub are reported
+and can be rewritten to the final target with --rewrite-redirects; links into
+redirect loops or to stubs whose target is missing are broken, and stubs that
+no document links to any more are flagged for deletion.
+
+Files changed by --fix or --rewrite-redirects are written through the journaled
+writer (file_writer.py): unchanged files are left alone, and an interrupted run
+can be resumed with --resume or undone with ``python file_writer.py rollback``.
+
+Broken links can be written as JSON Lines (one record per link, "-" for stdout)
+and handed to generate_placeholders.py without going through the text log.
+
+Links into sibling repositories (GitHub blob/tree URLs) are checked offline
+against those repositories' exported manifests (``docs_shard.py manifest
+--repository OWNER/NAME``), loaded as local files with --external-manifest.
+Each link is resolved with dictionary lookups on the repository, path and
+anchor; links to repositories without a manifest, or outside their docs
+root, are left alone. Problems are reported with the issues
+'Cross-repo file not found' and 'Cross-repo anchor not found', which
+generate_placeholders.py does not act on.
 """
 
 import os
 import re
 import sys
+import json
+import mmap
+import time
+import bisect
 import argparse
 import logging
 from pathlib import Path
 from collections import defaultdict
+from urllib.parse import unquote
+
+from doc_cache import ParsedDocumentCache, load_document, unique_anchors
+from docs_common import iter_markdown_files, list_docs_files
+from docs_shard import add_shard_argument, in_shard, load_manifest, write_shard_result
+from file_writer import FileWriter, add_writer_arguments, writer_from_args
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -25,156 +63,531 @@ logger = logging.getLogger(__name__)
 # Regular expression to find Markdown links
 MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
 
+# Byte-level equivalents used by the memory-mapped scanner (links never span lines)
+MARKDOWN_LINK_PATTERN_BYTES = re.compile(rb'\[([^\]\n]+)\]\(([^)\n]+)\)')
+HEADING_PATTERN_BYTES = re.compile(rb'^ {0,3}(#{1,6})[ \t]+([^\n]*?)[ \t]*\r?$', re.MULTILINE)
+FENCE_PATTERN_BYTES = re.compile(rb'^ {0,3}(`{3,}|~{3,})[ \t]*([^\n]*?)[ \t]*\r?$', re.MULTILINE)
+CLOSING_HASHES_PATTERN = re.compile(r'(?:^|[ \t]+)#+$')
+REDIRECT_PATTERN_BYTES = re.compile(rb'^document_type:[ \t]*["\']?redirect["\']?[ \t]*\r?$', re.MULTILINE)
+
+REDIRECT_DOCUMENT_TYPE = 'redirect'
+
+# Links to documents in other repositories: https://github.com/OWNER/NAME/blob/REF/PATH
+GITHUB_URL_PATTERN = re.compile(r'^https?://(?:www\.)?github\.com/([^/]+/[^/]+)/(?:blob|tree)/(.+)$', re.IGNORECASE)
+CROSS_REPO_MISSING_FILE_ISSUE = 'Cross-repo file not found'
+CROSS_REPO_MISSING_ANCHOR_ISSUE = 'Cross-repo anchor not found'
+
 def is_internal_link(link):
     """Check if a link is internal (not external URL)."""
     return not link.startswith(('http://', 'https://', 'mailto:', 'tel:'))
 
 def get_all_markdown_files(docs_path):
     """Get a list of all Markdown files in the documentation directory."""
-    all_files = []
-    for root, _, files in os.walk(docs_path):
-        for file in files:
-            if file.endswith('.md'):
-                rel_path = os.path.relpath(os.path.join(root, file), docs_path)
-                all_files.append(rel_path)
-    return all_files
-
-def extract_links(file_path, content):
-    """Extract all internal links from a Markdown file."""
+    return [rel_path for rel_path, _ in iter_markdown_files(docs_path)]
+
+class LinkRecord:
+    """An internal link of a document (compact: no per-link dict)."""
+
+    __slots__ = ('text', 'url', 'base_url', 'anchor', 'line')
+
+    def __init__(self, text, url, base_url, anchor, line):
+        self.text = text
+        self.url = url
+        self.base_url = base_url
+        self.anchor = anchor
+        self.line = line
+
+class PathTable:
+    """Interns relative paths as small integer IDs, so per-file data lives in plain lists."""
+
+    def __init__(self, paths=()):
+        self.ids = {}
+        self.paths = []
+        for path in paths:
+            self.intern(path)
+
+    def intern(self, path):
+        path_id = self.ids.get(path)
+        if path_id is None:
+            path_id = self.ids[path] = len(self.paths)
+            self.paths.append(sys.intern(path))
+        return path_id
+
+    def get(self, path):
+        """Return the ID of a known path, or -1."""
+        return self.ids.get(path, -1)
+
+    def __len__(self):
+        return len(self.paths)
+
+class LinkResolver:
+    """Resolves link targets relative to a source directory, memoized on (source dir, target)."""
+
+    def __init__(self):
+        self._resolved = {}
+
+    def resolve(self, source_dir, target_path):
+        key = (source_dir, target_path)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = os.path.normpath(os.path.join(source_dir, target_path)) if source_dir else target_path
+            resolved = self._resolved[key] = sys.intern(resolved)
+        return resolved
+
+def extract_links(file_path, document):
+    """Extract all internal links from a parsed Markdown document (see doc_cache.parse_document)."""
     links = []
-    for match in MARKDOWN_LINK_PATTERN.finditer(content):
-        link_text = match.group(1)
-        link_url = match.group(2)
+    for link_text, link_url, line, *_ in document['links']:
         
-        # Skip external links and anchors
-        if not is_internal_link(link_url) or link_url.startswith('#'):
+        # Skip external links, anchors and empty destinations
+        if not link_url or not is_internal_link(link_url) or link_url.startswith('#'):
             continue
         
         # Handle anchors within internal links
-        base_url = link_url.split('#')[0]
-        anchor = None
-        if '#' in link_url:
-            anchor = link_url.split('#', 1)[1]
-        
-        links.append({
-            'text': link_text,
-            'url': link_url,
-            'base_url': base_url,
-            'anchor': anchor,
-            'match_obj': match
-        })
+        base_url, _, anchor = link_url.partition('#')
+        links.append(LinkRecord(link_text, link_url, base_url, anchor or None, line))
     
     return links
 
+def _excluded_ranges(mm):
+    """Return sorted (start, end) byte ranges of frontmatter and fenced code blocks."""
+    ranges = []
+    if mm[:4] in (b'---\n', b'---\r'):
+        end = mm.find(b'\n---', 3)
+        if end != -1:
+            ranges.append((0, end + 4))
+
+    open_fence = None
+    for match in FENCE_PATTERN_BYTES.finditer(mm):
+        marker = match.group(1)
+        if open_fence is None:
+            if not (marker[:1] == b'`' and b'`' in match.group(2)):
+                open_fence = match
+        elif (marker[:1] == open_fence.group(1)[:1] and len(marker) >= len(open_fence.group(1))
+                and not match.group(2)):
+            ranges.append((open_fence.start(), match.end()))
+            open_fence = None
+    if open_fence is not None:
+        ranges.append((open_fence.start(), len(mm)))  # unclosed fence runs to the end of the file
+
+    ranges.sort()
+    return ranges
+
+def scan_document_mmap(path):
+    """
+    Scan a file for headings and links without decoding it.
+
+    The file is memory-mapped and searched with byte patterns; only matched
+    slices are decoded. Returns the same shape as doc_cache.parse_document
+    (frontmatter only records a redirect stub's document_type), with byte
+    offsets for spans. Setext headings, indented code blocks and reference
+    links are not recognised in this mode.
+    """
+    document = {'frontmatter': None, 'frontmatter_error': None, 'headings': [], 'anchors': [], 'links': []}
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return document
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = _excluded_ranges(mm)
+            starts = [start for start, _ in ranges]
+
+            # Frontmatter is not parsed in this mode; only the redirect marker is needed
+            if ranges and ranges[0][0] == 0 and REDIRECT_PATTERN_BYTES.search(mm, 0, ranges[0][1]):
+                document['frontmatter'] = {'document_type': REDIRECT_DOCUMENT_TYPE}
+
+            def excluded(offset):
+                index = bisect.bisect_right(starts, offset) - 1
+                return index >= 0 and offset < ranges[index][1]
+
+            def line_numbers(matches):
+                # Count newlines between consecutive matches; each slice is short-lived
+                line, position = 1, 0
+                for match in matches:
+                    if excluded(match.start()):
+                        continue
+                    line += mm[position:match.start()].count(b'\n')
+                    position = match.start()
+                    yield line, match
+
+            for line, match in line_numbers(HEADING_PATTERN_BYTES.finditer(mm)):
+                title = CLOSING_HASHES_PATTERN.sub('', match.group(2).decode('utf-8', errors='replace')).strip()
+                document['headings'].append((len(match.group(1)), title, line, match.start(), match.end()))
+
+            for line, match in line_numbers(MARKDOWN_LINK_PATTERN_BYTES.finditer(mm)):
+                document['links'].append((match.group(1).decode('utf-8', errors='replace'),
+                                          match.group(2).decode('utf-8', errors='replace'),
+                                          line, match.start(), match.end(), 'inline'))
+
+    document['anchors'] = unique_anchors(document['headings'])
+    return document
+
+_default_resolver = LinkResolver()
+
 def resolve_relative_path(source_file, target_path):
     """Resolve a relative path from the source file directory."""
-    source_dir = os.path.dirname(source_file)
-    if source_dir:
-        target_path = os.path.normpath(os.path.join(source_dir, target_path))
-    return target_path
-
-def check_links(docs_path, fix_links=False):
-    """Check all internal links in Markdown files."""
-    # Get all Markdown files
-    all_files = get_all_markdown_files(docs_path)
-    all_files_set = set(all_files)
+    return _default_resolver.resolve(os.path.dirname(source_file), target_path)
+
+def redirect_target(stub_path, document):
+    """Return the path a redirect stub points to (its first internal link), or None if it is not a stub."""
+    frontmatter = document.get('frontmatter')
+    if not isinstance(frontmatter, dict) or frontmatter.get('document_type') != REDIRECT_DOCUMENT_TYPE:
+        return None
+    for link in extract_links(stub_path, document):
+        if link.base_url:
+            return resolve_relative_path(stub_path, link.base_url)
+    return None
+
+def resolve_redirects(stubs):
+    """
+    Resolve every redirect chain to its final target.
+
+    stubs maps a stub path to the path it points at. Returns {stub: (final, hops)}
+    where final is None for a redirect loop. Each chain is walked once and every
+    stub on it is assigned the final target (path compression), so the total work
+    is linear in the number of stubs and each later lookup is O(1).
+    """
+    resolved = {}
+    for stub in stubs:
+        chain = []
+        on_chain = set()
+        node = stub
+        while node in stubs and node not in resolved and node not in on_chain:
+            chain.append(node)
+            on_chain.add(node)
+            node = stubs[node]
+        if node in on_chain:
+            final, hops = None, 0  # loop
+        elif node in resolved:
+            final, hops = resolved[node]
+        else:
+            final, hops = node, 0
+        for member in reversed(chain):
+            hops += 1
+            resolved[member] = (final, hops if final is not None else 0)
+    return resolved
+
+class CrossRepoIndex:
+    """
+    Files, anchors and redirects of other repositories' docs, from their
+    exported manifests (see docs_shard.py), keyed for O(1) link lookups.
+    """
+
+    def __init__(self):
+        self.repositories = {}  # casefolded OWNER/NAME -> entry dict
+
+    @classmethod
+    def load(cls, paths):
+        index = cls()
+        for path in paths:
+            index.add(load_manifest(path), path)
+        return index
+
+    def add(self, manifest, source='manifest'):
+        repository = manifest.get('repository')
+        if not repository:
+            raise ValueError(f"{source} has no repository; build it with 'docs_shard.py manifest --repository'")
+        directories = {''}
+        for file_path in list(manifest['files']) + manifest.get('assets', []):
+            while '/' in file_path:
+                file_path = file_path.rsplit('/', 1)[0]
+                directories.add(file_path)
+        self.repositories[repository.casefold()] = {
+            'name': repository,
+            'docs_root': manifest.get('docs_root', '').strip('/'),
+            'files': manifest['files'],
+            'anchors': {},  # path -> frozenset, built on first lookup
+            'assets': frozenset(manifest.get('assets', [])),
+            'directories': directories,
+            'redirects': resolve_redirects(manifest.get('redirects', {})),
+        }
+
+    def __len__(self):
+        return len(self.repositories)
+
+    def locate(self, url):
+        """
+        Map a link URL to (repository entry, docs-relative path, anchor), or None
+        if it does not point into the docs of a repository with a manifest.
+        """
+        base_url, _, anchor = url.partition('#')
+        match = GITHUB_URL_PATTERN.match(base_url.split('?', 1)[0])
+        if match is None:
+            return None
+        repository = self.repositories.get(match.group(1).casefold())
+        if repository is None:
+            return None
+        # REF may contain slashes, so find the docs root instead of counting segments
+        rest = unquote(match.group(2)).rstrip('/')
+        docs_root = repository['docs_root']
+        if not docs_root:
+            path = rest.split('/', 1)[1] if '/' in rest else ''
+        elif rest.endswith('/' + docs_root):
+            path = ''
+        else:
+            start = rest.find('/' + docs_root + '/')
+            if start < 0:
+                return None  # outside the docs tree (source code, CI files, ...)
+            path = rest[start + len(docs_root) + 2:]
+        return repository, path, anchor or None
+
+    def check(self, url):
+        """Return (repository name, target, issue or None) for a covered link URL, or None."""
+        located = self.locate(url)
+        if located is None:
+            return None
+        repository, path, anchor = located
+        target = f"{repository['name']}:{path}"
+        if path in repository['redirects']:
+            final_path, _ = repository['redirects'][path]
+            if final_path is None:
+                return repository['name'], target, 'Redirect loop'
+            path = final_path
+        if path not in repository['files']:
+            exists = path in repository['assets'] or path in repository['directories']
+            return repository['name'], target, None if exists else CROSS_REPO_MISSING_FILE_ISSUE
+        if anchor:
+            anchors = repository['anchors'].get(path)
+            if anchors is None:
+                anchors = repository['anchors'][path] = frozenset(repository['files'][path])
+            if anchor not in anchors:
+                return repository['name'], f"{target}#{anchor}", CROSS_REPO_MISSING_ANCHOR_ISSUE
+        return repository['name'], target, None
+
+def check_cross_repo_links(file_path, document, cross_repo):
+    """Check the links of one document that point into other repositories' docs; returns broken link records."""
+    broken = []
+    for link_text, link_url, *_ in document['links']:
+        if not link_url.startswith(('http://', 'https://')):
+            continue
+        checked = cross_repo.check(link_url)
+        if checked is None or checked[2] is None:
+            continue
+        repository, target, issue = checked
+        broken.append({
+            'source_file': file_path,
+            'link_text': link_text,
+            'link_url': link_url,
+            'issue': issue,
+            'target': target,
+            'repository': repository,
+        })
+    return broken
+
+def check_links(docs_path, fix_links=False, cache=None, use_mmap=False, shard=None, manifest=None,
+                rewrite_redirects=False, redirect_report=None, writer=None, cross_repo=None):
+    """
+    Check all internal links in Markdown files.
+
+    Documents are parsed through the document cache if one is given, or
+    scanned with memory-mapped byte patterns when use_mmap is set. With a
+    shard (index, count) only the links of that shard's files are checked;
+    a manifest (see docs_shard.py) supplies the files and anchors of the
+    whole tree so the other shards' files need not be parsed.
+
+    Links through redirect stubs are checked against the stub's final target.
+    If redirect_report is a dict it receives 'redirected_links' and (for
+    unsharded runs) 'orphan_stubs'; with rewrite_redirects those links are
+    rewritten to point at the final target.
+
+    Fixed files are written through writer (an unjournaled FileWriter if None).
+
+    With cross_repo (a CrossRepoIndex) links into other repositories' docs
+    are checked too; --fix never rewrites them.
+    """
+    # Get all Markdown files, interned as path IDs; the same walk lists the other files (images, assets)
+    if manifest is not None:
+        all_files = list(manifest['files'])
+        asset_paths = frozenset(manifest['assets'])
+    else:
+        markdown_files, other_files = list_docs_files(docs_path)
+        all_files = [file_path for file_path, _ in markdown_files]
+        asset_paths = frozenset(file_path for file_path, _ in other_files)
+    paths = PathTable(all_files)
+    check_files = {file_path for file_path in all_files if in_shard(file_path, shard)}
     
-    # Map to store all section headers
-    section_headers = {}
+    # Anchor set per path ID, and the parsed documents for the second pass
+    anchor_sets = [frozenset()] * len(paths)
+    documents = {}
+    stubs = {}
+    if manifest is not None:
+        for file_path, anchors in manifest['files'].items():
+            anchor_sets[paths.get(file_path)] = frozenset(anchors)
+        stubs.update(manifest.get('redirects', {}))
     
-    # First pass: collect all section headers
+    # First pass: parse documents and collect all section headers
     logger.info("Collecting section headers...")
     for file_path in all_files:
+        if manifest is not None and file_path not in check_files:
+            continue
         try:
-            with open(os.path.join(docs_path, file_path), 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find all headers
-            headers = re.findall(r'^(#{1,6})\s+(.+?)$', content, re.MULTILINE)
+            full_path = os.path.join(docs_path, file_path)
+            document = scan_document_mmap(full_path) if use_mmap else load_document(full_path, cache)
+            if file_path in check_files:
+                documents[file_path] = document
+            target = redirect_target(file_path, document)
+            if target is not None:
+                stubs[file_path] = target
             
-            for level, header in headers:
-                # Generate the anchor ID (similar to how GitHub does it)
-                anchor = header.lower()
-                anchor = re.sub(r'[^\w\s-]', '', anchor)  # Remove non-word chars
-                anchor = re.sub(r'\s+', '-', anchor)      # Replace spaces with hyphens
-                
-                section_headers[file_path + '#' + anchor] = header
+            # Anchor IDs are generated like GitHub does it (see markdown_tokens.heading_anchor)
+            if manifest is None:
+                anchor_sets[paths.get(file_path)] = frozenset(document['anchors'])
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
     
+    # Redirect table: every stub resolves to its final target in O(1)
+    redirects = resolve_redirects(stubs)
+    inbound_stub_links = defaultdict(int)
+    resolver = LinkResolver()
+    files_by_name = None  # basename -> paths, built on first use by --fix
+    own_writer = None     # created on the first write if the caller passed no writer
+    
     # Second pass: check all links
     logger.info("Checking internal links...")
     broken_links = []
+    redirected_links = []
     fixed_links = 0
+    rewritten_links = 0
     
-    for file_path in all_files:
+    for file_path, document in documents.items():
         try:
             full_path = os.path.join(docs_path, file_path)
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            links = extract_links(file_path, content)
-            file_has_broken_links = False
+            source_dir = os.path.dirname(file_path)
+            links = extract_links(file_path, document)
+            file_broken_links = []
+            file_redirects = []
             
             for link in links:
-                target_path = resolve_relative_path(file_path, link['base_url'])
+                target_path = resolver.resolve(source_dir, link.base_url)
+                
+                # Follow redirect stubs to their final target
+                issue = None
+                if target_path in redirects:
+                    if file_path not in stubs:
+                        inbound_stub_links[target_path] += 1
+                    final_path, hops = redirects[target_path]
+                    if final_path is None:
+                        issue = 'Redirect loop'
+                    elif paths.get(final_path) < 0:
+                        issue = 'Redirect target not found'
+                    elif file_path not in stubs:  # a stub's own link is part of the redirect table
+                        record = {
+                            'source_file': file_path,
+                            'link_text': link.text,
+                            'link_url': link.url,
+                            'stub': target_path,
+                            'final_target': final_path,
+                            'hops': hops,
+                        }
+                        redirected_links.append(record)
+                        file_redirects.append((link, record))
+                        target_path = final_path
                 
                 # Check if the target file exists
-                file_exists = target_path in all_files_set
+                target_id = paths.get(target_path)
+                file_exists = target_id >= 0 or target_path in asset_paths
                 
-                # Check if the anchor exists (if specified)
+                # Check if the anchor exists (if specified; only Markdown targets have anchors)
                 anchor_exists = True
-                if link['anchor'] and file_exists:
-                    anchor_id = target_path + '#' + link['anchor']
-                    anchor_exists = anchor_id in section_headers
+                if link.anchor and target_id >= 0 and issue is None:
+                    anchor_exists = link.anchor in anchor_sets[target_id]
                 
-                if not file_exists or (link['anchor'] and not anchor_exists):
-                    broken_links.append({
+                if issue is None and (not file_exists or (link.anchor and not anchor_exists)):
+                    issue = 'File not found' if not file_exists else 'Anchor not found'
+                
+                if issue is not None:
+                    file_broken_links.append({
                         'source_file': file_path,
-                        'link_text': link['text'],
-                        'link_url': link['url'],
-                        'issue': 'File not found' if not file_exists else 'Anchor not found',
-                        'target': target_path + (f"#{link['anchor']}" if link['anchor'] else "")
+                        'link_text': link.text,
+                        'link_url': link.url,
+                        'issue': issue,
+                        'target': target_path + (f"#{link.anchor}" if link.anchor else ""),
+                        'target_path': target_path
                     })
-                    file_has_broken_links = True
+            
+            broken_links.extend(file_broken_links)
+            if cross_repo:
+                broken_links.extend(check_cross_repo_links(file_path, document, cross_repo))
+            file_has_broken_links = bool(file_broken_links)
+            
+            if (file_has_broken_links and fix_links) or (file_redirects and rewrite_redirects):
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                new_content = content
+            
+            if file_redirects and rewrite_redirects:
+                # Point links at the final target in the same pass
+                for link, record in file_redirects:
+                    rel_path = os.path.relpath(
+                        os.path.join(docs_path, record['final_target']),
+                        os.path.dirname(full_path)
+                    ).replace('\\', '/')
+                    if link.anchor:
+                        rel_path += '#' + link.anchor
+                    old_link = f"[{link.text}]({link.url})"
+                    new_link = f"[{link.text}]({rel_path})"
+                    if old_link in new_content:
+                        new_content = new_content.replace(old_link, new_link)
+                        rewritten_links += 1
             
             if file_has_broken_links and fix_links:
                 # Attempt to fix broken links
-                new_content = content
-                for link in broken_links:
-                    if link['source_file'] == file_path:
-                        # Simple fix: look for similar files
-                        suggested_targets = []
-                        for existing_file in all_files_set:
-                            if os.path.basename(existing_file) == os.path.basename(link['target']):
-                                suggested_targets.append(existing_file)
+                if files_by_name is None:
+                    files_by_name = defaultdict(list)
+                    for existing_file in paths.paths:
+                        files_by_name[os.path.basename(existing_file)].append(existing_file)
+                for link in file_broken_links:
+                    # Simple fix: look for similar files
+                    suggested_targets = files_by_name.get(os.path.basename(link['target']), [])
+                    
+                    if suggested_targets:
+                        # Use the first suggestion
+                        rel_path = os.path.relpath(
+                            os.path.join(docs_path, suggested_targets[0]), 
+                            os.path.dirname(full_path)
+                        )
+                        # Handle Windows paths
+                        rel_path = rel_path.replace('\\', '/')
                         
-                        if suggested_targets:
-                            # Use the first suggestion
-                            rel_path = os.path.relpath(
-                                os.path.join(docs_path, suggested_targets[0]), 
-                                os.path.dirname(full_path)
-                            )
-                            # Handle Windows paths
-                            rel_path = rel_path.replace('\\', '/')
-                            
-                            old_link = f"[{link['link_text']}]({link['link_url']})"
-                            new_link = f"[{link['link_text']}]({rel_path})"
-                            new_content = new_content.replace(old_link, new_link)
-                            fixed_links += 1
+                        old_link = f"[{link['link_text']}]({link['link_url']})"
+                        new_link = f"[{link['link_text']}]({rel_path})"
+                        new_content = new_content.replace(old_link, new_link)
+                        fixed_links += 1
                 
-                # Write back if changes were made
+            
+            # Write back if changes were made
+            if (file_has_broken_links and fix_links) or (file_redirects and rewrite_redirects):
                 if new_content != content:
-                    with open(full_path, 'w', encoding='utf-8') as f:
-                        f.write(new_content)
+                    if writer is None:
+                        writer = own_writer = FileWriter('fix_broken_links', journal_dir=None)
+                    writer.write(full_path, new_content)
         
         except Exception as e:
             logger.error(f"Error checking links in {file_path}: {str(e)}")
     
+    if own_writer is not None:
+        own_writer.close()
+    
+    # Stubs nothing links to any more can be deleted (needs every document, so unsharded only)
+    orphan_stubs = []
+    if shard is None:
+        orphan_stubs = sorted(stub for stub in stubs if paths.get(stub) >= 0 and not inbound_stub_links[stub])
+    
     # Generate report
     logger.info(f"Found {len(broken_links)} broken links")
     if fix_links:
         logger.info(f"Fixed {fixed_links} links")
+    if redirected_links:
+        logger.info(f"Found {len(redirected_links)} links through redirect stubs")
+        for record in redirected_links:
+            logger.info(f"  {record['source_file']}: {record['link_url']} -> {record['final_target']} "
+                        f"({record['hops']} redirect{'s' if record['hops'] > 1 else ''})")
+    if rewrite_redirects:
+        logger.info(f"Rewrote {rewritten_links} links to their final target")
+    for stub in orphan_stubs:
+        logger.info(f"Redirect stub with no inbound links (safe to delete): {stub}")
+    if redirect_report is not None:
+        redirect_report['redirected_links'] = redirected_links
+        redirect_report['orphan_stubs'] = orphan_stubs
     
     # Print details of broken links
     if broken_links:
@@ -187,11 +600,32 @@ def check_links(docs_path, fix_links=False):
     
     return broken_links
 
+def write_jsonl(broken_links, output):
+    """Write broken link records as JSON Lines to a path or '-' for stdout."""
+    lines = ''.join(json.dumps(link, ensure_ascii=False) + '\n' for link in broken_links)
+    if output == '-':
+        sys.stdout.write(lines)
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(lines)
+
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description='Check for broken internal links in documentation.')
     parser.add_argument('--docs-path', default='src/vv.Domain/Docs', help='Path to documentation directory')
     parser.add_argument('--fix', action='store_true', help='Attempt to fix broken links')
+    parser.add_argument('--rewrite-redirects', action='store_true',
+                        help='Rewrite links through redirect stubs to their final target')
+    parser.add_argument('--cache-dir', help='Reuse parsed documents from this cache directory (see doc_cache.py)')
+    parser.add_argument('--mmap', action='store_true', help='Scan memory-mapped files with byte-level patterns')
+    parser.add_argument('--jsonl', help='Write broken link records as JSON Lines to this path ("-" for stdout)')
+    parser.add_argument('--manifest', help='Resolve links against this file/anchor manifest (see docs_shard.py)')
+    parser.add_argument('--json-output', help='Write results as a mergeable shard result file')
+    parser.add_argument('--external-manifest', action='append', default=[],
+                        help="Check links into another repository against its exported manifest "
+                             "(docs_shard.py manifest --repository); repeatable")
+    add_shard_argument(parser)
+    add_writer_arguments(parser)
     args = parser.parse_args()
     
     docs_path = Path(args.docs_path)
@@ -202,7 +636,30 @@ def main():
         return 1
     
     # Check links
-    broken_links = check_links(docs_path, args.fix)
+    start = time.perf_counter()
+    cache = ParsedDocumentCache(args.cache_dir) if args.cache_dir else None
+    manifest = load_manifest(args.manifest) if args.manifest else None
+    try:
+        cross_repo = CrossRepoIndex.load(args.external_manifest)
+    except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+        logger.error(f"Could not load external manifest: {str(e)}")
+        return 1
+    if cross_repo:
+        logger.info(f"Resolving cross-repo links against {len(cross_repo)} external manifests")
+    writer = writer_from_args('fix_broken_links', args) if args.fix or args.rewrite_redirects else None
+    broken_links = check_links(docs_path, args.fix, cache, args.mmap, args.shard, manifest,
+                               args.rewrite_redirects, writer=writer, cross_repo=cross_repo)
+    if writer is not None:
+        writer.close()
+    if cache is not None:
+        cache.close()
+    duration = time.perf_counter() - start
+    if args.jsonl:
+        write_jsonl(broken_links, args.jsonl)
+    if args.json_output:
+        all_files = list(manifest['files']) if manifest is not None else get_all_markdown_files(docs_path)
+        files_checked = sum(1 for file_path in all_files if in_shard(file_path, args.shard))
+        write_shard_result(args.json_output, 'links', broken_links, files_checked, args.shard, duration)
     
     # Return non-zero exit code if broken links were found
     return 1 if broken_links else 0
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+
+"""
+Frontmatter Migration Engine for VeritasVault Documentation
+
+Schema changes to the documentation frontmatter are expressed as versioned,
+declarative migrations (see MIGRATIONS below) instead of one-off fix scripts:
+
+- RenameField    rename a top-level key, keeping its value and position
+- AddField       add a missing field with a default (a value or a function of the document)
+- RemapValues    replace enum values, in scalars and in lists
+- ListField      turn a scalar into a one-element list
+
+Migrations edit the header line by line: key order, quoting, comments and
+custom fields are kept exactly as written, and a document whose header needs
+no change is not touched at all. Every document is migrated in one pass across
+a worker pool, and the results are written through the journaled writer
+(file_writer.py), so a run can be resumed or rolled back.
+
+The migrations applied to the tree are recorded in a ledger next to the schema
+(.github/workflows/frontmatter-migrations.json); a run applies only the
+migrations newer than the ledger's schema version unless --all is given.
+Migrations are idempotent, so --all is always safe (use it to upgrade
+documents that were added with an old header after a migration ran).
+
+Usage:
+    python frontmatter_migrations.py [--docs-path PATH] [--dry-run] [--all] [--workers N] [--resume]
+    python frontmatter_migrations.py --list
+
+Arguments:
+    --dry-run   Print a unified diff of the changes instead of writing them
+    --all       Re-apply every migration, not just those newer than the ledger
+    --list      Show the migrations and which of them the ledger records as applied
+"""
+
+import os
+import re
+import sys
+import json
+import difflib
+import argparse
+import logging
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+from docs_common import DEFAULT_DOCS_PATH, WORKFLOWS_PATH, atomic_open, iter_markdown_files
+from add_frontmatter import DEFAULT_REVIEWERS, infer_document_type, infer_domains
+from file_writer import add_writer_arguments, writer_from_args
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEDGER_PATH = WORKFLOWS_PATH / 'frontmatter-migrations.json'
+
+KEY_PATTERN = re.compile(r'^([A-Za-z_][\w-]*)[ \t]*:(?=[ \t]|$)')
+
+class Header:
+    """
+    The frontmatter block of a document as editable lines.
+
+    Top-level entries are located by their key line; indented and list
+    continuation lines belong to the entry above them.
+    """
+
+    def __init__(self, lines, newline):
+        self.lines = lines
+        self.newline = newline
+        self._data = None
+
+    @classmethod
+    def parse(cls, content):
+        """Return (header, body offset) for content, or (None, 0) without a frontmatter block."""
+        if not content.startswith('---'):
+            return None, 0
+        lines = content.split('\n')
+        if lines[0].rstrip() != '---':
+            return None, 0
+        for index in range(1, len(lines)):
+            if lines[index].rstrip() == '---':
+                newline = '\r\n' if lines[0].endswith('\r') else '\n'
+                header_lines = [line[:-1] if line.endswith('\r') else line for line in lines[1:index]]
+                body_offset = sum(len(line) + 1 for line in lines[:index])
+                return cls(header_lines, newline), body_offset
+        return None, 0
+
+    def render(self):
+        nl = self.newline
+        return f"---{nl}" + ''.join(line + nl for line in self.lines)
+
+    @property
+    def data(self):
+        """The parsed YAML mapping (re-parsed after each edit); raises yaml.YAMLError."""
+        if self._data is None:
+            data = yaml.safe_load('\n'.join(self.lines)) or {}
+            if not isinstance(data, dict):
+                raise yaml.YAMLError('frontmatter is not a mapping')
+            self._data = data
+        return self._data
+
+    def entry(self, key):
+        """Return (start, end) line indexes of a top-level key, or None."""
+        for index, line in enumerate(self.lines):
+            match = KEY_PATTERN.match(line)
+            if match and match.group(1) == key:
+                end = index + 1
+                while end < len(self.lines) and self.lines[end][:1] in (' ', '\t', '-') \
+                        and not self.lines[end].startswith('---'):
+                    end += 1
+                return index, end
+        return None
+
+    def replace(self, start, end, new_lines):
+        self.lines[start:end] = new_lines
+        self._data = None
+
+    def insert(self, key, value, after=None):
+        """Add key (rendered in the block style of the corpus) after the entry for 'after', or at the end."""
+        rendered = yaml.safe_dump({key: value}, default_flow_style=False, sort_keys=False,
+                                  allow_unicode=True).rstrip('\n').split('\n')
+        position = len(self.lines)
+        if after is not None:
+            span = self.entry(after)
+            if span is not None:
+                position = span[1]
+        self.replace(position, position, rendered)
+
+class Migration:
+    """Base class: a versioned change applied to one header at a time."""
+
+    def __init__(self, version, name):
+        self.version = version
+        self.name = name
+
+    def apply(self, header, path, today):
+        """Edit header in place; returns True if it changed."""
+        raise NotImplementedError
+
+class RenameField(Migration):
+    """Rename a top-level key; left alone if the new key already exists."""
+
+    def __init__(self, version, old, new):
+        super().__init__(version, f"rename {old} to {new}")
+        self.old = old
+        self.new = new
+
+    def apply(self, header, path, today):
+        span = header.entry(self.old)
+        if span is None or header.entry(self.new) is not None:
+            return False
+        line = header.lines[span[0]]
+        header.replace(span[0], span[0] + 1, [self.new + line[len(self.old):]])
+        return True
+
+class AddField(Migration):
+    """Add a field when missing; default is a value or a function(path, frontmatter, today)."""
+
+    def __init__(self, version, field, default, after=None):
+        super().__init__(version, f"add {field}")
+        self.field = field
+        self.default = default
+        self.after = after
+
+    def apply(self, header, path, today):
+        if self.field in header.data:
+            return False
+        value = self.default(path, header.data, today) if callable(self.default) else self.default
+        header.insert(self.field, value, self.after)
+        return True
+
+class RemapValues(Migration):
+    """Replace enum values of a field, whether it holds a scalar or a list."""
+
+    def __init__(self, version, field, mapping):
+        super().__init__(version, f"remap {field} values")
+        self.field = field
+        self.mapping = mapping
+        alternatives = '|'.join(re.escape(old) for old in sorted(mapping, key=len, reverse=True))
+        # A whole scalar or list item, optionally quoted
+        self.pattern = re.compile(r'(?<![^\s\[,])(["\']?)(' + alternatives + r')\1(?=\s*(?:,|\]|#|$))')
+
+    def apply(self, header, path, today):
+        value = header.data.get(self.field)
+        values = value if isinstance(value, list) else [value]
+        if not any(isinstance(item, str) and item in self.mapping for item in values):
+            return False
+        start, end = header.entry(self.field)
+        first = header.lines[start]
+        key_length = KEY_PATTERN.match(first).end()
+        new_lines = [first[:key_length] + self.pattern.sub(self._substitute, first[key_length:])]
+        new_lines += [self.pattern.sub(self._substitute, line) for line in header.lines[start + 1:end]]
+        header.replace(start, end, new_lines)
+        return True
+
+    def _substitute(self, match):
+        quote = match.group(1)
+        return f"{quote}{self.mapping[match.group(2)]}{quote}"
+
+class ListField(Migration):
+    """Turn a scalar value into a one-element flow list (``key: value`` -> ``key: [value]``)."""
+
+    def __init__(self, version, field):
+        super().__init__(version, f"make {field} a list")
+        self.field = field
+
+    def apply(self, header, path, today):
+        value = header.data.get(self.field)
+        if value is None or isinstance(value, (list, dict)):
+            return False
+        start, end = header.entry(self.field)
+        if end - start > 1:
+            return False  # multi-line scalars are left for a human
+        line = header.lines[start]
+        key_length = KEY_PATTERN.match(line).end()
+        scalar, _, comment = line[key_length:].partition(' #')
+        new_line = f"{line[:key_length]} [{scalar.strip()}]" + (f" #{comment}" if comment else '')
+        header.replace(start, end, [new_line])
+        return True
+
+def _last_updated(path, frontmatter, today):
+    """The document's date: its last content change in git, or today (see run_migrations)."""
+    return today.strftime('%Y-%m-%d')
+
+def _next_review(path, frontmatter, today):
+    """A year after last_updated, or after today if that is missing or not a date."""
+    last_updated = frontmatter.get('last_updated')
+    try:
+        base = datetime.strptime(str(last_updated), '%Y-%m-%d')
+    except ValueError:
+        base = today
+    return (base + timedelta(days=365)).strftime('%Y-%m-%d')
+
+# Versioned migrations, oldest first. Append new ones; never renumber or edit applied ones.
+MIGRATIONS = [
+    RenameField(1, 'type', 'document_type'),
+    RenameField(2, 'domains', 'applies_to'),
+    AddField(3, 'document_type', lambda path, frontmatter, today: infer_document_type(path)),
+    AddField(4, 'classification', 'internal', after='document_type'),
+    AddField(5, 'status', 'draft', after='classification'),
+    AddField(6, 'version', '0.1.0', after='status'),
+    AddField(7, 'last_updated', _last_updated, after='version'),
+    AddField(8, 'applies_to', lambda path, frontmatter, today: infer_domains(path), after='last_updated'),
+    AddField(9, 'reviewers', DEFAULT_REVIEWERS, after='applies_to'),
+    AddField(10, 'priority', 'p2', after='reviewers'),
+    AddField(11, 'next_review', _next_review, after='priority'),
+    RemapValues(12, 'status', {'in-review': 'review', 'deprecated': 'archived'}),
+    ListField(13, 'applies_to'),
+    ListField(14, 'reviewers'),
+]
+
+def migrate_content(path, content, migrations, today):
+    """
+    Apply migrations to a document's header.
+
+    Returns (new_content, applied versions); content is returned unchanged when
+    the document has no frontmatter or no migration applies.
+    """
+    header, body_offset = Header.parse(content)
+    if header is None:
+        return content, []
+    applied = [migration.version for migration in migrations if migration.apply(header, path, today)]
+    if not applied:
+        return content, []
+    return header.render() + content[body_offset:], applied
+
+def _migrate_file_task(args):
+    """Worker entry point (module-level so it can be pickled)."""
+    rel_path, full_path, versions, today, dry_run = args
+    migrations = [migration for migration in MIGRATIONS if migration.version in versions]
+    result = {'path': full_path, 'applied': [], 'content': None, 'diff': '', 'error': None}
+    try:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content, result['applied'] = migrate_content(rel_path, content, migrations, today)
+    except (IOError, UnicodeDecodeError) as e:
+        result['error'] = str(e)
+        return result
+    except yaml.YAMLError as e:
+        mark = getattr(e, 'problem_mark', None)
+        result['error'] = f"invalid frontmatter: {getattr(e, 'problem', None) or e}" + \
+            (f" (header line {mark.line + 1})" if mark is not None else '')
+        return result
+    if result['applied']:
+        if dry_run:
+            result['diff'] = ''.join(difflib.unified_diff(
+                content.splitlines(keepends=True), new_content.splitlines(keepends=True),
+                fromfile=f"a/{full_path}", tofile=f"b/{full_path}"))
+        else:
+            result['content'] = new_content
+    return result
+
+def run_migrations(docs_path, migrations, dry_run=False, workers=None, writer=None):
+    """
+    Migrate every document under docs_path in one parallel pass.
+
+    Each document's date (the 'today' of the migrations) is its last content
+    change in git, as in add_frontmatter.py, falling back to today for files
+    that are not committed yet.
+
+    Returns ({version: files changed}, errors) where errors is [(path, message)].
+    """
+    from doc_history import last_change_dates
+    history = last_change_dates(docs_path)
+    today = datetime.now()
+    versions = [migration.version for migration in migrations]
+    tasks = []
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        if writer is not None and writer.is_done(full_path):
+            continue
+        changed = history.get(os.path.realpath(full_path))
+        tasks.append((rel_path, full_path, versions,
+                      datetime.strptime(changed, '%Y-%m-%d') if changed else today, dry_run))
+    changed = {version: 0 for version in versions}
+    errors = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() preserves input order, so output is deterministic across runs
+        for result in executor.map(_migrate_file_task, tasks, chunksize=16):
+            if result['error']:
+                errors.append((result['path'], result['error']))
+                continue
+            for version in result['applied']:
+                changed[version] += 1
+            if result['diff']:
+                sys.stdout.write(result['diff'])
+            if result['content'] is not None:
+                writer.write(result['path'], result['content'])
+    return changed, errors
+
+def load_ledger(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'schema_version': 0, 'applied': []}
+
+def save_ledger(ledger, path):
+    with atomic_open(path) as f:
+        json.dump(ledger, f, indent=2)
+        f.write('\n')
+
+def record_migrations(ledger, migrations, changed, today):
+    """
+    Record a successful run in the ledger: one entry per migration version, so
+    --all reruns update the existing entries instead of adding duplicates.
+    """
+    entries = {entry['version']: entry for entry in ledger['applied']}
+    for migration in migrations:
+        entry = entries.get(migration.version)
+        if entry is None:
+            entries[migration.version] = {'version': migration.version, 'name': migration.name,
+                                          'applied_on': today, 'files_changed': changed[migration.version]}
+        elif changed[migration.version]:
+            entry['applied_on'] = today
+            entry['files_changed'] += changed[migration.version]
+    ledger['applied'] = [entries[version] for version in sorted(entries)]
+    ledger['schema_version'] = max(ledger['schema_version'], MIGRATIONS[-1].version)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Apply versioned frontmatter migrations to the documentation.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--ledger', default=str(DEFAULT_LEDGER_PATH), help='Applied-migrations ledger')
+    parser.add_argument('--dry-run', action='store_true', help='Show a diff of the changes without writing them')
+    parser.add_argument('--all', action='store_true', help='Re-apply every migration')
+    parser.add_argument('--list', action='store_true', help='List migrations and exit')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes')
+    add_writer_arguments(parser)
+    args = parser.parse_args()
+
+    ledger = load_ledger(args.ledger)
+    if args.list:
+        for migration in MIGRATIONS:
+            state = 'applied' if migration.version <= ledger['schema_version'] else 'pending'
+            print(f"{migration.version:4d}  {state:<8} {migration.name}")
+        return 0
+
+    if not os.path.isdir(args.docs_path):
+        logger.error(f"Documentation directory not found: {args.docs_path}")
+        return 1
+
+    migrations = MIGRATIONS if args.all else [migration for migration in MIGRATIONS
+                                              if migration.version > ledger['schema_version']]
+    if not migrations:
+        logger.info(f"Frontmatter is at schema version {ledger['schema_version']}; no pending migrations")
+        return 0
+
+    if args.dry_run:
+        changed, errors = run_migrations(args.docs_path, migrations, True, args.workers)
+    else:
+        with writer_from_args('frontmatter_migrations', args) as writer:
+            changed, errors = run_migrations(args.docs_path, migrations, False, args.workers, writer)
+
+    for path, error in errors:
+        logger.error(f"Skipped {path}: {error}")
+    for migration in migrations:
+        logger.info(f"{migration.version:4d}  {migration.name}: "
+                    f"{changed[migration.version]} files {'to change' if args.dry_run else 'changed'}")
+
+    if args.dry_run:
+        return 1 if errors else 0
+    if errors:
+        # The skipped documents still need these migrations, so the ledger must not claim them
+        logger.error(f"{len(errors)} documents could not be migrated; ledger left at schema version "
+                     f"{ledger['schema_version']}. Fix them and run again.")
+        return 1
+
+    record_migrations(ledger, migrations, changed, datetime.now().strftime('%Y-%m-%d'))
+    save_ledger(ledger, args.ledger)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+
+"""
+Columnar Frontmatter Store for VeritasVault Documentation
+
+Loads every document's frontmatter into column arrays so questions such as
+"all p0 drafts in Risk whose next_review has passed" are answered without
+reading the documentation tree:
+
+    status, priority, document_type, classification   dictionary-encoded (array of codes)
+    last_updated, next_review                         date ordinals (0 = missing/invalid)
+    applies_to, reviewers                             bitsets over a value dictionary
+    placeholder                                       'true' for generated placeholder documents
+
+The store is saved as a single compressed file. Refreshing it re-reads only
+files whose size or modification time changed, and re-parses only those whose
+content hash changed; the columns are then rebuilt from the per-row values.
+
+Usage:
+    python frontmatter_store.py build [--docs-path PATH] [--store PATH]
+    python frontmatter_store.py query [--where EXPR ...] [--group-by FIELD] [--count] [--refresh]
+
+Filter expressions (repeat --where to AND them):
+    priority=p0                 enum equality; comma-separated values match any
+    status!=approved            enum inequality
+    next_review<today           date comparison (<, <=, >, >=, =) against YYYY-MM-DD or 'today'
+    applies_to~Risk             set membership (applies_to, reviewers)
+    path~Domains/Risk/          path substring
+    placeholder=true            documents created by generate_placeholders.py
+
+Example:
+    python frontmatter_store.py query --where priority=p0 --where status=draft \\
+        --where applies_to~Risk --where "next_review<today"
+"""
+
+import os
+import re
+import sys
+import zlib
+import time
+import marshal
+import argparse
+import logging
+from array import array
+from collections import Counter
+from datetime import date
+
+import yaml
+
+from docs_common import DEFAULT_DOCS_PATH, atomic_open, refresh_entries
+from docs_walk import walk_files
+from generate_placeholders import PLACEHOLDER_MARKER
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = '.docs-cache/frontmatter.store'
+STORE_VERSION = 2
+MAGIC = b'VVFS'
+
+ENUM_FIELDS = ('status', 'priority', 'document_type', 'classification', 'placeholder')
+DATE_FIELDS = ('last_updated', 'next_review')
+SET_FIELDS = ('applies_to', 'reviewers')
+FIELDS = ENUM_FIELDS + DATE_FIELDS + SET_FIELDS
+
+FILTER_PATTERN = re.compile(r'^(\w+)\s*(<=|>=|!=|=|<|>|~)\s*(.*)$')
+
+def parse_frontmatter(content):
+    """Return the frontmatter mapping of a document, or {}."""
+    tokens = mt.tokenize(content)
+    if not tokens or tokens[0].kind != mt.FRONTMATTER:
+        return {}
+    try:
+        frontmatter = yaml.safe_load(tokens[0].info)
+    except yaml.YAMLError:
+        return {}
+    return frontmatter if isinstance(frontmatter, dict) else {}
+
+def date_ordinal(value):
+    """Date ordinal for a YAML date or ISO string; 0 if missing or invalid."""
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return 0
+
+def row_values(frontmatter, placeholder=False):
+    """Normalise the stored fields of one document to plain values."""
+    row = {}
+    for field in ENUM_FIELDS:
+        value = frontmatter.get(field)
+        row[field] = None if value is None else str(value)
+    row['placeholder'] = 'true' if placeholder else 'false'
+    for field in DATE_FIELDS:
+        row[field] = date_ordinal(frontmatter.get(field))
+    for field in SET_FIELDS:
+        value = frontmatter.get(field)
+        if value is None:
+            value = []
+        elif not isinstance(value, list):
+            value = [value]
+        row[field] = sorted({str(item) for item in value})
+    return row
+
+def parse_row(data):
+    """Row values of one document's raw bytes (the values of its refresh entry)."""
+    content = data.decode('utf-8', errors='replace')
+    return [row_values(parse_frontmatter(content), PLACEHOLDER_MARKER in content)]
+
+class FrontmatterStore:
+    """Column arrays over all documents plus the per-row data needed for refreshes."""
+
+    def __init__(self):
+        self.paths = []
+        self.rows = []        # [(size, mtime_ns, content hash, row values)]
+        self.dictionaries = {field: [None] for field in ENUM_FIELDS}
+        self.dictionaries.update({field: [] for field in SET_FIELDS})
+        self.columns = {}
+
+    def refresh(self, docs_path):
+        """Bring the store up to date with docs_path; returns (parsed, reused, changed)."""
+        entries, parsed, reused = refresh_entries(walk_files(docs_path, include=('*.md',)),
+                                                  dict(zip(self.paths, self.rows)), parse_row)
+        paths = list(entries)
+        rows = [tuple(entry) for entry in entries.values()]
+        changed = paths != self.paths or rows != self.rows
+        self.paths, self.rows = paths, rows
+        self.build_columns()
+        return parsed, reused, changed
+
+    def build_columns(self):
+        """Encode the row values into dictionary, ordinal and bitset columns."""
+        self.dictionaries = {field: [None] for field in ENUM_FIELDS}
+        self.dictionaries.update({field: [] for field in SET_FIELDS})
+        codes = {field: {None: 0} for field in ENUM_FIELDS}
+        codes.update({field: {} for field in SET_FIELDS})
+        columns = {field: array('H') for field in ENUM_FIELDS}
+        columns.update({field: array('i') for field in DATE_FIELDS})
+        columns.update({field: [] for field in SET_FIELDS})
+
+        for _, _, _, values in self.rows:
+            for field in ENUM_FIELDS:
+                value = values[field]
+                code = codes[field].get(value)
+                if code is None:
+                    code = codes[field][value] = len(self.dictionaries[field])
+                    self.dictionaries[field].append(value)
+                columns[field].append(code)
+            for field in DATE_FIELDS:
+                columns[field].append(values[field])
+            for field in SET_FIELDS:
+                bits = 0
+                for item in values[field]:
+                    bit = codes[field].get(item)
+                    if bit is None:
+                        bit = codes[field][item] = len(self.dictionaries[field])
+                        self.dictionaries[field].append(item)
+                    bits |= 1 << bit
+                columns[field].append(bits)
+        self.columns = columns
+
+    def save(self, path):
+        payload = {
+            'paths': self.paths,
+            'rows': [(size, mtime, key, values) for size, mtime, key, values in self.rows],
+            'dictionaries': self.dictionaries,
+            'columns': {field: column.tobytes() if isinstance(column, array) else column
+                        for field, column in self.columns.items()},
+        }
+        with atomic_open(path, 'wb') as f:
+            f.write(MAGIC + bytes([STORE_VERSION]) + zlib.compress(marshal.dumps(payload), 6))
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved store; returns an empty store if missing or outdated."""
+        store = cls()
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return store
+        if data[:4] != MAGIC or data[4:5] != bytes([STORE_VERSION]):
+            return store
+        payload = marshal.loads(zlib.decompress(data[5:]))
+        store.paths = payload['paths']
+        store.rows = payload['rows']
+        store.dictionaries = payload['dictionaries']
+        for field, column in payload['columns'].items():
+            if field in ENUM_FIELDS:
+                store.columns[field] = array('H', column)
+            elif field in DATE_FIELDS:
+                store.columns[field] = array('i', column)
+            else:
+                store.columns[field] = column
+        return store
+
+    def value(self, field, row):
+        """Decoded value of one cell (for output and grouping)."""
+        if field == 'path':
+            return self.paths[row]
+        column = self.columns[field][row]
+        if field in ENUM_FIELDS:
+            return self.dictionaries[field][column]
+        if field in DATE_FIELDS:
+            return date.fromordinal(column).isoformat() if column else None
+        return [item for bit, item in enumerate(self.dictionaries[field]) if column >> bit & 1]
+
+    def select(self, filters):
+        """Return the row numbers matching all (field, op, value) filters."""
+        rows = range(len(self.paths))
+        for field, op, value in filters:
+            rows = [row for row in rows if self._predicate(field, op, value)(row)]
+        return list(rows)
+
+    def _predicate(self, field, op, value):
+        """Compile one filter into a row predicate working on encoded values."""
+        if field == 'path':
+            if op != '~':
+                raise ValueError("path only supports '~' (substring)")
+            return lambda row: value in self.paths[row]
+
+        column = self.columns.get(field)
+        if column is None:
+            raise ValueError(f"Unknown field '{field}'; expected one of: path, {', '.join(FIELDS)}")
+
+        if field in ENUM_FIELDS:
+            if op not in ('=', '!='):
+                raise ValueError(f"{field} only supports '=' and '!='")
+            wanted = {code for code, item in enumerate(self.dictionaries[field])
+                      if item in value.split(',') or (item is None and value == '')}
+            if op == '=':
+                return lambda row: column[row] in wanted
+            return lambda row: column[row] not in wanted
+
+        if field in DATE_FIELDS:
+            target = date.today().toordinal() if value == 'today' else date_ordinal(value)
+            if not target:
+                raise ValueError(f"Invalid date '{value}' for {field}")
+            compare = {
+                '<': lambda x: 0 < x < target,
+                '<=': lambda x: 0 < x <= target,
+                '>': lambda x: x > target,
+                '>=': lambda x: x >= target,
+                '=': lambda x: x == target,
+                '!=': lambda x: x != target,
+            }.get(op)
+            if compare is None:
+                raise ValueError(f"{field} does not support '{op}'")
+            return lambda row: compare(column[row])
+
+        if op != '~':
+            raise ValueError(f"{field} only supports '~' (contains)")
+        mask = 0
+        for item in value.split(','):
+            if item in self.dictionaries[field]:
+                mask |= 1 << self.dictionaries[field].index(item)
+        return lambda row: column[row] & mask != 0
+
+def parse_filter(expression):
+    """Parse 'field<op>value' into (field, op, value); raises argparse.ArgumentTypeError."""
+    match = FILTER_PATTERN.match(expression.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Filter must look like field=value, got: {expression}")
+    return match.group(1), match.group(2), match.group(3).strip()
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Build and query the columnar frontmatter store.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build or incrementally refresh the store')
+    build_parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    build_parser.add_argument('--store', default=DEFAULT_STORE_PATH, help='Store file')
+
+    query_parser = subparsers.add_parser('query', help='Filter, group and count documents')
+    query_parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    query_parser.add_argument('--store', default=DEFAULT_STORE_PATH, help='Store file')
+    query_parser.add_argument('--where', action='append', type=parse_filter, default=[],
+                              help='Filter expression (repeatable, combined with AND)')
+    query_parser.add_argument('--group-by', choices=('path',) + FIELDS, help='Group matches by a field')
+    query_parser.add_argument('--count', action='store_true', help='Only print the number of matches')
+    query_parser.add_argument('--fields', default='status,priority,next_review',
+                              help='Comma-separated fields to print for each match')
+    query_parser.add_argument('--refresh', action='store_true', help='Refresh the store before querying')
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.docs_path) and (args.command == 'build' or args.refresh):
+        logger.error(f"Documentation directory not found: {args.docs_path}")
+        return 1
+
+    start = time.perf_counter()
+    store = FrontmatterStore.load(args.store)
+    if args.command == 'build' or args.refresh:
+        parsed, reused, changed = store.refresh(args.docs_path)
+        if changed or not os.path.exists(args.store):
+            store.save(args.store)
+        if args.command == 'build':
+            logger.info(f"Stored frontmatter of {len(store.paths)} documents "
+                        f"({parsed} parsed, {reused} unchanged) in {time.perf_counter() - start:.2f}s")
+            return 0
+    elif not store.paths:
+        logger.error(f"No frontmatter store at {args.store}; run 'frontmatter_store.py build' first")
+        return 1
+
+    try:
+        rows = store.select(args.where)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    if args.group_by:
+        groups = Counter()
+        for row in rows:
+            value = store.value(args.group_by, row)
+            for key in (value if isinstance(value, list) else [value]) or [None]:
+                groups[key] += 1
+        for key, count in sorted(groups.items(), key=lambda item: (-item[1], str(item[0]))):
+            print(f"{count:6d}  {key if key is not None else '(none)'}")
+    elif args.count:
+        print(len(rows))
+    else:
+        fields = [field.strip() for field in args.fields.split(',') if field.strip()]
+        unknown = [field for field in fields if field != 'path' and field not in FIELDS]
+        if unknown:
+            logger.error(f"Unknown fields: {', '.join(unknown)}")
+            return 1
+        for row in rows:
+            values = []
+            for field in fields:
+                value = store.value(field, row)
+                values.append(','.join(value) if isinstance(value, list) else str(value if value is not None else '-'))
+            print('\t'.join([store.paths[row]] + values))
+    logger.info(f"{len(rows)} of {len(store.paths)} documents matched in {(time.perf_counter() - start) * 1000:.1f}ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+"""
+Navigation Generator for VeritasVault Documentation
+
+Keeps NAVIGATION.md and the per-directory index.md pages in step with the
+documentation tree. Each page carries a generated block between marker
+comments; everything outside the markers stays hand-written. The block lists
+the documents (title, document_type, priority, status) and subdirectories of
+the page's directory; the block in NAVIGATION.md covers the whole tree.
+
+To keep reruns cheap, the generator hashes the tree bottom-up: a directory's
+hash covers the content hashes of its Markdown files, which index pages it
+has, and the hashes of its subdirectories. The index pages' contents are left
+out, so writing them does not invalidate the tree, but adding one does, since
+the parent page links to it. Only pages whose subtree hash differs from the
+last run, or whose file was edited since, are regenerated. Pages are written
+through file_writer.py, so a page is only written when its text changes.
+
+Usage:
+    python generate_navigation.py [--docs-path PATH] [--state PATH] [--adopt] [--create-missing] [--dry-run]
+                                  [--force] [--resume]
+
+Arguments:
+    --adopt           Append a generated block to existing index pages that lack one
+    --create-missing  Create index.md for directories that have documents but no index page
+    --dry-run         Report the pages that would change without writing them
+    --force           Ignore the saved hash tree and regenerate every page
+    --resume          Continue the journal of an interrupted run
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from docs_common import DEFAULT_DOCS_PATH, content_hash
+from docs_walk import walk_files
+from doc_cache import ParsedDocumentCache, load_document
+from file_writer import FileWriter, add_writer_arguments, writer_from_args
+from add_frontmatter import DEFAULT_REVIEWERS
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = '.docs-cache/navigation.json'
+NAVIGATION_PAGE = 'NAVIGATION.md'
+INDEX_PAGE = 'index.md'
+INDEX_PAGES = (NAVIGATION_PAGE, INDEX_PAGE)
+
+BEGIN_MARKER = '<!-- BEGIN GENERATED INDEX (scripts/generate_navigation.py) - edits inside will be overwritten -->'
+END_MARKER = '<!-- END GENERATED INDEX -->'
+
+# Status indicators for the frontmatter schema's status values, as in the NAVIGATION.md legend
+STATUS_ICONS = {
+    'approved': '✅',
+    'review': '🟡',
+    'draft': '📝',
+    'archived': '⚠️',
+}
+
+class DirectoryNode:
+    """One directory of the docs tree with its Markdown files and subtree hash."""
+
+    def __init__(self, rel_path):
+        self.rel_path = rel_path   # '' for the docs root
+        self.files = []            # [(name, full path)] excluding index pages
+        self.pages = {}            # index page name -> full path
+        self.children = []         # [DirectoryNode]
+        self.tree_hash = None
+
+    def document_count(self):
+        return len(self.files) + sum(child.document_count() for child in self.children)
+
+def directory_node(nodes, rel_dir):
+    """Return the node for rel_dir, creating it (and its parents) on first use."""
+    node = nodes.get(rel_dir)
+    if node is None:
+        node = nodes[rel_dir] = DirectoryNode(rel_dir)
+        directory_node(nodes, rel_dir.rpartition('/')[0]).children.append(node)
+    return node
+
+def hash_tree(node, docs_path, create_missing=False):
+    """Drop subdirectories without documents and compute the node's subtree hash."""
+    node.children = [child for child in node.children if child.document_count()]
+    if create_missing and node.rel_path:
+        node.pages.setdefault(INDEX_PAGE, os.path.join(docs_path, node.rel_path, INDEX_PAGE))
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(node.pages):
+        digest.update(f"P{name}\n".encode('utf-8'))
+    for name, full_path in node.files:
+        with open(full_path, 'rb') as f:
+            digest.update(f"F{name}\0{content_hash(f.read())}\n".encode('utf-8'))
+    for child in node.children:
+        hash_tree(child, docs_path, create_missing)
+        digest.update(f"D{child.rel_path.rsplit('/', 1)[-1]}\0{child.tree_hash}\n".encode('utf-8'))
+    node.tree_hash = digest.hexdigest()
+
+def scan_tree(docs_path, create_missing=False):
+    """
+    Walk the docs tree once and compute per-directory hashes bottom-up.
+
+    With create_missing, every directory with documents but no index page is
+    given one up front, so parent pages already link to the pages to be created.
+    """
+    nodes = {'': DirectoryNode('')}
+    for rel_path, entry in walk_files(docs_path, include=('*.md',)):
+        rel_dir, _, name = rel_path.rpartition('/')
+        node = directory_node(nodes, rel_dir)
+        if name in INDEX_PAGES:
+            node.pages[name] = entry.path
+        else:
+            node.files.append((name, entry.path))
+    root = nodes['']
+    hash_tree(root, docs_path, create_missing)
+    return root
+
+def iter_nodes(node):
+    yield node
+    for child in node.children:
+        yield from iter_nodes(child)
+
+def document_entry(name, full_path, cache=None):
+    """Return (title, document_type, priority, status) for one document."""
+    document = load_document(full_path, cache)
+    frontmatter = document['frontmatter'] if isinstance(document['frontmatter'], dict) else {}
+    titles = [title for level, title, *_ in document['headings'] if level == 1]
+    title = titles[0] if titles else frontmatter.get('title') or os.path.splitext(name)[0]
+    return (str(title).strip(), frontmatter.get('document_type', ''),
+            frontmatter.get('priority', ''), frontmatter.get('status', ''))
+
+def status_label(status):
+    icon = STATUS_ICONS.get(status)
+    return f"{icon} {status}" if icon else str(status)
+
+def document_table(rows):
+    """Render [(link, title, document_type, priority, status)] as a Markdown table."""
+    lines = ["| Document | Type | Priority | Status |", "|----------|------|----------|--------|"]
+    for link, title, document_type, priority, status in rows:
+        title = title.replace('|', '\\|')
+        lines.append(f"| [{title}]({link}) | {document_type} | {priority} | {status_label(status)} |")
+    return lines
+
+def directory_link(child, from_dir):
+    """Link to a subdirectory's index page or README.md; None if it has neither."""
+    if INDEX_PAGE in child.pages:
+        target = f"{child.rel_path}/{INDEX_PAGE}"
+    elif any(name == 'README.md' for name, _ in child.files):
+        target = f"{child.rel_path}/README.md"
+    else:
+        return None
+    return os.path.relpath(target, from_dir or '.').replace(os.sep, '/')
+
+def render_index_block(node, cache=None):
+    """Generated block for a directory's index.md: its documents and subdirectories."""
+    lines = [BEGIN_MARKER, "", "## Contents", ""]
+    if node.files:
+        rows = [(f"./{name}", *document_entry(name, full_path, cache)) for name, full_path in node.files]
+        lines += document_table(rows) + [""]
+    if node.children:
+        lines += ["### Subdirectories", ""]
+        for child in node.children:
+            name = child.rel_path.rsplit('/', 1)[-1]
+            link = directory_link(child, node.rel_path)
+            label = f"[{name}/](./{link})" if link else f"{name}/"
+            lines.append(f"- {label} – {child.document_count()} documents")
+        lines.append("")
+    lines.append(END_MARKER)
+    return '\n'.join(lines)
+
+def render_navigation_block(root, cache=None):
+    """Generated block for NAVIGATION.md: every document, grouped by directory."""
+    lines = [BEGIN_MARKER, "", "## Generated Document Index", ""]
+    for node in iter_nodes(root):
+        if not node.files:
+            continue
+        lines += [f"### {node.rel_path or 'Docs root'}", ""]
+        prefix = f"{node.rel_path}/" if node.rel_path else ""
+        rows = [(f"{prefix}{name}", *document_entry(name, full_path, cache)) for name, full_path in node.files]
+        lines += document_table(rows) + [""]
+    lines.append(END_MARKER)
+    return '\n'.join(lines)
+
+def replace_block(content, block):
+    """Replace the generated block in content, or None if the page has no markers."""
+    start = content.find(BEGIN_MARKER)
+    end = content.find(END_MARKER, start)
+    if start == -1 or end == -1:
+        return None
+    return content[:start] + block + content[end + len(END_MARKER):]
+
+def new_index_page(node):
+    """Skeleton for a newly created index.md (frontmatter as in NAVIGATION.md)."""
+    today = datetime.now()
+    name = node.rel_path.rsplit('/', 1)[-1] if node.rel_path else 'Documentation'
+    title = name.replace('-', ' ').replace('_', ' ').title()
+    return (
+        "---\n"
+        "document_type: navigation-index\n"
+        "classification: internal\n"
+        "status: draft\n"
+        "version: 0.1.0\n"
+        f"last_updated: \"{today.strftime('%Y-%m-%d')}\"\n"
+        "applies_to: [platform-wide]\n"
+        f"reviewers: {json.dumps(DEFAULT_REVIEWERS)}\n"
+        f"next_review: \"{(today + timedelta(days=365)).strftime('%Y-%m-%d')}\"\n"
+        "priority: p2\n"
+        "---\n\n"
+        f"# {title}\n\n"
+        f"{BEGIN_MARKER}\n{END_MARKER}\n"
+    )
+
+def load_state(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_state(state, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+
+def generate_navigation(docs_path, state, adopt=False, create_missing=False, dry_run=False, force=False,
+                        cache=None, writer=None):
+    """
+    Regenerate the index pages whose subtree changed, writing them through
+    writer (an unjournaled FileWriter if None).
+
+    Returns (written, skipped, new_state): page paths written (or that would be
+    written in dry-run mode), the number of pages skipped as unchanged, and the
+    hash tree to save for the next run.
+    """
+    if writer is None and not dry_run:
+        with FileWriter('generate_navigation', journal_dir=None) as writer:
+            return generate_navigation(docs_path, state, adopt, create_missing, dry_run, force, cache, writer)
+
+    root = scan_tree(docs_path, create_missing)
+    new_state = {}
+    written = []
+    skipped = 0
+
+    for node in iter_nodes(root):
+        for page in INDEX_PAGES:
+            if page == NAVIGATION_PAGE and node is not root:
+                continue
+            page_path = node.pages.get(page)
+            if page_path is None:
+                continue
+            key = f"{node.rel_path}/{page}" if node.rel_path else page
+            if os.path.exists(page_path):
+                with open(page_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            else:
+                content = new_index_page(node)
+
+            has_block = BEGIN_MARKER in content and END_MARKER in content
+            if not has_block and not adopt:
+                continue
+
+            previous = state.get(key)
+            if not force and previous == [node.tree_hash, content_hash(content)]:
+                new_state[key] = previous
+                skipped += 1
+                continue
+
+            if page == NAVIGATION_PAGE:
+                block = render_navigation_block(root, cache)
+            else:
+                block = render_index_block(node, cache)
+            updated = replace_block(content, block)
+            if updated is None:
+                updated = content.rstrip('\n') + '\n\n' + block + '\n'
+
+            if updated != content or not os.path.exists(page_path):
+                written.append(page_path)
+                if not dry_run:
+                    writer.write(page_path, updated)
+            new_state[key] = [node.tree_hash, content_hash(updated)]
+
+    return written, skipped, new_state
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Generate NAVIGATION.md and per-directory index.md pages.')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--state', default=DEFAULT_STATE_PATH, help='Saved directory hash tree')
+    parser.add_argument('--cache-dir', help='Parsed-document cache directory (see doc_cache.py)')
+    parser.add_argument('--adopt', action='store_true', help='Add a generated block to index pages without one')
+    parser.add_argument('--create-missing', action='store_true', help='Create missing index.md pages')
+    parser.add_argument('--dry-run', action='store_true', help='Only report pages that would change')
+    parser.add_argument('--force', action='store_true', help='Regenerate every page')
+    add_writer_arguments(parser)
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+
+    cache = ParsedDocumentCache(args.cache_dir) if args.cache_dir else None
+    state = load_state(args.state)
+    if args.dry_run:
+        written, skipped, state = generate_navigation(docs_path, state, args.adopt, args.create_missing,
+                                                      True, args.force, cache)
+    else:
+        with writer_from_args('generate_navigation', args) as writer:
+            written, skipped, state = generate_navigation(docs_path, state, args.adopt, args.create_missing,
+                                                          False, args.force, cache, writer)
+    if cache is not None:
+        cache.close()
+
+    for path in written:
+        logger.info(f"{'Would write' if args.dry_run else 'Wrote'} {path}")
+    logger.info(f"{len(written)} pages {'to update' if args.dry_run else 'updated'}, {skipped} unchanged subtrees skipped")
+    if not args.dry_run:
+        save_state(state, args.state)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
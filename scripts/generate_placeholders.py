@@ -3,50 +3,43 @@
 """
 Placeholder Generator for Missing Files in Documentation
 
-This script analyzes the broken links output and creates placeholder files
-for all missing link targets to ensure the link checker passes.
+This script takes the broken link records produced by fix_broken_links.py and
+creates placeholder files for all missing link targets to ensure the link
+checker passes. Records are read as JSON Lines (from a file or stdin) or
+obtained by running the link checker in process.
+
+Usage:
+    python fix_broken_links.py --jsonl - | python generate_placeholders.py --from-jsonl -
+    python generate_placeholders.py [--docs-path PATH] [--dry-run]
 """
 
 import os
-import re
 import sys
-from pathlib import Path
-from datetime import datetime
+import json
+import argparse
+from datetime import datetime, timedelta
+
+from add_frontmatter import DEFAULT_REVIEWERS
 
 # Base directory for documentation
 DOCS_PATH = "src/vv.Domain/Docs"
 
-def extract_broken_links(broken_links_output):
-    """Extract target paths from the broken links output."""
-    targets = []
-    
-    # Regular expression to match lines with 'Target:' in them
-    target_pattern = re.compile(r'Target: (.+?)\s+')
-    
-    for line in broken_links_output.split('\n'):
-        if 'Target:' in line:
-            match = target_pattern.search(line)
-            if match:
-                target = match.group(1)
-                # Normalize the path (remove ./ prefix)
-                if target.startswith('./'):
-                    target = target[2:]
-                targets.append(target)
-    
-    return targets
+# Link checker issue that calls for a placeholder (anchor issues need a heading, not a file)
+MISSING_FILE_ISSUE = 'File not found'
 
-def resolve_relative_path(source_file, target_path):
-    """Resolve a relative path to its absolute path."""
-    source_dir = os.path.dirname(source_file)
-    if source_dir:
-        return os.path.normpath(os.path.join(source_dir, target_path))
-    return target_path
-
-def create_placeholder_file(file_path, source_files=None):
-    """Create a placeholder file with basic content."""
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    
+# Blockquote that marks a generated placeholder document (counted by frontmatter_store.py)
+PLACEHOLDER_MARKER = '> **PLACEHOLDER DOCUMENT**'
+
+# Missing images are replaced by a text note with this suffix
+IMAGE_PLACEHOLDER_SUFFIX = '.placeholder.txt'
+
+def create_placeholder_file(file_path, source_files=None, docs_path=DOCS_PATH, today=None):
+    """
+    Create a placeholder file with basic content (the directory must already exist).
+
+    today is the date written to last_updated (default: now); next_review is a year later.
+    """
+    today = today or datetime.now()
     # Determine file type based on extension
     _, ext = os.path.splitext(file_path)
     
@@ -82,16 +75,16 @@ document_type: {doc_type}
 classification: internal
 status: draft
 version: 0.1.0
-last_updated: '{datetime.now().strftime('%Y-%m-%d')}'
+last_updated: '{today.strftime('%Y-%m-%d')}'
 applies_to: ['{domain}']
-reviewers: ['@tech-lead']
+reviewers: [{', '.join(f"'{reviewer}'" for reviewer in DEFAULT_REVIEWERS)}]
 priority: p2
-next_review: '{(datetime.now().replace(year=datetime.now().year + 1)).strftime('%Y-%m-%d')}'
+next_review: '{(today + timedelta(days=365)).strftime('%Y-%m-%d')}'
 ---
 
 # {title}
 
-> **PLACEHOLDER DOCUMENT**: This file was automatically generated to fix broken links.
+{PLACEHOLDER_MARKER}: This file was automatically generated to fix broken links.
 
 ## Overview
 
@@ -102,13 +95,14 @@ This document needs to be populated with actual content.
         if source_files:
             content += "## Referenced From\n\n"
             for source in source_files:
-                content += f"* [{source}]({os.path.relpath(os.path.join(DOCS_PATH, source), os.path.dirname(file_path))})\n"
+                rel_path = os.path.relpath(os.path.join(docs_path, source), os.path.dirname(file_path))
+                content += f"* [{source}]({rel_path.replace(os.sep, '/')})\n"
     
     elif ext.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.svg']:
         # For images, we can't create actual images, so we'll create a text file with a note
         content = f"PLACEHOLDER IMAGE: {os.path.basename(file_path)}\n"
         # Change extension to .txt to avoid confusion
-        file_path = file_path + ".placeholder.txt"
+        file_path = file_path + IMAGE_PLACEHOLDER_SUFFIX
     
     # Write the content to file
     with open(file_path, 'w', encoding='utf-8') as f:
@@ -116,113 +110,86 @@ This document needs to be populated with actual content.
     
     print(f"Created placeholder file: {file_path}")
 
-def main():
-    # Get broken links output from the previous run
-    broken_links_output = ""
+def load_broken_link_records(source):
+    """Load broken link records from a JSON Lines file, or stdin when source is '-'."""
+    stream = sys.stdin if source == '-' else open(source, 'r', encoding='utf-8')
     try:
-        # Read from stdin if available
-        if not sys.stdin.isatty():
-            broken_links_output = sys.stdin.read()
-        else:
-            # Otherwise, read from the script output
-            with open('broken_links_output.txt', 'r', encoding='utf-8') as f:
-                broken_links_output = f.read()
-    except:
-        # If there's no input, use a hardcoded list of broken links from previous runs
-        broken_links_output = """
-        File: Domains\ExternalInterface\datalake\datalake-integration.md
-        Link text: Performance Benchmarks
-        Target: ./performance-benchmarks.md
-        Issue: File not found
-        """
-    
-    # Extract target paths from broken links output
-    targets = extract_broken_links(broken_links_output)
-    
-    # Map of target files to source files that reference them
-    target_to_sources = {}
-    
-    # Extract source files and organize by target
-    source_pattern = re.compile(r'File: (.+?)\s+')
-    target_pattern = re.compile(r'Target: (.+?)\s+')
-    current_source = None
-    current_target = None
-    
-    for line in broken_links_output.split('\n'):
-        if 'File:' in line:
-            match = source_pattern.search(line)
-            if match:
-                current_source = match.group(1)
-        elif 'Target:' in line and current_source:
-            match = target_pattern.search(line)
-            if match:
-                current_target = match.group(1)
-                if current_target not in target_to_sources:
-                    target_to_sources[current_target] = []
-                if current_source not in target_to_sources[current_target]:
-                    target_to_sources[current_target].append(current_source)
-    
-    # Process each unique target
-    created_files = []
-    for target_path in set(targets):
-        # Handle relative paths
-        if target_path.startswith('../'):
-            # This is a cross-domain reference, handle it carefully
-            parts = target_path.split('/')
-            if len(parts) > 1 and parts[1] in ['Asset', 'Risk', 'Security', 'Governance', 'AI', 'Core', 'Architecture']:
-                # Construct a path under the main Docs directory
-                absolute_path = os.path.join(DOCS_PATH, '/'.join(parts[1:]))
-            else:
-                # Just create it at the root level
-                absolute_path = os.path.join(DOCS_PATH, os.path.basename(target_path))
-        elif target_path.startswith('./'):
-            # This is a relative path within the same domain
-            # For simplicity, we'll create it at the root of the appropriate domain
-            source_files = target_to_sources.get(target_path, [])
-            if source_files:
-                # Get domain from first source file
-                domain_parts = source_files[0].split('\\')
-                if len(domain_parts) > 1 and domain_parts[0] == 'Domains' and domain_parts[1] in ['Asset', 'Risk', 'Security', 'Governance', 'AI', 'Core']:
-                    # Construct path under the appropriate domain
-                    absolute_path = os.path.join(DOCS_PATH, 'Domains', domain_parts[1], target_path[2:])
-                else:
-                    # Default to Core domain
-                    absolute_path = os.path.join(DOCS_PATH, 'Domains', 'Core', target_path[2:])
-            else:
-                # Default to Core domain
-                absolute_path = os.path.join(DOCS_PATH, 'Domains', 'Core', target_path[2:])
-        else:
-            # Regular path
-            source_files = target_to_sources.get(target_path, [])
-            if source_files:
-                # Get domain from first source file
-                domain_parts = source_files[0].split('\\')
-                if len(domain_parts) > 1 and domain_parts[0] == 'Domains' and domain_parts[1] in ['Asset', 'Risk', 'Security', 'Governance', 'AI', 'Core']:
-                    # Construct path under the appropriate domain
-                    if '/' in target_path:
-                        absolute_path = os.path.join(DOCS_PATH, 'Domains', domain_parts[1], target_path)
-                    else:
-                        absolute_path = os.path.join(DOCS_PATH, 'Domains', domain_parts[1], target_path)
-                else:
-                    # Default to Core domain
-                    absolute_path = os.path.join(DOCS_PATH, 'Domains', 'Core', target_path)
-            else:
-                # Default to Core domain
-                absolute_path = os.path.join(DOCS_PATH, 'Domains', 'Core', target_path)
-        
-        # Normalize path
-        absolute_path = os.path.normpath(absolute_path)
-        
-        # Skip if file already exists
-        if os.path.exists(absolute_path):
-            print(f"File already exists, skipping: {absolute_path}")
+        return [json.loads(line) for line in stream if line.strip()]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def collect_targets(broken_links, docs_path=DOCS_PATH):
+    """
+    Group missing-file records by target.
+
+    Each link target is resolved against the directory of the file that
+    references it, so the same missing file reached through different relative
+    paths is only created once. Returns {absolute target path: [source files]}.
+    """
+    docs_root = os.path.abspath(docs_path)
+    targets = {}
+    for link in broken_links:
+        if link.get('issue') != MISSING_FILE_ISSUE:
             continue
-        
-        # Create the placeholder file
-        create_placeholder_file(absolute_path, target_to_sources.get(target_path))
-        created_files.append(absolute_path)
-    
-    print(f"\nCreated {len(created_files)} placeholder files")
+        source_file = link['source_file'].replace('\\', '/')
+        base_url = link['link_url'].split('#')[0]
+        target = os.path.normpath(os.path.join(docs_root, os.path.dirname(source_file), base_url))
+
+        # Never create files outside the documentation tree
+        if os.path.commonpath([docs_root, target]) != docs_root:
+            print(f"Target outside documentation directory, skipping: {link['link_url']} (from {source_file})")
+            continue
+
+        sources = targets.setdefault(target, [])
+        if source_file not in sources:
+            sources.append(source_file)
+    return targets
+
+def generate_placeholders(broken_links, docs_path=DOCS_PATH, dry_run=False):
+    """Create placeholders for every missing link target in one batched pass; returns the created paths."""
+    targets = collect_targets(broken_links, docs_path)
+    missing = {target: sources for target, sources in sorted(targets.items())
+               if not os.path.exists(target) and not os.path.exists(target + IMAGE_PLACEHOLDER_SUFFIX)}
+    for target in targets:
+        if target not in missing:
+            print(f"File already exists, skipping: {target}")
+
+    if dry_run:
+        for target in missing:
+            print(f"[DRY RUN] Would create placeholder file: {target}")
+        return list(missing)
+
+    # Placeholders are new files with no history, so they are all dated today
+    today = datetime.now()
+
+    # Create each directory once, then write all placeholders
+    for directory in sorted({os.path.dirname(target) for target in missing}):
+        os.makedirs(directory, exist_ok=True)
+    for target, sources in missing.items():
+        create_placeholder_file(target, sources, docs_path, today)
+
+    return list(missing)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Create placeholder files for missing link targets.')
+    parser.add_argument('--docs-path', default=DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--from-jsonl', help='Read broken link records from this JSON Lines file ("-" for stdin); '
+                                             'by default the link checker is run in process')
+    parser.add_argument('--dry-run', action='store_true', help='List the placeholders without creating them')
+    args = parser.parse_args()
+
+    if args.from_jsonl:
+        broken_links = load_broken_link_records(args.from_jsonl)
+    else:
+        from fix_broken_links import check_links
+        broken_links = check_links(args.docs_path)
+
+    created_files = generate_placeholders(broken_links, args.docs_path, args.dry_run)
+    print(f"\nCreated {len(created_files)} placeholder files" if not args.dry_run
+          else f"\nWould create {len(created_files)} placeholder files")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
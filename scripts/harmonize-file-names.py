@@ -8,13 +8,18 @@ This script standardizes Markdown file naming conventions across the documentati
 - Updates internal references in all Markdown files
 - Generates a mapping report of all changes
 
+Renames, redirect stubs and link updates go through the journaled writer
+(file_writer.py), so an interrupted run can be resumed with --resume or undone
+with ``python file_writer.py rollback``.
+
 Usage:
-    python harmonize-file-names.py [--dry-run] [--docs-path PATH] [--report-path PATH]
+    python harmonize-file-names.py [--dry-run] [--docs-path PATH] [--report-path PATH] [--resume]
 
 Arguments:
     --dry-run       Run without making actual changes (default: False)
     --docs-path     Path to documentation directory (default: src/vv.Domain/Docs)
     --report-path   Path to save the mapping report (default: file-name-mapping-report.md)
+    --resume        Continue the journal of an interrupted run
 """
 
 import os
@@ -25,6 +30,11 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
+import markdown_tokens as mt
+from docs_common import camel_to_kebab, needs_rename
+from docs_walk import walk_files
+from file_writer import FileWriter, add_writer_arguments, writer_from_args
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,35 +47,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Regular expressions
-CAMEL_CASE_PATTERN = re.compile(r'([a-z0-9])([A-Z])')
-KEBAB_CASE_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*\.md$')
-MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
 YAML_DEPENDENCIES_PATTERN = re.compile(r'dependencies:\s*\[(.*?)\]', re.DOTALL)
 
-def camel_to_kebab(name):
-    """Convert CamelCase to kebab-case."""
-    # First handle the filename without extension
-    name_part, ext = os.path.splitext(name)
-    # Replace CamelCase with kebab-case
-    s1 = CAMEL_CASE_PATTERN.sub(r'\1-\2', name_part)
-    # Convert to lowercase
-    return s1.lower() + ext.lower()
-
-def is_kebab_case(filename):
-    """Check if a filename is already in kebab-case."""
-    return bool(KEBAB_CASE_PATTERN.match(filename.lower()))
-
-def needs_conversion(filename):
-    """Determine if a filename needs conversion to kebab-case."""
-    # Skip files that are already kebab-case
-    if is_kebab_case(filename):
-        return False
-    
-    # Check for uppercase letters or mixed case
-    name_part, _ = os.path.splitext(filename)
-    return any(c.isupper() for c in name_part) or '_' in name_part
-
-def create_redirect_stub(old_path, new_path, dry_run=False):
+def create_redirect_stub(old_path, new_path, dry_run=False, writer=None):
     """Create a redirect stub file for backward compatibility."""
     if dry_run:
         logger.info(f"[DRY RUN] Would create redirect stub: {old_path} -> {new_path}")
@@ -95,38 +79,41 @@ Please update your bookmarks and references.
 <meta http-equiv="refresh" content="0;url={rel_path}">
 """
     
-    # Create the directory if it doesn't exist
-    os.makedirs(os.path.dirname(old_path), exist_ok=True)
-    
-    # Write the redirect file
-    with open(old_path, 'w', encoding='utf-8') as f:
-        f.write(redirect_content)
+    # Write the redirect file (the writer creates the directory if needed)
+    if writer is None:
+        with FileWriter('harmonize-file-names', journal_dir=None) as writer:
+            writer.write(old_path, redirect_content)
+    else:
+        writer.write(old_path, redirect_content)
     
     logger.info(f"Created redirect stub: {old_path} -> {new_path}")
 
 def update_markdown_links(content, file_mapping):
     """Update markdown links in content based on file mapping."""
-    def replace_link(match):
-        link_text = match.group(1)
-        link_path = match.group(2)
+    # Rewrite link destinations in place (inline links, images and reference
+    # definitions), never touching code blocks; spans are applied back to front
+    replacements = []
+    for link in mt.iter_links(mt.tokenize(content), include_definitions=True):
+        if link.url_start < 0:
+            continue  # reference links are updated through their definition
         
         # Skip external links or anchors
-        if link_path.startswith(('http://', 'https://', '#')):
-            return match.group(0)
+        link_path, hash_sign, anchor = link.url.partition('#')
+        if link.url.startswith(('http://', 'https://', '#')):
+            continue
         
         # Parse the link path
         link_dir, link_file = os.path.split(link_path)
         
         # Check if this file was renamed
         if link_file in file_mapping:
-            new_link_file = file_mapping[link_file]
-            new_link_path = os.path.join(link_dir, new_link_file)
-            return f'[{link_text}]({new_link_path})'
-        
-        return match.group(0)
+            new_link_path = os.path.join(link_dir, file_mapping[link_file]).replace(os.sep, '/')
+            replacements.append((link.url_start, link.url_end, new_link_path + hash_sign + anchor))
     
     # Update markdown links
-    updated_content = MARKDOWN_LINK_PATTERN.sub(replace_link, content)
+    updated_content = content
+    for start, end, new_url in reversed(replacements):
+        updated_content = updated_content[:start] + new_url + updated_content[end:]
     
     # Update YAML dependencies
     def replace_dependencies(match):
@@ -196,6 +183,7 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Run without making actual changes')
     parser.add_argument('--docs-path', default='src/vv.Domain/Docs', help='Path to documentation directory')
     parser.add_argument('--report-path', default='file-name-mapping-report.md', help='Path to save the mapping report')
+    add_writer_arguments(parser)
     args = parser.parse_args()
     
     docs_path = Path(args.docs_path)
@@ -216,22 +204,27 @@ def main():
     # Step 1: Identify files that need renaming
     logger.info("Scanning for files that need renaming...")
     md_files = []
+    writer = None if dry_run else writer_from_args('harmonize-file-names', args)
+    if writer is not None:
+        # Renames done by a resumed run still need their links updated
+        for old_path, new_path in writer.renamed.items():
+            file_mapping[os.path.basename(old_path)] = os.path.basename(new_path)
     
-    for root, _, files in os.walk(docs_path):
-        for filename in files:
-            if filename.lower().endswith('.md'):
-                full_path = os.path.join(root, filename)
-                md_files.append(full_path)
-                
-                if needs_conversion(filename):
-                    new_filename = camel_to_kebab(filename)
-                    file_mapping[filename] = new_filename
-                    logger.info(f"Found file to rename: {filename} -> {new_filename}")
+    for _, entry in walk_files(docs_path, include=('*.[mM][dD]',)):
+        filename = entry.name
+        md_files.append(entry.path)
+        
+        if needs_rename(filename):
+            new_filename = camel_to_kebab(filename)
+            file_mapping[filename] = new_filename
+            logger.info(f"Found file to rename: {filename} -> {new_filename}")
     
     logger.info(f"Found {len(file_mapping)} files to rename out of {len(md_files)} total markdown files")
     
     if not file_mapping:
         logger.info("No files need renaming. Exiting.")
+        if writer is not None:
+            writer.close()
         return 0
     
     # Step 2: Rename files and create redirect stubs
@@ -245,20 +238,27 @@ def main():
                     new_filename = file_mapping[filename]
                     new_path = os.path.join(root, new_filename)
                     
-                    # Read the content before renaming
-                    with open(old_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    if os.path.abspath(old_path) in writer.renamed:
+                        # Renamed by the interrupted run being resumed; old_path is its stub
+                        continue
+                    if os.path.exists(new_path):
+                        logger.warning(f"Not renaming {old_path}: {new_path} already exists")
+                        continue
                     
                     # Rename the file
-                    os.rename(old_path, new_path)
+                    writer.rename(old_path, new_path)
+                    md_files.append(new_path)
                     logger.info(f"Renamed: {old_path} -> {new_path}")
                     
-                    # Write the content to the new file
-                    with open(new_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
                     # Create redirect stub
-                    create_redirect_stub(old_path, new_path, dry_run)
+                    create_redirect_stub(old_path, new_path, dry_run, writer)
+        
+        # Stubs the interrupted run renamed the file for but did not get to write
+        writer.flush()
+        for old_path, new_path in writer.renamed.items():
+            if not os.path.exists(old_path):
+                create_redirect_stub(old_path, new_path, dry_run, writer)
+        writer.flush()
     
     # Step 3: Update internal references in all markdown files
     logger.info("Updating internal references...")
@@ -272,14 +272,17 @@ def main():
             
             if content != updated_content:
                 if not dry_run:
-                    with open(md_file, 'w', encoding='utf-8') as f:
-                        f.write(updated_content)
+                    writer.write(md_file, updated_content)
                     logger.info(f"Updated references in: {md_file}")
                 else:
                     logger.info(f"[DRY RUN] Would update references in: {md_file}")
         except Exception as e:
             logger.error(f"Error updating references in {md_file}: {str(e)}")
     
+    if writer is not None:
+        writer.close()
+        logger.info(f"Wrote {writer.written} files ({writer.skipped} unchanged writes skipped)")
+    
     # Step 4: Generate mapping report
     if not dry_run:
         generate_mapping_report(file_mapping, report_path)
@@ -0,0 +1,1083 @@
+#!/usr/bin/env python3
+
+"""
+Markdown Linter for VeritasVault Documentation
+
+This script implements the markdownlint rules enabled by
+.github/workflows/markdownlint.json in Python. Each file is tokenized once
+(see markdown_tokens.py) and a single visitor pass feeds every token to the
+enabled rules, together with the frontmatter schema and template compliance
+checks. Results are cached by content hash so unchanged files are not re-linted.
+
+Usage:
+    python markdown_lint.py [--docs-path PATH] [--config PATH] [--output PATH]
+                            [--json-output PATH] [--cache PATH] [--no-repository-checks]
+                            [--shard i/N] [FILE ...]
+
+Output lines follow the markdownlint-cli format:
+    path:line RULE/alias description
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import logging
+from pathlib import Path
+
+from docs_common import (
+    DEFAULT_DOCS_PATH, DEFAULT_SCHEMA_PATH, DEFAULT_TEMPLATE_PATH, WORKFLOWS_PATH,
+    content_hash, iter_markdown_files, load_script_module,
+)
+from docs_shard import add_shard_argument, in_shard, write_shard_result
+import markdown_tokens as mt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = WORKFLOWS_PATH / 'markdownlint.json'
+
+# Inline patterns
+CODE_SPAN_PATTERN = re.compile(r'(`+)(.+?)(?<!`)\1(?!`)')
+INLINE_LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(([^)]*)\)')
+REVERSED_LINK_PATTERN = re.compile(r'(?<![\\\]])\(([^)\s]+)\)\[([^\]]+)\](?!\()')
+BARE_URL_PATTERN = re.compile(r'(?<![(<\[\w/"\'=])(https?://[^\s<>\[\]()]+[^\s<>\[\]().,;:!?\'"])')
+HTML_TAG_PATTERN = re.compile(r'<(/?)([A-Za-z][A-Za-z0-9-]*)(?=[\s/>])')
+AUTOLINK_PATTERN = re.compile(r'<(?:https?|mailto|ftp):[^>\s]*>|<[^@>\s]+@[^>\s]+>')
+LINK_REFERENCE_PATTERN = re.compile(r'^ {0,3}\[[^\]]+\]:\s*\S+')
+HTML_ANCHOR_PATTERN = re.compile(r'<a\s[^>]*(?:name|id)=["\']([^"\']+)["\']', re.IGNORECASE)
+UNDERSCORE_EMPHASIS_PATTERN = re.compile(r'(?<![\w_\\])_(?!_)(\S(?:[^_]*?\S)?)_(?![\w_])')
+UNDERSCORE_STRONG_PATTERN = re.compile(r'(?<![\w_\\])__(\S(?:[^_]*?\S)?)__(?![\w_])')
+SPACE_IN_EMPHASIS_PATTERN = re.compile(
+    r'(?<![*\w\\])(\*\*|\*|__|_)(?:\s+[^*_\s][^*_]*?|[^*_\s][^*_]*?\s+)\1(?![*\w])'
+)
+
+def mask_code_spans(text):
+    """Replace code span contents with spaces so inline rules ignore them (keeps columns)."""
+    return CODE_SPAN_PATTERN.sub(lambda m: m.group(1) + ' ' * len(m.group(2)) + m.group(1), text)
+
+def mask_links(text):
+    """Replace link destinations with spaces so URL-like text inside them is ignored."""
+    return INLINE_LINK_PATTERN.sub(
+        lambda m: m.group(1) + '[' + m.group(2) + '](' + ' ' * len(m.group(3)) + ')', text)
+
+def count_table_cells(text):
+    """Count the cells of a table row, ignoring escaped pipes and pipes in code spans."""
+    row = mask_code_spans(text).replace('\\|', '  ').strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|'):
+        row = row[:-1]
+    return row.count('|') + 1
+
+# ---------------------------------------------------------------------------
+# Lint context and rule base class
+# ---------------------------------------------------------------------------
+
+class LintContext:
+    """Per-file state shared by all rules during a visitor pass."""
+
+    def __init__(self, file_path, content, tokens):
+        self.file_path = file_path
+        self.content = content
+        self.tokens = tokens
+        self.frontmatter = None
+        self.issues = []
+
+    def report(self, rule, line, message):
+        self.issues.append({
+            'file': self.file_path,
+            'line': line,
+            'rule': rule.rule_id,
+            'alias': rule.aliases[0],
+            'message': message,
+        })
+
+class Rule:
+    """Base class for lint rules; subclasses override visit() and/or finish()."""
+
+    rule_id = ''
+    aliases = ()
+    kinds = None  # token kinds the rule wants to see (None means all)
+    defaults = {}
+
+    def __init__(self, options):
+        self.options = dict(self.defaults)
+        self.options.update(options)
+
+    def visit(self, token, previous, ctx):
+        pass
+
+    def finish(self, ctx):
+        pass
+
+INLINE_KINDS = (mt.TEXT, mt.LIST_ITEM, mt.BLOCKQUOTE, mt.TABLE, mt.HEADING)
+
+# ---------------------------------------------------------------------------
+# Heading rules
+# ---------------------------------------------------------------------------
+
+class HeadingIncrement(Rule):
+    rule_id = 'MD001'
+    aliases = ('heading-increment', 'header-increment')
+    kinds = (mt.HEADING,)
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.last_level = 0
+
+    def visit(self, token, previous, ctx):
+        if self.last_level and token.level > self.last_level + 1:
+            ctx.report(self, token.line, f"Heading levels should only increment by one level at a time "
+                                         f"[Expected: h{self.last_level + 1}; Actual: h{token.level}]")
+        self.last_level = token.level
+
+class HeadingStyle(Rule):
+    rule_id = 'MD003'
+    aliases = ('heading-style', 'header-style')
+    kinds = (mt.HEADING,)
+    defaults = {'style': 'consistent'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.expected = None if self.options['style'] == 'consistent' else self.options['style']
+
+    def visit(self, token, previous, ctx):
+        style = mt.heading_style(token)
+        if self.expected is None:
+            self.expected = style
+        elif style != self.expected:
+            ctx.report(self, token.line, f"Heading style [Expected: {self.expected}; Actual: {style}]")
+
+class NoMissingSpaceAtx(Rule):
+    rule_id = 'MD018'
+    aliases = ('no-missing-space-atx',)
+    kinds = (mt.TEXT,)
+    pattern = re.compile(r'^ {0,3}#{1,6}[^#\s!]')
+
+    def visit(self, token, previous, ctx):
+        if self.pattern.match(token.text) and not token.text.lstrip().startswith('#' * 7):
+            ctx.report(self, token.line, "No space after hash on atx style heading")
+
+class NoMultipleSpaceAtx(Rule):
+    rule_id = 'MD019'
+    aliases = ('no-multiple-space-atx',)
+    kinds = (mt.HEADING,)
+    pattern = re.compile(r'^ {0,3}#{1,6}[ \t]{2,}\S')
+
+    def visit(self, token, previous, ctx):
+        if self.pattern.match(token.text):
+            ctx.report(self, token.line, "Multiple spaces after hash on atx style heading")
+
+class BlanksAroundHeadings(Rule):
+    rule_id = 'MD022'
+    aliases = ('blanks-around-headings', 'blanks-around-headers')
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.pending = None
+
+    def visit(self, token, previous, ctx):
+        if self.pending is not None:
+            if token.kind not in (mt.BLANK, mt.SETEXT_UNDERLINE):
+                ctx.report(self, self.pending.line, "Headings should be surrounded by blank lines [Below]")
+            if token.kind != mt.SETEXT_UNDERLINE:
+                self.pending = None
+        if token.kind == mt.HEADING:
+            if previous is not None and previous.kind not in (mt.BLANK, mt.FRONTMATTER):
+                ctx.report(self, token.line, "Headings should be surrounded by blank lines [Above]")
+            self.pending = token
+
+class HeadingStartLeft(Rule):
+    rule_id = 'MD023'
+    aliases = ('heading-start-left', 'header-start-left')
+    kinds = (mt.HEADING,)
+
+    def visit(self, token, previous, ctx):
+        if token.text[:1] in (' ', '\t'):
+            ctx.report(self, token.line, "Headings must start at the beginning of the line")
+
+class NoDuplicateHeading(Rule):
+    rule_id = 'MD024'
+    aliases = ('no-duplicate-heading', 'no-duplicate-header')
+    kinds = (mt.HEADING,)
+    defaults = {'siblings_only': False}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.seen = {0: set()}  # level -> titles seen under the current parent
+
+    def visit(self, token, previous, ctx):
+        if self.options['siblings_only']:
+            for level in [level for level in self.seen if level > token.level]:
+                del self.seen[level]
+            siblings = self.seen.setdefault(token.level, set())
+        else:
+            siblings = self.seen[0]
+        if token.info in siblings:
+            ctx.report(self, token.line, f"Multiple headings with the same content [Context: \"{token.info}\"]")
+        siblings.add(token.info)
+
+class SingleTitle(Rule):
+    rule_id = 'MD025'
+    aliases = ('single-title', 'single-h1')
+    kinds = (mt.FRONTMATTER, mt.HEADING)
+    defaults = {'level': 1, 'front_matter_title': r'^\s*title\s*[:=]'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.found_title = False
+
+    def visit(self, token, previous, ctx):
+        if token.kind == mt.FRONTMATTER:
+            pattern = self.options['front_matter_title']
+            if pattern and re.search(pattern, token.info, re.MULTILINE):
+                self.found_title = True
+        elif token.level == self.options['level']:
+            if self.found_title:
+                ctx.report(self, token.line, f"Multiple top-level headings in the same document "
+                                             f"[Context: \"{token.info}\"]")
+            self.found_title = True
+
+class NoTrailingPunctuation(Rule):
+    rule_id = 'MD026'
+    aliases = ('no-trailing-punctuation',)
+    kinds = (mt.HEADING,)
+    defaults = {'punctuation': '.,;:!。，；：！'}
+
+    def visit(self, token, previous, ctx):
+        if token.info and token.info[-1] in self.options['punctuation'] and not re.search(r'&#?\w+;$', token.info):
+            ctx.report(self, token.line, f"Trailing punctuation in heading [Punctuation: '{token.info[-1]}']")
+
+# ---------------------------------------------------------------------------
+# Whitespace and line rules
+# ---------------------------------------------------------------------------
+
+class NoTrailingSpaces(Rule):
+    rule_id = 'MD009'
+    aliases = ('no-trailing-spaces',)
+    defaults = {'br_spaces': 2}
+
+    def visit(self, token, previous, ctx):
+        if token.kind == mt.FRONTMATTER:
+            return
+        trailing = len(token.text) - len(token.text.rstrip(' '))
+        if not trailing:
+            return
+        allowed = self.options['br_spaces']
+        if token.kind in (mt.CODE, mt.INDENTED_CODE, mt.BLANK) or trailing != allowed:
+            ctx.report(self, token.line, f"Trailing spaces [Expected: 0 or {allowed}; Actual: {trailing}]")
+
+class NoHardTabs(Rule):
+    rule_id = 'MD010'
+    aliases = ('no-hard-tabs',)
+    defaults = {'code_blocks': True}
+
+    def visit(self, token, previous, ctx):
+        if token.kind in (mt.FRONTMATTER,) or '\t' not in token.text:
+            return
+        if token.kind in (mt.CODE, mt.INDENTED_CODE) and not self.options['code_blocks']:
+            return
+        ctx.report(self, token.line, f"Hard tabs [Column: {token.text.index(chr(9)) + 1}]")
+
+class NoMultipleBlanks(Rule):
+    rule_id = 'MD012'
+    aliases = ('no-multiple-blanks',)
+    defaults = {'maximum': 1}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.blanks = 0
+
+    def visit(self, token, previous, ctx):
+        if token.kind != mt.BLANK:
+            self.blanks = 0
+            return
+        self.blanks += 1
+        if self.blanks > self.options['maximum']:
+            ctx.report(self, token.line, f"Multiple consecutive blank lines "
+                                         f"[Expected: {self.options['maximum']}; Actual: {self.blanks}]")
+
+class LineLength(Rule):
+    rule_id = 'MD013'
+    aliases = ('line-length',)
+    defaults = {'line_length': 80, 'heading_line_length': None, 'code_block_line_length': None,
+                'code_blocks': True, 'tables': True, 'headings': True, 'strict': False}
+
+    def visit(self, token, previous, ctx):
+        if token.kind in (mt.FRONTMATTER, mt.BLANK):
+            return
+        if token.kind in (mt.CODE, mt.INDENTED_CODE, mt.FENCE_OPEN, mt.FENCE_CLOSE):
+            if not self.options['code_blocks']:
+                return
+            limit = self.options['code_block_line_length'] or self.options['line_length']
+        elif token.kind == mt.TABLE:
+            if not self.options['tables']:
+                return
+            limit = self.options['line_length']
+        elif token.kind == mt.HEADING:
+            if not self.options['headings']:
+                return
+            limit = self.options['heading_line_length'] or self.options['line_length']
+        else:
+            limit = self.options['line_length']
+        length = len(token.text)
+        if length <= limit or LINK_REFERENCE_PATTERN.match(token.text):
+            return
+        # Non-strict mode allows a long line when the excess has no whitespace (URLs, paths)
+        if not self.options['strict'] and ' ' not in token.text[limit:] and ' ' in token.text[:limit]:
+            return
+        ctx.report(self, token.line, f"Line length [Expected: {limit}; Actual: {length}]")
+
+class SingleTrailingNewline(Rule):
+    rule_id = 'MD047'
+    aliases = ('single-trailing-newline',)
+    kinds = ()
+
+    def finish(self, ctx):
+        if ctx.content and not ctx.content.endswith('\n'):
+            ctx.report(self, ctx.content.count('\n') + 1, "Files should end with a single newline character")
+
+# ---------------------------------------------------------------------------
+# List and block quote rules
+# ---------------------------------------------------------------------------
+
+class UlStyle(Rule):
+    rule_id = 'MD004'
+    aliases = ('ul-style',)
+    kinds = (mt.LIST_ITEM,)
+    defaults = {'style': 'consistent'}
+    markers = {'dash': '-', 'asterisk': '*', 'plus': '+'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.expected = self.markers.get(self.options['style'])
+
+    def visit(self, token, previous, ctx):
+        if token.info not in self.markers.values():
+            return
+        if self.expected is None:
+            self.expected = token.info
+        elif token.info != self.expected:
+            names = {marker: name for name, marker in self.markers.items()}
+            ctx.report(self, token.line, f"Unordered list style [Expected: {names[self.expected]}; "
+                                         f"Actual: {names[token.info]}]")
+
+class UlIndent(Rule):
+    rule_id = 'MD007'
+    aliases = ('ul-indent',)
+    defaults = {'indent': 2, 'start_indented': False}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.stack = []  # (indent, ordered) for each open list item
+
+    def visit(self, token, previous, ctx):
+        if token.kind in (mt.HEADING, mt.HR, mt.FENCE_OPEN) or (token.kind == mt.TEXT and not token.text.startswith(' ')
+                                                                 and previous is not None and previous.kind == mt.BLANK):
+            self.stack = []
+            return
+        if token.kind != mt.LIST_ITEM:
+            return
+        while self.stack and self.stack[-1][0] >= token.level:
+            self.stack.pop()
+        ordered = token.info[0].isdigit()
+        if not ordered and not any(parent_ordered for _, parent_ordered in self.stack):
+            expected = len(self.stack) * self.options['indent']
+            if self.options['start_indented']:
+                expected += self.options['indent']
+            if token.level != expected:
+                ctx.report(self, token.line, f"Unordered list indentation [Expected: {expected}; Actual: {token.level}]")
+        self.stack.append((token.level, ordered))
+
+class NoMultipleSpaceBlockquote(Rule):
+    rule_id = 'MD027'
+    aliases = ('no-multiple-space-blockquote',)
+    kinds = (mt.BLOCKQUOTE,)
+    pattern = re.compile(r'^ {0,3}>\s{2,}\S')
+
+    def visit(self, token, previous, ctx):
+        if self.pattern.match(token.text) and not LIST_ITEM_AFTER_QUOTE.match(token.text):
+            ctx.report(self, token.line, "Multiple spaces after blockquote symbol")
+
+LIST_ITEM_AFTER_QUOTE = re.compile(r'^ {0,3}>\s+([-*+]|\d+[.)])\s')
+
+class NoBlanksBlockquote(Rule):
+    rule_id = 'MD028'
+    aliases = ('no-blanks-blockquote',)
+    kinds = (mt.BLOCKQUOTE, mt.BLANK, mt.TEXT, mt.HEADING, mt.LIST_ITEM, mt.TABLE, mt.HR,
+             mt.HTML, mt.FENCE_OPEN, mt.INDENTED_CODE)
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.after_quote_blank = None
+
+    def visit(self, token, previous, ctx):
+        if token.kind == mt.BLOCKQUOTE:
+            if self.after_quote_blank is not None:
+                ctx.report(self, self.after_quote_blank, "Blank line inside blockquote")
+            self.after_quote_blank = None
+        elif token.kind == mt.BLANK:
+            if previous is not None and previous.kind == mt.BLOCKQUOTE:
+                self.after_quote_blank = token.line
+        else:
+            self.after_quote_blank = None
+
+class OlPrefix(Rule):
+    rule_id = 'MD029'
+    aliases = ('ol-prefix',)
+    kinds = (mt.LIST_ITEM,)
+    defaults = {'style': 'one_or_ordered'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.expected = {}  # indent -> next expected number for 'ordered' style
+
+    def visit(self, token, previous, ctx):
+        if not token.info[0].isdigit():
+            return
+        number = int(token.info[:-1])
+        style = self.options['style']
+        if style in ('one', 'zero'):
+            expected = 1 if style == 'one' else 0
+        else:
+            expected = self.expected.get(token.level, number)
+            if style == 'one_or_ordered' and number == 1:
+                expected = 1
+            self.expected[token.level] = expected + 1
+        if number != expected:
+            ctx.report(self, token.line, f"Ordered list item prefix [Expected: {expected}; Actual: {number}]")
+
+class ListMarkerSpace(Rule):
+    rule_id = 'MD030'
+    aliases = ('list-marker-space',)
+    kinds = (mt.LIST_ITEM,)
+    pattern = re.compile(r'^\s*(?:[-*+]|\d+[.)])( +)\S')
+
+    def visit(self, token, previous, ctx):
+        match = self.pattern.match(token.text)
+        if match and len(match.group(1)) != 1:
+            ctx.report(self, token.line, f"Spaces after list markers [Expected: 1; Actual: {len(match.group(1))}]")
+
+# ---------------------------------------------------------------------------
+# Code block rules
+# ---------------------------------------------------------------------------
+
+class CommandsShowOutput(Rule):
+    rule_id = 'MD014'
+    aliases = ('commands-show-output',)
+    kinds = (mt.FENCE_OPEN, mt.CODE, mt.FENCE_CLOSE)
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.block = None
+
+    def visit(self, token, previous, ctx):
+        if token.kind == mt.FENCE_OPEN:
+            self.block = []
+        elif token.kind == mt.CODE and self.block is not None:
+            if token.text.strip():
+                self.block.append(token)
+        elif self.block:
+            if all(line.text.lstrip().startswith('$ ') for line in self.block):
+                ctx.report(self, self.block[0].line, "Dollar signs used before commands without showing output")
+            self.block = None
+
+class BlanksAroundFences(Rule):
+    rule_id = 'MD031'
+    aliases = ('blanks-around-fences',)
+    defaults = {'list_items': True}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.closed = None
+
+    def visit(self, token, previous, ctx):
+        if self.closed is not None:
+            if token.kind != mt.BLANK:
+                ctx.report(self, self.closed.line, "Fenced code blocks should be surrounded by blank lines")
+            self.closed = None
+        if token.kind == mt.FENCE_OPEN:
+            if previous is not None and previous.kind not in (mt.BLANK, mt.FRONTMATTER):
+                if self.options['list_items'] or not token.text.startswith(' '):
+                    ctx.report(self, token.line, "Fenced code blocks should be surrounded by blank lines")
+        elif token.kind == mt.FENCE_CLOSE:
+            self.closed = token
+
+class FencedCodeLanguage(Rule):
+    rule_id = 'MD040'
+    aliases = ('fenced-code-language',)
+    kinds = (mt.FENCE_OPEN,)
+
+    def visit(self, token, previous, ctx):
+        if not token.info:
+            ctx.report(self, token.line, "Fenced code blocks should have a language specified")
+
+class CodeBlockStyle(Rule):
+    rule_id = 'MD046'
+    aliases = ('code-block-style',)
+    kinds = (mt.FENCE_OPEN, mt.INDENTED_CODE)
+    defaults = {'style': 'consistent'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.expected = None if self.options['style'] == 'consistent' else self.options['style']
+
+    def visit(self, token, previous, ctx):
+        if token.kind == mt.INDENTED_CODE and previous is not None and previous.kind == mt.INDENTED_CODE:
+            return
+        style = 'fenced' if token.kind == mt.FENCE_OPEN else 'indented'
+        if self.expected is None:
+            self.expected = style
+        elif style != self.expected:
+            ctx.report(self, token.line, f"Code block style [Expected: {self.expected}; Actual: {style}]")
+
+class CodeFenceStyle(Rule):
+    rule_id = 'MD048'
+    aliases = ('code-fence-style',)
+    kinds = (mt.FENCE_OPEN,)
+    defaults = {'style': 'consistent'}
+    markers = {'backtick': '`', 'tilde': '~'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.expected = self.markers.get(self.options['style'])
+
+    def visit(self, token, previous, ctx):
+        marker = token.text.lstrip()[0]
+        if self.expected is None:
+            self.expected = marker
+        elif marker != self.expected:
+            names = {value: key for key, value in self.markers.items()}
+            ctx.report(self, token.line, f"Code fence style [Expected: {names[self.expected]}; Actual: {names[marker]}]")
+
+# ---------------------------------------------------------------------------
+# Inline rules
+# ---------------------------------------------------------------------------
+
+class NoReversedLinks(Rule):
+    rule_id = 'MD011'
+    aliases = ('no-reversed-links',)
+    kinds = INLINE_KINDS
+
+    def visit(self, token, previous, ctx):
+        for match in REVERSED_LINK_PATTERN.finditer(mask_code_spans(token.text)):
+            ctx.report(self, token.line, f"Reversed link syntax [Context: \"{match.group(0)}\"]")
+
+class NoInlineHtml(Rule):
+    rule_id = 'MD033'
+    aliases = ('no-inline-html',)
+    kinds = INLINE_KINDS + (mt.HTML,)
+    defaults = {'allowed_elements': []}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.allowed = {element.lower() for element in self.options['allowed_elements']}
+
+    def visit(self, token, previous, ctx):
+        text = AUTOLINK_PATTERN.sub('', mask_code_spans(token.text))
+        for match in HTML_TAG_PATTERN.finditer(text):
+            element = match.group(2).lower()
+            if not match.group(1) and element not in self.allowed:
+                ctx.report(self, token.line, f"Inline HTML [Element: {element}]")
+
+class NoBareUrls(Rule):
+    rule_id = 'MD034'
+    aliases = ('no-bare-urls',)
+    kinds = INLINE_KINDS
+
+    def visit(self, token, previous, ctx):
+        text = AUTOLINK_PATTERN.sub('', mask_links(mask_code_spans(token.text)))
+        for match in BARE_URL_PATTERN.finditer(text):
+            ctx.report(self, token.line, f"Bare URL used [Context: \"{match.group(1)}\"]")
+
+class HrStyle(Rule):
+    rule_id = 'MD035'
+    aliases = ('hr-style',)
+    kinds = (mt.HR,)
+    defaults = {'style': 'consistent'}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.expected = None if self.options['style'] == 'consistent' else self.options['style']
+
+    def visit(self, token, previous, ctx):
+        style = token.text.strip()
+        if self.expected is None:
+            self.expected = style
+        elif style != self.expected:
+            ctx.report(self, token.line, f"Horizontal rule style [Expected: {self.expected}; Actual: {style}]")
+
+class NoSpaceInEmphasis(Rule):
+    rule_id = 'MD037'
+    aliases = ('no-space-in-emphasis',)
+    kinds = (mt.TEXT, mt.BLOCKQUOTE, mt.TABLE, mt.HEADING, mt.LIST_ITEM)
+
+    def visit(self, token, previous, ctx):
+        text = mask_code_spans(token.text)
+        if token.kind == mt.LIST_ITEM:
+            marker = mt.LIST_ITEM_PATTERN.match(text)
+            text = ' ' * marker.end() + text[marker.end():]
+        for match in SPACE_IN_EMPHASIS_PATTERN.finditer(mask_links(text)):
+            ctx.report(self, token.line, f"Spaces inside emphasis markers [Context: \"{match.group(0)}\"]")
+
+class NoSpaceInCode(Rule):
+    rule_id = 'MD038'
+    aliases = ('no-space-in-code',)
+    kinds = INLINE_KINDS
+
+    def visit(self, token, previous, ctx):
+        for match in CODE_SPAN_PATTERN.finditer(token.text):
+            code = match.group(2)
+            if code.strip() and code != code.strip():
+                # A single padding space on both sides is allowed (needed around backticks)
+                if code.startswith(' ') and code.endswith(' ') and code[1:-1] == code.strip():
+                    continue
+                ctx.report(self, token.line, f"Spaces inside code span elements [Context: \"{match.group(0)}\"]")
+
+class NoSpaceInLinks(Rule):
+    rule_id = 'MD039'
+    aliases = ('no-space-in-links',)
+    kinds = INLINE_KINDS
+
+    def visit(self, token, previous, ctx):
+        for match in INLINE_LINK_PATTERN.finditer(mask_code_spans(token.text)):
+            label = match.group(2)
+            if label.strip() and label != label.strip():
+                ctx.report(self, token.line, f"Spaces inside link text [Context: \"{match.group(0)}\"]")
+
+class NoEmptyLinks(Rule):
+    rule_id = 'MD042'
+    aliases = ('no-empty-links',)
+    kinds = INLINE_KINDS
+
+    def visit(self, token, previous, ctx):
+        for match in INLINE_LINK_PATTERN.finditer(mask_code_spans(token.text)):
+            if not match.group(1) and match.group(3).strip() in ('', '#'):
+                ctx.report(self, token.line, f"No empty links [Context: \"{match.group(0)}\"]")
+
+class ProperNames(Rule):
+    rule_id = 'MD044'
+    aliases = ('proper-names',)
+    defaults = {'names': [], 'code_blocks': True, 'html_elements': True}
+
+    def __init__(self, options):
+        super().__init__(options)
+        names = sorted(self.options['names'], key=len, reverse=True)
+        self.names = {name.lower(): name for name in names}
+        self.pattern = re.compile(
+            r'(?<![\w./\\@-])(' + '|'.join(re.escape(name) for name in names) + r')(?![\w/\\-]|\.\w)',
+            re.IGNORECASE) if names else None
+
+    def visit(self, token, previous, ctx):
+        if self.pattern is None or token.kind in (mt.FRONTMATTER, mt.BLANK, mt.FENCE_OPEN, mt.FENCE_CLOSE):
+            return
+        if token.kind in (mt.CODE, mt.INDENTED_CODE):
+            if not self.options['code_blocks']:
+                return
+            text = token.text
+        else:
+            text = mask_links(token.text if self.options['code_blocks'] else mask_code_spans(token.text))
+            text = BARE_URL_PATTERN.sub(lambda m: ' ' * len(m.group(0)), text)
+        for match in self.pattern.finditer(text):
+            expected = self.names[match.group(1).lower()]
+            if match.group(1) != expected:
+                ctx.report(self, token.line, f"Proper names should have the correct capitalization "
+                                             f"[Expected: {expected}; Actual: {match.group(1)}]")
+
+class NoAltText(Rule):
+    rule_id = 'MD045'
+    aliases = ('no-alt-text',)
+    kinds = INLINE_KINDS
+
+    def visit(self, token, previous, ctx):
+        for match in INLINE_LINK_PATTERN.finditer(mask_code_spans(token.text)):
+            if match.group(1) and not match.group(2).strip():
+                ctx.report(self, token.line, "Images should have alternate text (alt text)")
+
+class EmphasisStyle(Rule):
+    rule_id = 'MD049'
+    aliases = ('emphasis-style',)
+    kinds = INLINE_KINDS
+    defaults = {'style': 'consistent'}
+    pattern = UNDERSCORE_EMPHASIS_PATTERN
+    label = 'Emphasis style'
+
+    def visit(self, token, previous, ctx):
+        if self.options['style'] != 'asterisk':
+            return
+        for match in self.pattern.finditer(mask_links(mask_code_spans(token.text))):
+            ctx.report(self, token.line, f"{self.label} [Expected: asterisk; Actual: underscore]")
+
+class StrongStyle(EmphasisStyle):
+    rule_id = 'MD050'
+    aliases = ('strong-style',)
+    pattern = UNDERSCORE_STRONG_PATTERN
+    label = 'Strong style'
+
+class LinkFragments(Rule):
+    rule_id = 'MD051'
+    aliases = ('link-fragments',)
+    kinds = INLINE_KINDS + (mt.HTML,)
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.anchors = set()
+        self.fragments = []
+
+    def visit(self, token, previous, ctx):
+        if token.kind == mt.HEADING:
+            anchor = mt.heading_anchor(token.info)
+            unique, suffix = anchor, 1
+            while unique in self.anchors:
+                unique = f"{anchor}-{suffix}"
+                suffix += 1
+            self.anchors.add(unique)
+        self.anchors.update(anchor.lower() for anchor in HTML_ANCHOR_PATTERN.findall(token.text))
+        for match in INLINE_LINK_PATTERN.finditer(mask_code_spans(token.text)):
+            url = match.group(3).strip()
+            if url.startswith('#') and len(url) > 1:
+                self.fragments.append((token.line, url))
+
+    def finish(self, ctx):
+        for line, url in self.fragments:
+            if url[1:].lower() not in self.anchors:
+                ctx.report(self, line, f"Link fragments should be valid [Context: \"{url}\"]")
+
+# ---------------------------------------------------------------------------
+# Table rules
+# ---------------------------------------------------------------------------
+
+class TablePipeStyle(Rule):
+    rule_id = 'MD055'
+    aliases = ('table-pipe-style',)
+    kinds = (mt.TABLE,)
+    defaults = {'style': 'consistent'}
+
+    def visit(self, token, previous, ctx):
+        row = token.text.strip()
+        if self.options['style'] == 'leading_and_trailing' and not (row.startswith('|') and row.endswith('|')):
+            ctx.report(self, token.line, "Table pipe style [Expected: leading_and_trailing]")
+
+class TableColumnCount(Rule):
+    rule_id = 'MD056'
+    aliases = ('table-column-count',)
+    kinds = (mt.TABLE,)
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.columns = None
+
+    def visit(self, token, previous, ctx):
+        cells = count_table_cells(token.text)
+        if previous is None or previous.kind != mt.TABLE:
+            self.columns = cells
+        elif cells != self.columns:
+            ctx.report(self, token.line, f"Table column count [Expected: {self.columns}; Actual: {cells}]")
+
+# ---------------------------------------------------------------------------
+# Repository checks run in the same pass
+# ---------------------------------------------------------------------------
+
+class FrontMatter(Rule):
+    """Frontmatter presence and schema validation (validate-frontmatter.py)."""
+
+    rule_id = 'VV001'
+    aliases = ('front-matter',)
+    kinds = (mt.FRONTMATTER,)
+    defaults = {'required': True, 'closed': True, 'schema_path': str(DEFAULT_SCHEMA_PATH)}
+    _validators = {}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.seen = False
+
+    @classmethod
+    def validator(cls, schema_path):
+        if schema_path not in cls._validators:
+            module = load_script_module(WORKFLOWS_PATH / 'validate-frontmatter.py')
+            cls._validators[schema_path] = module.FrontmatterValidator(schema_path)
+        return cls._validators[schema_path]
+
+    def visit(self, token, previous, ctx):
+        self.seen = True
+        ctx.frontmatter = token.info
+        schema_path = self.options['schema_path']
+        if schema_path and os.path.exists(schema_path):
+            _, errors = self.validator(schema_path).validate_frontmatter(token.info)
+            for error in errors:
+                ctx.report(self, token.line, error)
+
+    def finish(self, ctx):
+        if self.seen:
+            return
+        if ctx.content.startswith('---'):
+            if self.options['closed']:
+                ctx.report(self, 1, "Frontmatter is not closed")
+        elif self.options['required']:
+            ctx.report(self, 1, "No YAML frontmatter found")
+
+class TemplateCompliance(Rule):
+    """Required template sections (check-template-compliance.py)."""
+
+    rule_id = 'VV002'
+    aliases = ('template-compliance',)
+    kinds = (mt.HEADING,)
+    defaults = {'template_path': str(DEFAULT_TEMPLATE_PATH)}
+    _templates = {}
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.module = load_script_module(WORKFLOWS_PATH / 'check-template-compliance.py')
+        self.sections = self.template_sections(self.options['template_path'])
+        self.headings = []
+
+    @classmethod
+    def template_sections(cls, template_path):
+        if template_path not in cls._templates:
+            sections = []
+            if template_path and os.path.exists(template_path):
+                module = load_script_module(WORKFLOWS_PATH / 'check-template-compliance.py')
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    sections = module.extract_template_sections(f.read())
+            # (comparison prefix, section as written in the template for the message)
+            cls._templates[template_path] = [(section.lower().rstrip(':.?!'), section) for section in sections]
+        return cls._templates[template_path]
+
+    def visit(self, token, previous, ctx):
+        if token.level <= 3:
+            self.headings.append(token.info.lower())
+
+    def finish(self, ctx):
+        if self.module.EXCLUDED_MATCHER.match(ctx.file_path):
+            return
+        doc_type = self.module.extract_document_type(ctx.frontmatter)
+        if doc_type not in self.module.STRICT_CHECK_TYPES:
+            return
+        for prefix, section in self.sections:
+            if not any(heading.startswith(prefix) for heading in self.headings):
+                ctx.report(self, 1, f"Missing required section: {section}")
+
+RULES = [
+    HeadingIncrement, HeadingStyle, UlStyle, UlIndent, NoTrailingSpaces, NoHardTabs, NoReversedLinks,
+    NoMultipleBlanks, LineLength, CommandsShowOutput, NoMissingSpaceAtx, NoMultipleSpaceAtx,
+    BlanksAroundHeadings, HeadingStartLeft, NoDuplicateHeading, SingleTitle, NoTrailingPunctuation,
+    NoMultipleSpaceBlockquote, NoBlanksBlockquote, OlPrefix, ListMarkerSpace, BlanksAroundFences,
+    NoInlineHtml, NoBareUrls, HrStyle, NoSpaceInEmphasis, NoSpaceInCode, NoSpaceInLinks,
+    FencedCodeLanguage, NoEmptyLinks, ProperNames, NoAltText, CodeBlockStyle, SingleTrailingNewline,
+    CodeFenceStyle, EmphasisStyle, StrongStyle, LinkFragments, TablePipeStyle, TableColumnCount,
+    FrontMatter, TemplateCompliance,
+]
+
+# Checks that are not markdownlint rules are always on unless explicitly disabled
+REPOSITORY_CHECKS = (FrontMatter, TemplateCompliance)
+
+# ---------------------------------------------------------------------------
+# Configuration and visitor
+# ---------------------------------------------------------------------------
+
+def load_config(config_path, repository_checks=True):
+    """
+    Load a markdownlint config and return {rule class: options} for the enabled rules.
+
+    With repository_checks=False the frontmatter and template checks are left
+    out, for runs whose output is reported next to those checkers' own results.
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        # Repeated keys resolve to the last value, as they do for markdownlint
+        entries = json.load(f)
+
+    by_name = {}
+    for rule in RULES:
+        by_name[rule.rule_id.lower()] = rule
+        for alias in rule.aliases:
+            by_name[alias] = rule
+
+    default = True
+    settings = {}
+    for key, value in entries.items():
+        if key.lower() == 'default':
+            default = bool(value)
+            continue
+        rule = by_name.get(key.lower())
+        if rule is None:
+            logger.debug(f"Rule not implemented, skipping: {key}")
+            continue
+        settings[rule] = value
+
+    enabled = {}
+    for rule in RULES:
+        if rule in REPOSITORY_CHECKS and not repository_checks:
+            continue
+        value = settings.get(rule, default or rule in REPOSITORY_CHECKS)
+        if value is False:
+            continue
+        enabled[rule] = dict(value) if isinstance(value, dict) else {}
+    return enabled
+
+def file_fingerprint(path):
+    """Content hash of a file the checks depend on, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except OSError:
+        return None
+
+def config_fingerprint(enabled):
+    """
+    Stable hash of the effective configuration, used to invalidate cached results.
+
+    The rules' code and, for the repository checks, the schema, the template and
+    the workflow scripts they load are part of the hash as well.
+    """
+    config = {rule.rule_id: {**rule.defaults, **options} for rule, options in enabled.items()}
+    dependencies = {'linter': file_fingerprint(__file__), 'tokenizer': file_fingerprint(mt.__file__)}
+    if FrontMatter in enabled:
+        dependencies['schema'] = file_fingerprint(config[FrontMatter.rule_id]['schema_path'])
+        dependencies['validator'] = file_fingerprint(WORKFLOWS_PATH / 'validate-frontmatter.py')
+    if TemplateCompliance in enabled:
+        dependencies['template'] = file_fingerprint(config[TemplateCompliance.rule_id]['template_path'])
+        dependencies['compliance'] = file_fingerprint(WORKFLOWS_PATH / 'check-template-compliance.py')
+    payload = json.dumps({'rules': config, 'dependencies': dependencies}, sort_keys=True)
+    return content_hash(payload)
+
+def lint_content(file_path, content, enabled, tokens=None):
+    """Lint one document in a single visitor pass and return a list of issue dicts."""
+    if tokens is None:
+        tokens = mt.tokenize(content)
+    ctx = LintContext(file_path, content, tokens)
+
+    rules = [rule(options) for rule, options in enabled.items()]
+    dispatch = {}
+    catch_all = [rule for rule in rules if rule.kinds is None]
+    for rule in rules:
+        for kind in rule.kinds or ():
+            dispatch.setdefault(kind, []).append(rule)
+
+    previous = None
+    for token in tokens:
+        for rule in dispatch.get(token.kind, ()):
+            rule.visit(token, previous, ctx)
+        for rule in catch_all:
+            rule.visit(token, previous, ctx)
+        previous = token
+
+    for rule in rules:
+        rule.finish(ctx)
+
+    ctx.issues.sort(key=lambda issue: (issue['line'], issue['rule']))
+    return ctx.issues
+
+def load_cache(cache_path, fingerprint):
+    """Load cached lint results, discarding them if the configuration changed."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable lint cache {cache_path}: {str(e)}")
+        return {}
+    if cache.get('config') != fingerprint:
+        return {}
+    return cache.get('files', {})
+
+def save_cache(cache_path, fingerprint, files):
+    """Persist lint results keyed by file path and content hash."""
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'config': fingerprint, 'files': files}, f, separators=(',', ':'))
+
+def lint_docs(docs_path, config_path, cache_path=None, only_files=None, shard=None, repository_checks=True):
+    """
+    Lint all Markdown files under docs_path, or only those in only_files and in
+    shard (index, count). Only the files linted are reported; the cache keeps the
+    entries of other files, and drops those of files that no longer exist.
+
+    Returns a dict with 'issues' (list of issue dicts), 'files_checked' and 'files_cached'.
+    """
+    enabled = load_config(config_path, repository_checks)
+    fingerprint = config_fingerprint(enabled)
+    cache = load_cache(cache_path, fingerprint)
+    only = {f.replace(os.sep, '/') for f in only_files} if only_files else None
+
+    issues = []
+    files = dict(cache)
+    existing = set()
+    checked = cached = 0
+    for rel_path, full_path in iter_markdown_files(docs_path):
+        existing.add(rel_path)
+        if not in_shard(rel_path, shard) or (only is not None and rel_path not in only):
+            continue
+        try:
+            with open(full_path, 'rb') as f:
+                data = f.read()
+        except IOError as e:
+            logger.error(f"Error reading {rel_path}: {str(e)}")
+            continue
+
+        digest = content_hash(data)
+        entry = cache.get(rel_path)
+        if entry is None or entry['hash'] != digest:
+            entry = {'hash': digest,
+                     'issues': lint_content(rel_path, data.decode('utf-8', errors='replace'), enabled)}
+            checked += 1
+        else:
+            cached += 1
+        files[rel_path] = entry
+        issues.extend(entry['issues'])
+
+    if cache_path:
+        save_cache(cache_path, fingerprint, {path: entry for path, entry in files.items() if path in existing})
+
+    return {'issues': issues, 'files_checked': checked, 'files_cached': cached}
+
+def format_issue(issue):
+    """Format an issue like markdownlint-cli does."""
+    return f"{issue['file']}:{issue['line']} {issue['rule']}/{issue['alias']} {issue['message']}"
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Lint Markdown documentation with the markdownlint rule set.')
+    parser.add_argument('files', nargs='*', help='Only lint these files (relative to the docs path)')
+    parser.add_argument('--docs-path', default=DEFAULT_DOCS_PATH, help='Path to documentation directory')
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG_PATH), help='Path to markdownlint config')
+    parser.add_argument('--output', help='Write issues in markdownlint-cli text format to this file')
+    parser.add_argument('--json-output', help='Write structured results as JSON (mergeable shard result format)')
+    parser.add_argument('--cache', help='Cache file for incremental runs')
+    parser.add_argument('--no-repository-checks', action='store_true',
+                        help='Skip the frontmatter (VV001) and template (VV002) checks')
+    add_shard_argument(parser)
+    args = parser.parse_args()
+
+    docs_path = Path(args.docs_path)
+    if not docs_path.exists() or not docs_path.is_dir():
+        logger.error(f"Documentation directory not found: {docs_path}")
+        return 1
+
+    start = time.perf_counter()
+    result = lint_docs(docs_path, args.config, args.cache, args.files, args.shard,
+                       not args.no_repository_checks)
+    duration = time.perf_counter() - start
+    lines = [format_issue(issue) for issue in result['issues']]
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(''.join(line + '\n' for line in lines))
+    else:
+        for line in lines:
+            print(line)
+
+    if args.json_output:
+        write_shard_result(args.json_output, 'lint', result['issues'],
+                           result['files_checked'] + result['files_cached'], args.shard, duration)
+
+    logger.info(f"Linted {result['files_checked']} files ({result['files_cached']} unchanged, from cache); "
+                f"{len(result['issues'])} issues found")
+    return 1 if result['issues'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+
+"""
+Line-oriented Markdown tokenizer shared by the documentation tools
+
+The tokenizer makes a single pass over a document and classifies every line
+(frontmatter, headings, fenced and indented code, lists, block quotes, tables,
+thematic breaks, HTML and paragraph text). It tracks fence state so that
+consumers never mistake the contents of a code block for document structure.
+
+iter_links() scans the prose lines of a token list once more, left to right,
+for inline links, images and reference links (resolved through the document's
+link reference definitions). Link destinations may contain balanced
+parentheses or be wrapped in <...>; code spans and backslash escapes are
+honoured. Every link carries its span and the span of its destination, so
+tools can rewrite targets in place. Links are expected on a single line.
+iter_code_spans() yields the inline code spans of the prose lines the same way.
+
+Usage:
+    from markdown_tokens import tokenize, iter_links
+    tokens = tokenize(content)
+    for token in tokens:
+        ...
+    for link in iter_links(tokens):
+        ...
+"""
+
+import re
+
+# Token kinds
+FRONTMATTER = 'frontmatter'
+BLANK = 'blank'
+HEADING = 'heading'
+SETEXT_UNDERLINE = 'setext_underline'
+FENCE_OPEN = 'fence_open'
+FENCE_CLOSE = 'fence_close'
+CODE = 'code'
+INDENTED_CODE = 'indented_code'
+LIST_ITEM = 'list_item'
+BLOCKQUOTE = 'blockquote'
+TABLE = 'table'
+HR = 'hr'
+HTML = 'html'
+TEXT = 'text'
+
+# Link kinds
+INLINE_LINK = 'inline'
+IMAGE = 'image'
+REFERENCE_LINK = 'reference'
+LINK_DEFINITION = 'definition'
+
+# Block-level patterns
+FENCE_PATTERN = re.compile(r'^( {0,3})(`{3,}|~{3,})\s*(.*?)\s*$')
+ATX_HEADING_PATTERN = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?[ \t]*$')
+ATX_CLOSING_PATTERN = re.compile(r'(?:^|[ \t]+)#+$')
+SETEXT_PATTERN = re.compile(r'^ {0,3}(=+|-+)[ \t]*$')
+HR_PATTERN = re.compile(r'^ {0,3}(?:(?:-[ \t]*){3,}|(?:\*[ \t]*){3,}|(?:_[ \t]*){3,})$')
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|\d{1,9}[.)])(\s+|$)')
+BLOCKQUOTE_PATTERN = re.compile(r'^ {0,3}>')
+TABLE_DELIMITER_PATTERN = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+HTML_BLOCK_PATTERN = re.compile(r'^ {0,3}</?[A-Za-z][A-Za-z0-9-]*(\s|/?>|$)|^ {0,3}<!--')
+LINK_DEFINITION_PATTERN = re.compile(
+    r'^ {0,3}\[((?:[^\]\\]|\\.)+)\]:[ \t]*(?:<([^>]*)>|(\S+))(?:[ \t]+(?:"[^"]*"|\'[^\']*\'|\([^)]*\)))?[ \t]*$')
+LINK_TITLE_PATTERN = re.compile(r'[ \t]*(?:"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|\((?:[^()\\]|\\.)*\))?[ \t]*\)')
+
+# Lines that never contain links
+NON_PROSE_KINDS = (FRONTMATTER, BLANK, FENCE_OPEN, FENCE_CLOSE, CODE, INDENTED_CODE, SETEXT_UNDERLINE, HR)
+
+class Token:
+    """A single classified line of a Markdown document."""
+
+    __slots__ = ('kind', 'line', 'offset', 'text', 'level', 'info')
+
+    def __init__(self, kind, line, offset, text, level=0, info=''):
+        self.kind = kind      # one of the token kind constants above
+        self.line = line      # 1-based line number
+        self.offset = offset  # character offset of the line start
+        self.text = text      # raw line without the line terminator
+        self.level = level    # heading level, fence length or list indent
+        self.info = info      # heading title, fence info string, list marker or frontmatter body
+
+    def __repr__(self):
+        return f"Token({self.kind!r}, line={self.line}, level={self.level}, info={self.info!r})"
+
+class Link:
+    """An inline link, image, reference link or link reference definition."""
+
+    __slots__ = ('kind', 'text', 'url', 'line', 'start', 'end', 'url_start', 'url_end')
+
+    def __init__(self, kind, text, url, line, start, end, url_start=-1, url_end=-1):
+        self.kind = kind            # one of the link kind constants above
+        self.text = text            # link text, image alt text or definition label
+        self.url = url              # destination (resolved through the definition for reference links)
+        self.line = line            # 1-based line number
+        self.start = start          # character offset of the whole link in the document
+        self.end = end
+        self.url_start = url_start  # character span of the destination; -1 for reference links,
+        self.url_end = url_end      # whose destination lives in the definition
+
+    def __repr__(self):
+        return f"Link({self.kind!r}, {self.text!r}, {self.url!r}, line={self.line})"
+
+def normalize_label(label):
+    """Case-fold and collapse whitespace in a link label, as CommonMark matches labels."""
+    return ' '.join(label.split()).casefold()
+
+def _code_span_end(text, i):
+    """If a code span starts at i, return the index after its closing backticks, else -1."""
+    run = i
+    while run < len(text) and text[run] == '`':
+        run += 1
+    length = run - i
+    while True:
+        close = text.find('`' * length, run)
+        if close == -1:
+            return -1
+        after = close + length
+        if after >= len(text) or text[after] != '`':
+            return after
+        while after < len(text) and text[after] == '`':
+            after += 1
+        run = after
+
+def _parse_destination(text, i):
+    """
+    Parse '(destination "title")' starting at the '(' at index i.
+
+    Returns (url, url_start, url_end, end) with indexes into text, or None.
+    """
+    j = i + 1
+    length = len(text)
+    while j < length and text[j] in ' \t':
+        j += 1
+    if j < length and text[j] == '<':
+        close = text.find('>', j + 1)
+        if close == -1:
+            return None
+        url_start, url_end = j + 1, close
+        j = close + 1
+    else:
+        url_start = j
+        depth = 0
+        while j < length:
+            char = text[j]
+            if char == '\\' and j + 1 < length:
+                j += 2
+                continue
+            if char in ' \t':
+                break
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                if depth == 0:
+                    break
+                depth -= 1
+            j += 1
+        if depth:
+            return None
+        url_end = j
+    match = LINK_TITLE_PATTERN.match(text, j)
+    if not match:
+        return None
+    return text[url_start:url_end], url_start, url_end, match.end()
+
+def scan_inline_links(text, definitions=None):
+    """
+    Yield (kind, text, url, start, end, url_start, url_end) for the links in one line.
+
+    Offsets are relative to the line. A single left-to-right pass with a stack of
+    open brackets; as in CommonMark, links cannot contain other links (images can).
+    """
+    definitions = definitions or {}
+    openers = []  # (index, is_image)
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '`':
+            end = _code_span_end(text, i)
+            if end != -1:
+                i = end
+                continue
+            while i < length and text[i] == '`':
+                i += 1
+            continue
+        if char == '!' and i + 1 < length and text[i + 1] == '[':
+            openers.append((i, True))
+            i += 2
+            continue
+        if char == '[':
+            openers.append((i, False))
+            i += 1
+            continue
+        if char != ']' or not openers:
+            i += 1
+            continue
+
+        start, image = openers.pop()
+        label = text[start + (2 if image else 1):i]
+        kind = IMAGE if image else INLINE_LINK
+        after = i + 1
+        link = None
+        if after < length and text[after] == '(':
+            parsed = _parse_destination(text, after)
+            if parsed:
+                url, url_start, url_end, end = parsed
+                link = (kind, label, url, start, end, url_start, url_end)
+        if link is None and definitions:
+            end = after
+            reference = label
+            if after < length and text[after] == '[':
+                close = text.find(']', after + 1)
+                if close != -1:
+                    reference = text[after + 1:close] or label
+                    end = close + 1
+            elif after < length and text[after] in '(:':
+                reference = None  # failed inline link or a definition, not a shortcut reference
+            url = definitions.get(normalize_label(reference)) if reference else None
+            if url is not None:
+                link = (IMAGE if image else REFERENCE_LINK, label, url, start, end, -1, -1)
+        if link is None:
+            i += 1
+            continue
+        yield link
+        if not image:
+            openers = [opener for opener in openers if opener[1]]
+        i = link[4]
+
+def link_definitions(tokens):
+    """Return {normalized label: destination} for the link reference definitions in tokens."""
+    definitions = {}
+    for token in tokens:
+        if token.kind in NON_PROSE_KINDS:
+            continue
+        match = LINK_DEFINITION_PATTERN.match(token.text)
+        if match:
+            # The first definition of a label wins
+            definitions.setdefault(normalize_label(match.group(1)), match.group(2) or match.group(3) or '')
+    return definitions
+
+def iter_links(tokens, include_definitions=False):
+    """
+    Yield Link objects for every link in the prose of a tokenized document.
+
+    Reference links resolve through the document's definitions; the definitions
+    themselves are only yielded with include_definitions (for tools that rewrite
+    destinations in place).
+    """
+    definitions = link_definitions(tokens)
+    for token in tokens:
+        if token.kind in NON_PROSE_KINDS:
+            continue
+        match = LINK_DEFINITION_PATTERN.match(token.text)
+        if match:
+            if include_definitions:
+                group = 2 if match.group(2) is not None else 3
+                yield Link(LINK_DEFINITION, match.group(1), match.group(group), token.line,
+                           token.offset, token.offset + len(token.text),
+                           token.offset + match.start(group), token.offset + match.end(group))
+            continue
+        if '[' not in token.text:
+            continue
+        offset = token.offset
+        for kind, label, url, start, end, url_start, url_end in scan_inline_links(token.text, definitions):
+            yield Link(kind, label, url, token.line, offset + start, offset + end,
+                       offset + url_start if url_start >= 0 else -1, offset + url_end if url_end >= 0 else -1)
+
+def iter_code_spans(tokens):
+    """Yield (line number, code) for every inline code span in the prose of a tokenized document."""
+    for token in tokens:
+        if token.kind in NON_PROSE_KINDS or '`' not in token.text:
+            continue
+        text = token.text
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char == '\\':
+                i += 2
+                continue
+            if char != '`':
+                i += 1
+                continue
+            end = _code_span_end(text, i)
+            run = i
+            while run < len(text) and text[run] == '`':
+                run += 1
+            if end == -1:
+                i = run
+                continue
+            code = text[run:end - (run - i)]
+            # As in CommonMark, one leading and trailing space are stripped from padded spans
+            if len(code) > 2 and code[0] == ' ' and code[-1] == ' ' and code.strip():
+                code = code[1:-1]
+            yield token.line, code
+            i = end
+
+def strip_links(text):
+    """Replace inline links and images by their text, as they render in a heading."""
+    if '[' not in text:
+        return text
+    parts = []
+    position = 0
+    for _, label, _, start, end, _, _ in scan_inline_links(text):
+        parts.append(text[position:start])
+        parts.append(label)
+        position = end
+    parts.append(text[position:])
+    return ''.join(parts)
+
+def heading_anchor(title):
+    """Generate the anchor ID for a heading (similar to how GitHub does it)."""
+    anchor = strip_links(title).strip().lower()
+    anchor = re.sub(r'[^\w\s-]', '', anchor)  # Remove non-word chars
+    anchor = re.sub(r'\s', '-', anchor)       # Each space becomes a hyphen ("a & b" -> "a--b")
+    return anchor
+
+def split_lines(content):
+    """Yield (line number, offset, text) for each line, without line terminators."""
+    offset = 0
+    for number, raw in enumerate(content.split('\n'), start=1):
+        yield number, offset, raw[:-1] if raw.endswith('\r') else raw
+        offset += len(raw) + 1
+
+def _frontmatter_end(lines):
+    """Return the index of the closing frontmatter delimiter, or -1 when unclosed."""
+    for index in range(1, len(lines)):
+        if lines[index][2].rstrip() == '---':
+            return index
+    return -1
+
+def tokenize(content):
+    """Tokenize Markdown content into a list of Token objects, one per line."""
+    lines = list(split_lines(content))
+    if lines and lines[-1][2] == '' and content.endswith('\n'):
+        lines.pop()  # the terminating newline does not start a new line
+
+    tokens = []
+    start = 0
+
+    # Frontmatter is only recognised at the very start of the document
+    if lines and lines[0][2].rstrip() == '---':
+        end = _frontmatter_end(lines)
+        if end > 0:
+            body = '\n'.join(text for _, _, text in lines[1:end])
+            tokens.append(Token(FRONTMATTER, 1, 0, '---', level=lines[end][0], info=body))
+            start = end + 1
+
+    fence_char = None
+    fence_length = 0
+    in_list = False
+    in_table = False
+
+    for number, offset, text in lines[start:]:
+        previous = tokens[-1] if tokens else None
+
+        # Inside a fenced code block only the closing fence is significant
+        if fence_char:
+            match = FENCE_PATTERN.match(text)
+            if (match and match.group(2)[0] == fence_char and len(match.group(2)) >= fence_length
+                    and not match.group(3)):
+                tokens.append(Token(FENCE_CLOSE, number, offset, text, level=len(match.group(2))))
+                fence_char = None
+            else:
+                tokens.append(Token(CODE, number, offset, text))
+            continue
+
+        if not text.strip():
+            tokens.append(Token(BLANK, number, offset, text))
+            in_table = False
+            continue
+
+        match = FENCE_PATTERN.match(text)
+        if match and not (match.group(2)[0] == '`' and '`' in match.group(3)):
+            fence_char = match.group(2)[0]
+            fence_length = len(match.group(2))
+            tokens.append(Token(FENCE_OPEN, number, offset, text, level=fence_length, info=match.group(3)))
+            continue
+
+        indent = len(text) - len(text.lstrip(' '))
+        if (indent >= 4 and not in_list and previous is not None
+                and previous.kind in (BLANK, INDENTED_CODE)):
+            tokens.append(Token(INDENTED_CODE, number, offset, text))
+            continue
+
+        match = ATX_HEADING_PATTERN.match(text)
+        if match:
+            title = ATX_CLOSING_PATTERN.sub('', match.group(2) or '').strip()
+            tokens.append(Token(HEADING, number, offset, text, level=len(match.group(1)), info=title))
+            in_list = False
+            continue
+
+        match = SETEXT_PATTERN.match(text)
+        if match and previous is not None and previous.kind == TEXT:
+            previous.kind = HEADING
+            previous.level = 1 if match.group(1)[0] == '=' else 2
+            previous.info = previous.text.strip()
+            tokens.append(Token(SETEXT_UNDERLINE, number, offset, text, level=previous.level))
+            continue
+
+        if HR_PATTERN.match(text):
+            tokens.append(Token(HR, number, offset, text))
+            in_list = False
+            continue
+
+        match = LIST_ITEM_PATTERN.match(text)
+        if match:
+            tokens.append(Token(LIST_ITEM, number, offset, text, level=len(match.group(1)),
+                                info=match.group(2)))
+            in_list = True
+            continue
+
+        if BLOCKQUOTE_PATTERN.match(text):
+            tokens.append(Token(BLOCKQUOTE, number, offset, text))
+            continue
+
+        if in_table and '|' in text:
+            tokens.append(Token(TABLE, number, offset, text))
+            continue
+
+        if (TABLE_DELIMITER_PATTERN.match(text) and '-' in text and previous is not None
+                and previous.kind == TEXT and '|' in previous.text):
+            previous.kind = TABLE
+            tokens.append(Token(TABLE, number, offset, text, level=1))
+            in_table = True
+            continue
+
+        if HTML_BLOCK_PATTERN.match(text):
+            tokens.append(Token(HTML, number, offset, text))
+            continue
+
+        if indent == 0 and previous is not None and previous.kind == BLANK:
+            in_list = False
+        tokens.append(Token(TEXT, number, offset, text))
+
+    return tokens
+
+def heading_style(token):
+    """Return 'atx', 'atx_closed' or 'setext' for a heading token."""
+    if not token.text.lstrip().startswith('#'):
+        return 'setext'
+    rest = ATX_HEADING_PATTERN.match(token.text).group(2) or ''
+    return 'atx_closed' if ATX_CLOSING_PATTERN.search(rest) else 'atx'
+
+def iter_headings(tokens):
+    """Yield (level, title, line) for every heading token."""
+    for token in tokens:
+        if token.kind == HEADING:
+            yield token.level, token.info, token.line